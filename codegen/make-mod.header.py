@@ -5,14 +5,64 @@
 # IN THE CODEGEN DIRECTORY, AND RE-GEN  #
 #########################################
 
+import copy
+import functools
 import typing
-from .line import Line
+from .line import Line, LineParser, LineTemplate, check_middle, fused_stack, intern_commands
 
 #
 # This file has been generated from the Earendil IRC Protocol Specification,
 # version {major-version}.{minor-version}
 #
 
+class Source(str):
+    """
+    A decoded message source. Like the Prefix it comes from, it splits into
+    ``nick``, ``user`` and ``host`` the first time any of them is asked for.
+    Sources decoded from the wire come from ``decode_source``, so every
+    message from the same prefix shares one Source and one split.
+    """
+
+    @functools.cached_property
+    def _parts(self) -> typing.Tuple[str, typing.Optional[str], typing.Optional[str]]:
+        nick, at, host = self.partition('@')
+        nick, bang, user = nick.partition('!')
+        return str(nick), str(user) if bang else None, str(host) if at else None
+
+    @property
+    def nick(self) -> str:
+        return self._parts[0]
+
+    @property
+    def user(self) -> typing.Optional[str]:
+        return self._parts[1]
+
+    @property
+    def host(self) -> typing.Optional[str]:
+        return self._parts[2]
+
+# the default decode everywhere in this module; sources it decodes are
+# cached on their bytes alone, whichever entry point they came through
+def decode_utf8(b: bytes) -> str:
+    return b.decode('utf-8')
+
+@functools.lru_cache(maxsize=4096)
+def _decode_utf8_source(source: bytes) -> Source:
+    return Source(source.decode('utf-8'))
+
+@functools.lru_cache(maxsize=4096)
+def _decode_source(source: bytes, decode: typing.Callable[[bytes], str]) -> Source:
+    return Source(decode(source))
+
+def decode_source(source: bytes, decode: typing.Callable[[bytes], str] = decode_utf8) -> Source:
+    if decode is decode_utf8:
+        return _decode_utf8_source(source)
+    try:
+        hash(decode)
+    except TypeError:
+        return Source(decode(source))
+    return _decode_source(source, decode)
+
 class Message:
     __slots__ = ['source']
 
@@ -20,19 +70,107 @@ class Message:
         raise NotImplementedError('Message.to_line')
 
     def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode('utf-8')) -> bytes:
-        return self.to_line().to_raw()
+        return self.to_line(encode).to_raw()
 
+    def template(self, field: str, encode: typing.Callable[[str], bytes] = lambda s: s.encode('utf-8')) -> 'MessageTemplate':
+        return MessageTemplate(self, field, encode)
+
+    # with lazy=True, the result is one of the Lazy* classes, and any
+    # decoding errors are raised when the bad field is first read
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode('utf-8')) -> 'Message':
-        global from_lines_by_verb
-        try:
-            return from_lines_by_verb[line.command](line, decode)
-        except Exception:
-            return Unknown.from_line(line, decode)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8, lazy: bool = False) -> 'Message':
+        global from_lines_by_verb, lazy_from_lines_by_verb
+        parse = (lazy_from_lines_by_verb if lazy else from_lines_by_verb).get(line.command)
+        if parse is not None:
+            # a wrong verb or argument count comes back as None; only
+            # failures to decode an argument raise
+            try:
+                msg = parse(line, decode)
+            except Exception:
+                msg = None
+            if msg is not None:
+                return msg
+        return Unknown.from_line(line, decode)
 
     @classmethod
-    def from_raw(cls, line: bytes, decode: typing.Callable[[bytes], str] = lambda b: b.decode('utf-8')) -> 'Message':
-        return cls.from_line(Line.from_raw(line), decode)
+    def from_raw(cls, line: bytes, decode: typing.Callable[[bytes], str] = decode_utf8, lazy: bool = False) -> 'Message':
+        return cls.from_line(Line.from_raw(line), decode, lazy)
+
+class LazyField:
+    """
+    A slot of a generated message class, as seen from its Lazy* variant.
+    The slot holds the raw argument bytes until the first read, which
+    parses them with ``parse(decode, raw)`` and stores the result in their
+    place. (No parsed value is ever bytes.)
+    """
+
+    __slots__ = ['slot', 'parse']
+
+    def __init__(self, slot: typing.Any, parse: typing.Callable[[typing.Callable[[bytes], str], bytes], typing.Any]) -> None:
+        self.slot = slot
+        self.parse = parse
+
+    def __get__(self, obj: typing.Any, cls: typing.Optional[type] = None) -> typing.Any:
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, cls)
+        if isinstance(value, bytes):
+            value = self.parse(obj._decode, value)
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj: typing.Any, value: typing.Any) -> None:
+        self.slot.__set__(obj, value)
+
+    # the field's value, or its raw bytes if they fail to decode
+    def peek(self, obj: typing.Any) -> typing.Any:
+        try:
+            return self.__get__(obj)
+        except ValueError:
+            return self.slot.__get__(obj)
+
+lazy_source = LazyField(Message.source, lambda decode, b: decode_source(b, decode))
+
+# the tail of the generated to_raw methods: place the arguments whose
+# position depended on which optional arguments were present, then quote
+# and terminate the line the same way Line.to_raw would
+def finish_raw(pieces: typing.List[bytes], rest: typing.Sequence[bytes] = ()) -> bytes:
+    if rest:
+        n = len(rest) - 1
+        for i in range(n):
+            check_middle(rest[i])
+            pieces += (b' ', rest[i])
+        last = rest[n]
+        pieces += (b' :' if not last or 32 in last or 9 in last else b' ', last)
+    s = b''.join(pieces)
+    if fused_stack.special.search(s) is not None:
+        s = fused_stack.quote(s)
+    return s + b'\r\n'
+
+class MessageTemplate:
+    """
+    A message serialised once with one string field left open, for sending
+    the same message to many targets. ``render(value)`` returns the wire
+    bytes with ``value`` in place of that field.
+    """
+
+    def __init__(self, message: Message, field: str, encode: typing.Callable[[str], bytes] = lambda s: s.encode('utf-8')) -> None:
+        message = copy.copy(message)
+        placeholder = 'placeholder'
+        while True:
+            setattr(message, field, placeholder)
+            line = message.to_line(encode)
+            indices = [i for i, arg in enumerate(line.arguments) if arg == encode(placeholder)]
+            if len(indices) < 2:
+                break
+            placeholder += '_'
+        if not indices:
+            raise ValueError('{{}} is not a single string argument'.format(field))
+        self.template = LineTemplate(line, indices[0])
+        self.encode = encode
+
+    def render(self, value: str) -> bytes:
+        return self.template.render(self.encode(value))
 
 class Unknown(Message):
     __slots__ = ['command', 'arguments']
@@ -49,11 +187,11 @@ class Unknown(Message):
         return Line(source, self.command, self.arguments)
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode('utf-8')) -> Message:
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
         source = None
         if line.source is not None:
             try:
-                source = decode(line.source)
+                source = decode_source(line.source, decode)
             except Exception:
                 pass
         return cls(source, line.command, line.arguments)
@@ -61,6 +199,35 @@ class Unknown(Message):
     def __repr__(self) -> str:
         return "Unknown(source={{}}, command={{}}, arguments={{}})".format(repr(self.source), repr(self.command), repr(self.arguments))
 
+BAD_ARGUMENT_COUNT = 'bad-argument-count'
+DECODE_FAILED = 'decode-failed'
+
+# LineParser, one layer up: try_parse returns either a Message or an error
+# code (the LineParser ones, BAD_ARGUMENT_COUNT or DECODE_FAILED), and never
+# raises. Unrecognised verbs are not an error, and come back as Unknown.
+class MessageParser(LineParser):
+    def __init__(self, profile: str = 'rfc1459-ctcp', decode: typing.Callable[[bytes], str] = decode_utf8) -> None:
+        super().__init__(profile)
+        self.decode = decode
+
+    def try_parse(self, line: bytes) -> typing.Union[Message, str]: # type: ignore
+        global from_lines_by_verb
+        parsed = super().try_parse(line)
+        if isinstance(parsed, str):
+            return parsed
+        parse = from_lines_by_verb.get(parsed.command)
+        if parse is None:
+            return Unknown.from_line(parsed, self.decode)
+        try:
+            msg = parse(parsed, self.decode)
+        except Exception:
+            self.errors[DECODE_FAILED] += 1
+            return DECODE_FAILED
+        if msg is None:
+            self.errors[BAD_ARGUMENT_COUNT] += 1
+            return BAD_ARGUMENT_COUNT
+        return msg
+
 #
 # make-mod.header.py above ^
 # make-mod.py generated code below v
@@ -68,7 +68,7 @@ def write_docstring(ind, msg):
     ind.writeln('')
 
 def maketype(arg):
-    if arg['type'] == 'str':
+    if arg['type'] in ('str', 'channel'):
         return 'str'
     elif arg['type'] == 'int':
         return 'int'
@@ -84,7 +84,7 @@ def maketype(arg):
         raise RuntimeError('unknown type: {}'.format(arg['type']))
 
 def parse_arg(src, arg):
-    if arg['type'] == 'str':
+    if arg['type'] in ('str', 'channel'):
         return 'decode({})'.format(src)
     elif arg['type'] == 'int':
         return 'int({})'.format(src)
@@ -100,7 +100,7 @@ def parse_arg(src, arg):
         raise RuntimeError('unknown type: {}'.format(arg['type']))
 
 def unparse_arg(src, arg):
-    if arg['type'] == 'str':
+    if arg['type'] in ('str', 'channel'):
         return 'encode({})'.format(src)
     elif arg['type'] == 'int':
         return 'encode(str({}))'.format(src)
@@ -115,13 +115,164 @@ def unparse_arg(src, arg):
     else:
         raise RuntimeError('unknown type: {}'.format(arg['type']))
 
-def parse_arg_to(ind, src, arg):
+# only arguments that need decoding are left for LazyField; ints are
+# cheap, and parsing them up front means a bad one still makes the whole
+# line Unknown, just as it does for the eager classes
+def is_lazy(arg):
+    return 'name' in arg and 'decode(' in parse_arg('b', arg)
+
+def parse_arg_to(ind, src, arg, lazy=False):
     if 'name' in arg:
-        ind.writeln('{} = {}', arg['name'], parse_arg(src, arg))
+        if lazy and is_lazy(arg):
+            # left as bytes, for LazyField to parse on first read
+            ind.writeln('{} = {}', arg['name'], src)
+        else:
+            ind.writeln('{} = {}', arg['name'], parse_arg(src, arg))
     else:
         assert arg['type'] == 'literal'
         ind.writeln('# {}: {}', src, repr(arg['type-argument']))
 
+def write_from_line(ind, msg, lazy=False):
+    ind.writeln('@classmethod')
+    ind.writeln('def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:')
+    with ind.indent():
+        # figure out the min and max number of args
+        min_args = 0
+        max_args = 0
+        for arg in msg['arguments']:
+            max_args += 1
+            if arg['type'] != 'optional':
+                min_args += 1
+        arg_cmp = '{} <= len(line.arguments) <= {}'.format(min_args, max_args)
+        if min_args == 0:
+            arg_cmp = 'len(line.arguments) <= {}'.format(max_args)
+        if min_args == max_args:
+            arg_cmp = 'len(line.arguments) == {}'.format(min_args)
+        verb = 'b{}'.format(repr(msg['verb']))
+        if isinstance(msg['verb'], int):
+            verb = '{}'.format(msg['verb'])
+        ind.writeln('if line.command != {}:', verb)
+        with ind.indent():
+            ind.writeln('return None')
+        ind.writeln('if not ({}):', arg_cmp)
+        with ind.indent():
+            ind.writeln('return None')
+        if lazy:
+            ind.writeln('source = line.source')
+        else:
+            ind.writeln('source = None')
+            ind.writeln('if line.source is not None:')
+            with ind.indent():
+                ind.writeln('source = decode_source(line.source, decode)')
+        if msg['arguments']:
+            advancer = 'i += 1'
+            done = 'i == len(line.arguments)'
+            if msg['associativity'] == 'right':
+                ind.writeln('i = len(line.arguments) - 1')
+                advancer = 'i -= 1'
+                done = 'i == -1'
+            else:
+                ind.writeln('i = 0')
+        for arg in msg['arguments']:
+            if arg['type'] == 'optional':
+                ind.writeln('if len(line.arguments) > {}:', min_args)
+                min_args += 1
+                with ind.indent():
+                    parse_arg_to(ind, 'line.arguments[i]', arg, lazy)
+                    ind.writeln(advancer)
+                if 'name' in arg:
+                    ind.writeln('else:')
+                    with ind.indent():
+                        defval = 'None'
+                        if arg['inner']['type'] == 'flag':
+                            defval = 'False'
+                        ind.writeln('{} = {}', arg['name'], defval)
+            else:
+                parse_arg_to(ind, 'line.arguments[i]', arg, lazy)
+                ind.writeln(advancer)
+        if msg['arguments']:
+            ind.writeln('if {}:', done.replace('==', '!='))
+            with ind.indent():
+                ind.writeln('return None')
+        constrargs = 'source=source'
+        for arg in msg['arguments']:
+            if 'name' in arg:
+                constrargs += ', {0}={0}'.format(arg['name'])
+        if lazy:
+            ind.writeln('msg = cls({})', constrargs)
+            ind.writeln('msg._decode = decode')
+            ind.writeln('return msg')
+        else:
+            ind.writeln('return cls({})', constrargs)
+
+def needs_check(arg):
+    # ints and flags can never hold whitespace (and plain literals are
+    # handled before this is asked)
+    if arg['type'] == 'optional':
+        return needs_check(arg['inner'])
+    return arg['type'] in ('str', 'channel', 'comma-list', 'space-list', 'literal')
+
+def write_to_raw(ind, msg):
+    ind.writeln('def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:')
+    with ind.indent():
+        verb = 'b{}'.format(repr(msg['verb']))
+        if isinstance(msg['verb'], int):
+            verb = 'b"{:03d}"'.format(msg['verb'])
+        ind.writeln('pieces = []')
+        ind.writeln('if self.source is not None:')
+        with ind.indent():
+            ind.writeln('source = encode(self.source)')
+            ind.writeln('if source:')
+            with ind.indent():
+                ind.writeln("pieces += (b':', source, b' ')")
+        ind.writeln('pieces.append({})', verb)
+
+        # arguments before the last required one are always middle
+        # arguments, and if nothing optional follows that one it is always
+        # last; anything else goes in rest, to be sorted out at runtime
+        required = [i for i, arg in enumerate(msg['arguments']) if arg['type'] != 'optional']
+        last = required[-1] if required else -1
+        rest = last if last != len(msg['arguments']) - 1 else len(msg['arguments'])
+        if rest < len(msg['arguments']):
+            ind.writeln('rest = []')
+        for i, arg in enumerate(msg['arguments']):
+            if 'name' in arg:
+                value = unparse_arg('self.' + arg['name'], arg)
+            else:
+                assert arg['type'] == 'literal'
+                value = 'b{}'.format(repr(arg['type-argument']))
+                literal = arg['type-argument']
+                plain = literal and ' ' not in literal and '\t' not in literal
+                if i == last and i < rest:
+                    ind.writeln('pieces.append(b{})', repr((' ' if plain else ' :') + literal))
+                    continue
+                if i < rest and plain:
+                    ind.writeln('pieces.append(b{})', repr(' ' + literal))
+                    continue
+            if arg['type'] == 'optional':
+                ind.writeln('if self.{} is not None:', arg['name'])
+                ind.level += 1
+            if i >= rest:
+                ind.writeln('rest.append({})', value)
+            elif i == last:
+                if needs_check(arg):
+                    ind.writeln('arg = {}', value)
+                    ind.writeln("pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)")
+                else:
+                    ind.writeln("pieces += (b' ', {})", value)
+            elif needs_check(arg):
+                ind.writeln('arg = {}', value)
+                ind.writeln('check_middle(arg)')
+                ind.writeln("pieces += (b' ', arg)")
+            else:
+                ind.writeln("pieces += (b' ', {})", value)
+            if arg['type'] == 'optional':
+                ind.level -= 1
+        if rest < len(msg['arguments']):
+            ind.writeln('return finish_raw(pieces, rest)')
+        else:
+            ind.writeln('return finish_raw(pieces)')
+
 def data_to_module(data, f):
     with open(os.path.join(os.path.split(__file__)[0], 'make-mod.header.py')) as j:
         header = j.read()
@@ -170,65 +321,17 @@ def data_to_module(data, f):
 
             # from_line
             ind.writeln('@classmethod')
-            ind.writeln('def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:')
+            ind.writeln('def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:')
             with ind.indent():
-                ind.writeln('source = None')
-                ind.writeln('if line.source is not None:')
-                with ind.indent():
-                    ind.writeln('source = decode(line.source)')
-                # figure out the min and max number of args
-                min_args = 0
-                max_args = 0
-                for arg in msg['arguments']:
-                    max_args += 1
-                    if arg['type'] != 'optional':
-                        min_args += 1
-                arg_cmp = '{} <= len(line.arguments) <= {}'.format(min_args, max_args)
-                if min_args == 0:
-                    arg_cmp = 'len(line.arguments) <= {}'.format(max_args)
-                if min_args == max_args:
-                    arg_cmp = 'len(line.arguments) == {}'.format(min_args)
-                verb = 'b{}'.format(repr(msg['verb']))
-                if isinstance(msg['verb'], int):
-                    verb = '{}'.format(msg['verb'])
-                ind.writeln('if line.command != {}:', verb)
+                ind.writeln('msg = cls._from_line(line, decode)')
+                ind.writeln('if msg is None:')
                 with ind.indent():
-                    ind.writeln('raise ValueError("incorrect verb")')
-                ind.writeln('if not ({}):', arg_cmp)
-                with ind.indent():
-                    ind.writeln('raise ValueError("wrong number of arguments")')
-                if msg['arguments']:
-                    advancer = 'i += 1'
-                    done = 'i == len(line.arguments)'
-                    if msg['associativity'] == 'right':
-                        ind.writeln('i = len(line.arguments) - 1')
-                        advancer = 'i -= 1'
-                        done = 'i == -1'
-                    else:
-                        ind.writeln('i = 0')
-                for arg in msg['arguments']:
-                    if arg['type'] == 'optional':
-                        ind.writeln('if len(line.arguments) > {}:', min_args)
-                        min_args += 1
-                        with ind.indent():
-                            parse_arg_to(ind, 'line.arguments[i]', arg)
-                            ind.writeln(advancer)
-                        if 'name' in arg:
-                            ind.writeln('else:')
-                            with ind.indent():
-                                defval = 'None'
-                                if arg['inner']['type'] == 'flag':
-                                    defval = 'False'
-                                ind.writeln('{} = {}', arg['name'], defval)
-                    else:
-                        parse_arg_to(ind, 'line.arguments[i]', arg)
-                        ind.writeln(advancer)
-                if msg['arguments']:
-                    ind.writeln('assert {}', done)
-                constrargs = 'source=source'
-                for arg in namedargs:
-                    constrargs += ', {0}={0}'.format(arg['name'])
-                ind.writeln('return cls({})', constrargs)
+                    ind.writeln('raise ValueError("incorrect verb or number of arguments")')
+                ind.writeln('return msg')
+
+            # _from_line, which returns None rather than raising on a
+            # mismatched verb or argument count
+            write_from_line(ind, msg)
 
             # to_line
             ind.writeln('def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:')
@@ -258,6 +361,41 @@ def data_to_module(data, f):
                 else:
                     ind.writeln('return Line(source, {})', verb)
 
+            # to_raw
+            write_to_raw(ind, msg)
+
+    # lazy variants, holding the raw arguments until each field is read
+    for msg in data['messages']:
+        ind.writeln('class Lazy{0}({0}):', msg['clsname'])
+        with ind.indent():
+            ind.writeln('"""')
+            ind.writeln('``{}``, with each field decoded the first time it is read', msg['clsname'])
+            ind.writeln('"""')
+            ind.writeln('')
+            ind.writeln("__slots__ = ['_decode']")
+            ind.writeln('source = lazy_source')
+            for arg in msg['arguments']:
+                if is_lazy(arg):
+                    ind.writeln('{0} = LazyField({1}.{0}, lambda decode, b: {2})', arg['name'], msg['clsname'], parse_arg('b', arg))
+            ind.writeln('')
+
+            # repr, showing the raw bytes of any field that fails to decode
+            ind.writeln('def __repr__(self) -> str:')
+            with ind.indent():
+                fmt = msg['clsname'] + '(source={}'
+                args = 'repr(lazy_source.peek(self))'
+                for arg in msg['arguments']:
+                    if 'name' not in arg:
+                        continue
+                    fmt += ', ' + arg['name'] + '={}'
+                    if is_lazy(arg):
+                        args += ', repr(Lazy{}.{}.peek(self))'.format(msg['clsname'], arg['name'])
+                    else:
+                        args += ', repr(self.{})'.format(arg['name'])
+                fmt += ')'
+                ind.writeln('return {}.format({})', repr(fmt), args)
+            write_from_line(ind, msg, lazy=True)
+
     # verbmap
     ind.writeln('from_lines_by_verb = {{')
     with ind.indent():
@@ -265,8 +403,18 @@ def data_to_module(data, f):
             verb = 'b{}'.format(repr(msg['verb']))
             if isinstance(msg['verb'], int):
                 verb = '{}'.format(msg['verb'])
-            ind.writeln('{}: {}.from_line,', verb, msg['clsname'])
+            ind.writeln('{}: {}._from_line,', verb, msg['clsname'])
+    ind.writeln('}}')
+    ind.writeln('lazy_from_lines_by_verb = {{')
+    with ind.indent():
+        for msg in data['messages']:
+            verb = 'b{}'.format(repr(msg['verb']))
+            if isinstance(msg['verb'], int):
+                verb = '{}'.format(msg['verb'])
+            ind.writeln('{}: Lazy{}._from_line,', verb, msg['clsname'])
     ind.writeln('}}')
+    ind.writeln('intern_commands(from_lines_by_verb)')
+    ind.writeln('')
 
     # factory mixin
     ind.writeln('class MessageFactory:')
@@ -287,19 +435,83 @@ def data_to_module(data, f):
                     constrargs += ', {0}={0}'.format(arg['name'])
                 ind.writeln('self.message({}({}))', msg['clsname'], constrargs)
 
+    # handler names, in the order on_message tries them
+    ind.writeln('handler_names_by_class = {{')
+    with ind.indent():
+        for msg in data['messages']:
+            ind.writeln('{}: {},', msg['clsname'], repr('on_' + msg['name']))
+    ind.writeln('}}')
+    ind.writeln('handler_names_by_verb = {{')
+    with ind.indent():
+        for msg in data['messages']:
+            verb = 'b{}'.format(repr(msg['verb']))
+            if isinstance(msg['verb'], int):
+                verb = '{}'.format(msg['verb'])
+            ind.writeln('{}: {},', verb, repr('on_' + msg['name']))
+    ind.writeln('}}')
+    ind.writeln('handler_method_names = frozenset(handler_names_by_verb.values())')
+    ind.writeln('')
+
     # handler mixin
     ind.writeln('class MessageHandler:')
     with ind.indent():
+        ind.writeln('# message class -> name of its handler method, filled in on first use')
+        ind.writeln('_handler_names = {{}} # type: typing.Dict[type, typing.Optional[str]]')
+        ind.writeln('# verbs with an overridden on_* method, or None if on_message itself')
+        ind.writeln('# is overridden and so wants every line. Only class attributes can be')
+        ind.writeln('# seen here, so setting on_message or an on_* handler on an instance')
+        ind.writeln('# switches that instance to None as well')
+        ind.writeln('_handled_verbs = frozenset() # type: typing.Optional[typing.FrozenSet[typing.Union[bytes, int]]]')
+        ind.writeln('')
+        ind.writeln('def __init_subclass__(cls, **kwargs: typing.Any) -> None:')
+        with ind.indent():
+            ind.writeln('super().__init_subclass__(**kwargs)')
+            ind.writeln('if cls.on_message is not MessageHandler.on_message:')
+            with ind.indent():
+                ind.writeln('cls._handled_verbs = None')
+            ind.writeln('else:')
+            with ind.indent():
+                ind.writeln('cls._handled_verbs = frozenset(verb for verb, name in handler_names_by_verb.items() if getattr(cls, name) is not getattr(MessageHandler, name))')
+        ind.writeln('def __setattr__(self, name: str, value: typing.Any) -> None:')
+        with ind.indent():
+            ind.writeln("if name == 'on_message' or name in handler_method_names:")
+            with ind.indent():
+                ind.writeln("super().__setattr__('_handled_verbs', None)")
+            ind.writeln('super().__setattr__(name, value)')
         for msg in data['messages']:
             ind.writeln('def on_{0}(self, {0}: {1}) -> None: pass', msg['name'], msg['clsname'])
-        ind.writeln('def on_message(self, msg: Message) -> None:')
+        ind.writeln('')
+        ind.writeln('@staticmethod')
+        ind.writeln('def _resolve_handler(msgcls: type) -> typing.Optional[str]:')
         with ind.indent():
-            cond = 'if'
-            for msg in data['messages']:
-                ind.writeln('{} isinstance(msg, {}):', cond, msg['clsname'])
-                cond = 'elif'
+            ind.writeln('handler = None')
+            ind.writeln('for base, name in handler_names_by_class.items():')
+            with ind.indent():
+                ind.writeln('if issubclass(msgcls, base):')
                 with ind.indent():
-                    ind.writeln('self.on_{}(msg)', msg['name'])
+                    ind.writeln('handler = name')
+                    ind.writeln('break')
+            ind.writeln('MessageHandler._handler_names[msgcls] = handler')
+            ind.writeln('return handler')
+        ind.writeln('def on_message(self, msg: Message) -> None:')
+        with ind.indent():
+            ind.writeln('try:')
+            with ind.indent():
+                ind.writeln('name = self._handler_names[msg.__class__]')
+            ind.writeln('except KeyError:')
+            with ind.indent():
+                ind.writeln('name = self._resolve_handler(msg.__class__)')
+            ind.writeln('if name is not None:')
+            with ind.indent():
+                ind.writeln('getattr(self, name)(msg)')
+        ind.writeln('# like on_message(Message.from_line(line)), but lines for verbs this')
+        ind.writeln('# handler ignores are dropped without being decoded')
+        ind.writeln('def handle_line(self, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> None:')
+        with ind.indent():
+            ind.writeln('verbs = self._handled_verbs')
+            ind.writeln('if verbs is None or line.command in verbs:')
+            with ind.indent():
+                ind.writeln('self.on_message(Message.from_line(line, decode))')
 
 p = argparse.ArgumentParser()
 p.add_argument('input', type=argparse.FileType('r'))
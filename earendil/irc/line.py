@@ -1,6 +1,18 @@
+import array
 import collections
+import functools
 import re
-from typing import TypeVar, Generic, Callable, Dict, List, Union, Any
+from typing import TypeVar, Generic, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, Any
+
+# NumPy is optional, and only used for large buffers in backward_many, so
+# it is imported on first use there rather than along with this module
+@functools.lru_cache(maxsize=None)
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
 
 class Line:
     __slots__ = ['source', 'command', 'arguments', 'ctcp']
@@ -15,14 +27,85 @@ class Line:
         return "Line(source={}, command={}, arguments={}, ctcp={})".format(repr(self.source), repr(self.command), repr(self.arguments), repr(self.ctcp))
 
     def __eq__(self, other: Any) -> bool:
-        return self.source == other.source and self.command == other.command and self.arguments == other.arguments and self.ctcp == other.ctcp
+        return self.source == other.source and self.command == other.command and tuple(self.arguments) == tuple(other.arguments) and tuple(self.ctcp) == tuple(other.ctcp)
+
+    def freeze(self) -> 'FrozenLine':
+        return FrozenLine(self.source, self.command, tuple(self.arguments), tuple(self.ctcp))
+
+    def to_raw(self, profile: str = 'rfc1459-ctcp') -> bytes:
+        return profiles[profile].forward(self)
+
+    @classmethod
+    def from_raw(cls, line: bytes, lazy: bool = False, profile: str = 'rfc1459-ctcp') -> 'Line':
+        return profiles[profile].backward(line, lazy)
 
-    def to_raw(self) -> bytes:
-        return full_stack.forward(self)
+    @classmethod
+    def from_buffer(cls, buffer: Any, start: int = 0, end: Optional[int] = None, profile: str = 'rfc1459-ctcp') -> 'Line':
+        return profiles[profile].view(buffer, start, end)
 
     @classmethod
-    def from_raw(cls, line: bytes) -> 'Line':
-        return full_stack.backward(line)
+    def from_raw_many(cls, lines: bytes, profile: str = 'rfc1459-ctcp', errors: Optional[List[int]] = None) -> Tuple[List['Line'], int]:
+        return profiles[profile].backward_many(lines, errors)
+
+# A message source, as bytes, that splits itself into nick, user and host the
+# first time any of them is asked for. Prefixes decoded from the wire come
+# from intern_prefix, so every line from the same source shares one Prefix
+# and one split.
+class Prefix(bytes):
+    @functools.cached_property
+    def _parts(self) -> Tuple[bytes, Optional[bytes], Optional[bytes]]:
+        nick, at, host = self.partition(b'@')
+        nick, bang, user = nick.partition(b'!')
+        return bytes(nick), bytes(user) if bang else None, bytes(host) if at else None
+
+    @property
+    def nick(self) -> bytes:
+        return self._parts[0]
+
+    @property
+    def user(self) -> Optional[bytes]:
+        return self._parts[1]
+
+    @property
+    def host(self) -> Optional[bytes]:
+        return self._parts[2]
+
+intern_prefix = functools.lru_cache(maxsize=4096)(Prefix) # type: Callable[[bytes], Prefix]
+
+# An immutable, hashable Line, with tuples for arguments and ctcp. These can
+# be shared freely, for example out of a ParseCache, and the default profile's
+# wire bytes are only worked out once however many times they are sent.
+class FrozenLine(Line):
+    __slots__ = ['_raw', '_hash']
+
+    def __init__(self, source: bytes, command: Union[bytes, int], arguments: Tuple[bytes, ...] = (), ctcp: Tuple[bytes, ...] = ()) -> None:
+        object.__setattr__(self, 'source', source)
+        object.__setattr__(self, 'command', command)
+        object.__setattr__(self, 'arguments', tuple(arguments))
+        object.__setattr__(self, 'ctcp', tuple(ctcp))
+        object.__setattr__(self, '_raw', None)
+        object.__setattr__(self, '_hash', None)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hash((self.source, self.command, self.arguments, self.ctcp)))
+        return self._hash
+
+    def to_raw(self, profile: str = 'rfc1459-ctcp') -> bytes:
+        if profile != 'rfc1459-ctcp':
+            return profiles[profile].forward(self)
+        if self._raw is None:
+            object.__setattr__(self, '_raw', fused_stack.forward(self))
+        return self._raw
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("FrozenLine is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("FrozenLine is immutable")
+
+    def freeze(self) -> 'FrozenLine':
+        return self
 
 A = TypeVar('A')
 B = TypeVar('B')
@@ -39,6 +122,12 @@ class Isomorphism(Generic[A, B]):
     def compose(self, other: 'Isomorphism[B, C]') -> 'Isomorphism[A, C]':
         return Composed(self, other)
 
+    def flatten(self) -> List['Isomorphism[Any, Any]']:
+        return [self]
+
+    def compile(self) -> 'Isomorphism[A, B]':
+        return Compiled(self.flatten())
+
 class Composed(Isomorphism[A, C], Generic[A, C]):
     def __init__(self, a: Isomorphism[A, B], b: Isomorphism[B, C]) -> None:
         self.a = a
@@ -50,6 +139,56 @@ class Composed(Isomorphism[A, C], Generic[A, C]):
     def backward(self, x: C) -> A:
         return self.a.backward(self.b.backward(x))
 
+    def flatten(self) -> List[Isomorphism[Any, Any]]:
+        return self.a.flatten() + self.b.flatten()
+
+def _stage_function(stage: Isomorphism[Any, Any], forward: bool) -> Callable[[Any], Any]:
+    if isinstance(stage, Lift):
+        if forward:
+            return functools.partial(stage.up, stage.inner.compile().forward)
+        return functools.partial(stage.down, stage.inner.compile().backward)
+    return stage.forward if forward else stage.backward
+
+# build one function that calls each of fs in turn
+def _chain(fs: List[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    if len(fs) == 1:
+        return fs[0]
+    namespace = {'f{}'.format(i): f for i, f in enumerate(fs)}
+    body = 'x'
+    for name in namespace:
+        body = '{}({})'.format(name, body)
+    exec('def chained(x):\n    return {}'.format(body), namespace)
+    return namespace['chained']
+
+# A flat list of stages, with forward and backward each generated as a single
+# function that calls every stage directly.
+class Compiled(Isomorphism[A, B], Generic[A, B]):
+    def __init__(self, stages: List[Isomorphism[Any, Any]]) -> None:
+        self.stages = stages
+        self.forward = _chain([_stage_function(s, True) for s in stages]) # type: ignore
+        self.backward = _chain([_stage_function(s, False) for s in reversed(stages)]) # type: ignore
+
+    def flatten(self) -> List[Isomorphism[Any, Any]]:
+        return list(self.stages)
+
+# (testing for the byte values, 32 and 9, is much cheaper than a
+# one-byte substring search)
+def check_middle(arg: bytes) -> None:
+    if 32 in arg or 9 in arg:
+        raise ValueError('whitespace in middle argument')
+    if not arg:
+        raise ValueError('empty middle argument')
+
+# Bytes that have already been checked as a valid middle argument, so that
+# encoding them again skips the check. Useful for channel names and nicks
+# that are sent over and over.
+class SafeArg(bytes):
+    __slots__ = ()
+
+    def __new__(cls, arg: bytes) -> 'SafeArg':
+        check_middle(arg)
+        return super().__new__(cls, arg)
+
 # forward : friendly -> encoded
 # backward: encoded  -> friendly
 
@@ -61,24 +200,33 @@ class Liner(Isomorphism[bytes, bytes]):
             raise ValueError("invalid line")
         return lined[:-2]
 
+# Quoting replays a plan of bytes.replace calls worked out once per Quoter;
+# each is a single C-level pass that only copies when it has something to
+# replace. Unquoting splits on escapes in one regex pass and maps the escaped
+# bytes through a table, so there are no per-match Python calls.
 class Quoter(Isomorphism[bytes, bytes]):
     def __init__(self, quote: bytes, codemap: Dict[bytes, bytes]) -> None:
         self.quote = quote
         self.codemap = codemap
-        requote = re.escape(quote)
-        self.unquoter = re.compile(requote + b'(.)', re.DOTALL)
-    
+        self.special = re.compile(b'|'.join(re.escape(c) for c in [quote, *codemap.values()]))
+        self.unquoter = re.compile(re.escape(quote) + b'(.)', re.DOTALL)
+        self.plan = [(quote, quote + quote)] + [(char, quote + code) for code, char in codemap.items()]
+        self.decoding = {bytes([c]): bytes([c]) for c in range(256)}
+        self.decoding.update(codemap)
+
     def forward(self, unquoted: bytes) -> bytes:
-        s = unquoted.replace(self.quote, self.quote + self.quote)
-        for code, char in self.codemap.items():
-            s = s.replace(char, self.quote + code)
-        return s
+        if self.special.search(unquoted) is None:
+            return unquoted
+        for char, escaped in self.plan:
+            unquoted = unquoted.replace(char, escaped)
+        return unquoted
 
     def backward(self, quoted: bytes) -> bytes:
-        def replacer(matchobj: 're.Match') -> bytes:
-            c = matchobj.group(1)
-            return self.codemap.get(c, c)
-        return self.unquoter.sub(replacer, quoted)
+        if self.quote not in quoted:
+            return quoted
+        parts = self.unquoter.split(quoted)
+        parts[1::2] = map(self.decoding.__getitem__, parts[1::2])
+        return b''.join(parts)
 
 low_level = Quoter(b'\020', {
     b'0': b'\0',
@@ -86,30 +234,40 @@ low_level = Quoter(b'\020', {
     b'r': b'\r',
 })
 
+def _untag(base: bytes, delim: bytes) -> List[bytes]:
+    parts = base.split(delim)
+    n = len(parts)
+    if n % 2:
+        tags = parts[1::2]
+        tags.insert(0, b''.join(parts[::2]))
+    else:
+        tags = parts[1:n - 1:2]
+        tags.insert(0, b''.join(parts[0:n - 1:2]) + delim + parts[-1])
+    return tags
+
 class Tagger(Isomorphism[List[bytes], bytes]):
     def __init__(self, delim: bytes = b'\001') -> None:
         self.delim = delim
-        redelim = re.escape(delim)
-        self.untagger = re.compile(redelim + b'(.*?)' + redelim, re.DOTALL)
 
     def forward(self, tags: List[bytes]) -> bytes:
         if not tags:
             raise ValueError("need at least one tag")
-        if any(self.delim in t for t in tags):
+        delim = self.delim
+        if len(tags) == 1:
+            if delim in tags[0]:
+                raise ValueError("invalid character in tags")
+            return tags[0]
+        if any(delim in t for t in tags):
             raise ValueError("invalid character in tags")
-        base = tags[0]
+        pieces = [tags[0]]
         for t in tags[1:]:
-            base += self.delim + t + self.delim
-        return base
+            pieces += (delim, t, delim)
+        return b''.join(pieces)
 
     def backward(self, base: bytes) -> List[bytes]:
-        tags = []
-        def replacer(matchobj: 're.Match') -> bytes:
-            tags.append(matchobj.group(1))
-            return b''
-        base = self.untagger.sub(replacer, base)
-        tags.insert(0, base)
-        return tags
+        if self.delim not in base:
+            return [base]
+        return _untag(base, self.delim)
 
 class Lift(Isomorphism[A, B], Generic[A, B]):
     def __init__(self, inner: Isomorphism[C, D], up: Callable[[Callable[[C], D], A], B], down: Callable[[Callable[[D], C], B], A]) -> None:
@@ -121,6 +279,18 @@ class Lift(Isomorphism[A, B], Generic[A, B]):
     def backward(self, l: B) -> A:
         return self.down(self.inner.backward, l)
 
+# map f over a list, handing back the list itself if f left every element
+# alone
+def _map_list(f: Callable[[Any], Any], l: List[Any]) -> List[Any]:
+    mapped = l
+    for i, x in enumerate(l):
+        y = f(x)
+        if y is not x:
+            if mapped is l:
+                mapped = list(l)
+            mapped[i] = y
+    return mapped
+
 ctcp_level = Quoter(b'\\', {
     b'a': b'\001',
 })
@@ -138,18 +308,16 @@ class Protocol(Isomorphism[Line, List[bytes]]):
         s += cmd
         if line.arguments:
             for arg in line.arguments[:-1]:
-                if any(c in arg for c in b' \t'):
-                    raise ValueError('whitespace in middle argument')
-                if not arg:
-                    raise ValueError('empty middle argument')
+                if arg.__class__ is not SafeArg:
+                    check_middle(arg)
                 s += b' ' + arg
             last = line.arguments[-1]
-            if any(c in last for c in b' \t') or not last:
+            if last.__class__ is not SafeArg and (not last or b' ' in last or b'\t' in last):
                 s += b' :'
             else:
                 s += b' '
             s += last
-        return [s] + line.ctcp
+        return [s, *line.ctcp]
 
     def backward(self, tags: List[bytes]) -> Line:
         if not tags:
@@ -179,14 +347,577 @@ class Protocol(Isomorphism[Line, List[bytes]]):
         if last is not None:
             lineparts.append(last)
         
-        command = lineparts[0] # type: Union[bytes, int]
-        try:
-            command = int(command)
-        except ValueError:
-            if isinstance(command, bytes):
-                command = command.upper()
+        command = _command(lineparts[0])
         lineparts = lineparts[1:]
 
         return Line(source, command, lineparts, tags[1:])
 
-full_stack = Protocol().compose(Lift(ctcp_level, lambda f, l: list(map(f, l)), lambda f, l: list(map(f, l)))).compose(Tagger()).compose(low_level).compose(Liner())
+class Untagged(Isomorphism[List[bytes], bytes]):
+    def forward(self, tags: List[bytes]) -> bytes:
+        if len(tags) != 1:
+            raise ValueError("tags not supported")
+        return tags[0]
+
+    def backward(self, base: bytes) -> List[bytes]:
+        return [base]
+
+full_stack = Protocol().compose(Lift(ctcp_level, _map_list, _map_list)).compose(Tagger()).compose(low_level).compose(Liner())
+modern_stack = Protocol().compose(Lift(ctcp_level, _map_list, _map_list)).compose(Tagger()).compose(Liner())
+raw_stack = Protocol().compose(Untagged()).compose(Liner())
+
+def _split_arguments(line: bytes) -> List[bytes]:
+    i = line.find(b' :')
+    if i < 0:
+        i = line.find(b'\t:')
+    if i < 0:
+        return line.split()
+    arguments = line[:i].split()
+    arguments.append(line[i + 2:])
+    return arguments
+
+# Raw command bytes to their canonical bytes or int. Every three-digit
+# numeric is here from the start; messages adds its verbs with
+# intern_commands, and anything else goes through a bounded cache.
+_commands = {b'%03d' % n: n for n in range(1000)} # type: Dict[bytes, Union[bytes, int]]
+
+def intern_commands(commands: Iterable[Union[bytes, int]]) -> None:
+    for command in commands:
+        if isinstance(command, int):
+            _commands[b'%03d' % command] = command
+        else:
+            _commands[command] = command
+            _commands[command.lower()] = command
+
+@functools.lru_cache(maxsize=1024)
+def _uncommon_command(command: bytes) -> Union[bytes, int]:
+    if not command.isalpha():
+        try:
+            return int(command)
+        except ValueError:
+            pass
+    command = command.upper()
+    return _commands.get(command, command)
+
+def _command(command: bytes) -> Union[bytes, int]:
+    known = _commands.get(command)
+    if known is None:
+        return _uncommon_command(command)
+    return known
+
+def _strip_source(line: bytes) -> Tuple[Optional[bytes], bytes]:
+    line = line.lstrip()
+    source = None
+    if line[:1] == b':':
+        lineparts = line.split(None, 1)
+        if len(lineparts) == 2:
+            source = intern_prefix(lineparts[0][1:])
+            line = lineparts[1]
+        elif len(line) > 1:
+            return None, b''
+    return source, line
+
+# The tokenizers return None for lines with no command.
+
+def _tokenize(line: bytes, ctcp: List[bytes]) -> Optional[Line]:
+    source, line = _strip_source(line)
+    # the first word can never be part of the trailing argument, so the
+    # middle arguments are only empty if the whole line is
+    arguments = _split_arguments(line)
+    if not arguments:
+        return None
+    command = _command(arguments.pop(0))
+    return Line(source, command, arguments, ctcp)
+
+# The tokenizer for lines that separate everything by exactly one space,
+# which is a find and a split. Splitting on single spaces gives the same as
+# splitting on all whitespace unless there are doubled, leading or trailing
+# spaces (which leave an empty argument) or other whitespace bytes; lines
+# like that fall back to _tokenize.
+def _tokenize_strict(line: bytes, ctcp: List[bytes]) -> Optional[Line]:
+    i = line.find(b' :')
+    middle = line if i < 0 else line[:i]
+    arguments = middle.split(b' ')
+    if b'' in arguments or 9 in middle or 10 in middle or 13 in middle or 11 in middle or 12 in middle:
+        return _tokenize(line, ctcp)
+    source = None
+    if middle[0] == 58:
+        if len(arguments) == 1:
+            return _tokenize(line, ctcp)
+        source = intern_prefix(arguments.pop(0)[1:])
+    command = _command(arguments.pop(0))
+    if i >= 0:
+        arguments.append(line[i + 2:])
+    return Line(source, command, arguments, ctcp)
+
+def _tokenize_lazy(line: bytes, ctcp: List[bytes]) -> Optional[Line]:
+    source, line = _strip_source(line)
+    m = _word.match(line)
+    if m is None:
+        return None
+    return LazyLine(source, _command(line[:m.end()]), line[m.end():], ctcp)
+
+_word = re.compile(rb'[^ \t\n\r\x0b\x0c]+')
+_unset = object()
+
+# A Line whose arguments are only split out of the rest of the line when
+# they are first read
+class LazyLine(Line):
+    __slots__ = ['_rest', '_arguments']
+
+    def __init__(self, source: Optional[bytes], command: Union[bytes, int], rest: bytes, ctcp: List[bytes]) -> None:
+        self.source = source
+        self.command = command
+        self.ctcp = ctcp
+        self._rest = rest
+        self._arguments = None # type: Optional[List[bytes]]
+
+    @property
+    def arguments(self) -> List[bytes]:
+        if self._arguments is None:
+            self._arguments = _split_arguments(self._rest)
+            self._rest = None
+        return self._arguments
+
+    @arguments.setter
+    def arguments(self, arguments: List[bytes]) -> None:
+        self._arguments = arguments
+        self._rest = None
+
+# A Line whose fields stay in the buffer it was read from until they are
+# first read. Only lines that need no unquoting or untagging can be viewed;
+# see Fused.view. The buffer must not be modified or reused while the view
+# is alive: each field is copied out when first read, and any change to the
+# buffer before then shows up in the line. Copy the fields out first (for
+# example with Line(l.source, l.command, l.arguments, l.ctcp)) if the
+# buffer is about to be refilled.
+class LineView(Line):
+    __slots__ = ['_buffer', '_spans', '_source', '_command', '_arguments']
+
+    def __init__(self, buffer: memoryview, spans: Tuple[int, int, int, int, int]) -> None:
+        self._buffer = buffer
+        self._spans = spans
+        self._source = self._command = self._arguments = _unset
+        self.ctcp = []
+
+    @property
+    def source(self) -> Optional[bytes]:
+        if self._source is _unset:
+            start, end = self._spans[0:2]
+            self._source = intern_prefix(bytes(self._buffer[start:end])) if start >= 0 else None
+        return self._source
+
+    @source.setter
+    def source(self, source: Optional[bytes]) -> None:
+        self._source = source
+
+    @property
+    def command(self) -> Union[bytes, int]:
+        if self._command is _unset:
+            start, end = self._spans[2:4]
+            self._command = _command(bytes(self._buffer[start:end]))
+        return self._command
+
+    @command.setter
+    def command(self, command: Union[bytes, int]) -> None:
+        self._command = command
+
+    @property
+    def arguments(self) -> List[bytes]:
+        if self._arguments is _unset:
+            start, end = self._spans[3:5]
+            self._arguments = _split_arguments(bytes(self._buffer[start:end]))
+        return self._arguments
+
+    @arguments.setter
+    def arguments(self, arguments: List[bytes]) -> None:
+        self._arguments = arguments
+
+# Protocol, Lift(ctcp), Tagger, low and Liner as a single stage. Quoting and
+# tagging are skipped outright when a C-level scan shows they have nothing to
+# do, so a typical line is only split once.
+# Any of the stages can be None, in which case it is left out entirely. With
+# strict set, lines are first tokenized on the assumption that they are
+# separated by single spaces, falling back to the tolerant tokenizer for any
+# line that is not.
+class Fused(Isomorphism[Line, bytes]):
+    def __init__(self, low: Optional[Quoter], tagger: Optional[Tagger], ctcp: Optional[Quoter], strict: bool = False) -> None:
+        self.low = low
+        self.tagger = tagger
+        self.ctcp = ctcp
+        self.strict = strict
+        quoters = [q for q in [ctcp, low] if q is not None]
+        escapes = [q.quote for q in quoters] + ([tagger.delim] if tagger is not None else [])
+        special = [q.special.pattern for q in quoters]
+        if ctcp is None and tagger is not None:
+            # nothing quotes the delimiter away, so it must be caught instead
+            special.append(re.escape(tagger.delim))
+        self.special = re.compile(b'|'.join(special)) if special else None
+        self.escape_bytes = escapes
+        self.escapes = re.compile(b'|'.join(re.escape(c) for c in escapes)) if escapes else None
+
+    def quote(self, s: bytes) -> bytes:
+        if self.ctcp is not None:
+            s = self.ctcp.forward(s)
+        elif self.tagger is not None and self.tagger.delim in s:
+            raise ValueError("invalid character in tags")
+        if self.low is not None:
+            s = self.low.forward(s)
+        return s
+
+    def forward(self, line: Line) -> bytes:
+        pieces = []
+        if line.source:
+            pieces += (b':', line.source, b' ')
+        cmd = line.command
+        if isinstance(cmd, int):
+            cmd = b'%03d' % cmd
+        elif isinstance(cmd, bytes):
+            cmd = cmd.upper()
+        pieces.append(cmd)
+        arguments = line.arguments
+        if arguments:
+            n = len(arguments) - 1
+            for i in range(n):
+                arg = arguments[i]
+                if arg.__class__ is not SafeArg:
+                    check_middle(arg)
+                pieces += (b' ', arg)
+            last = arguments[n]
+            if last.__class__ is not SafeArg and (not last or b' ' in last or b'\t' in last):
+                pieces += (b' :', last)
+            else:
+                pieces += (b' ', last)
+
+        if line.ctcp:
+            if self.tagger is None:
+                raise ValueError("tags not supported")
+            ctcp = self.ctcp.forward if self.ctcp is not None else lambda t: t
+            delim = self.tagger.delim
+            base = ctcp(b''.join(pieces))
+            if delim in base:
+                raise ValueError("invalid character in tags")
+            tagged = [base]
+            for t in line.ctcp:
+                t = ctcp(t)
+                if delim in t:
+                    raise ValueError("invalid character in tags")
+                tagged += (delim, t, delim)
+            s = b''.join(tagged)
+            if self.low is not None:
+                s = self.low.forward(s)
+            return s + b'\r\n'
+
+        pieces.append(b'\r\n')
+        s = b''.join(pieces)
+        if self.special is None or self.special.search(s, 0, len(s) - 2) is None:
+            return s
+        return self.quote(s[:-2]) + b'\r\n'
+
+    def backward(self, lined: bytes, lazy: bool = False) -> Line:
+        if not lined.endswith(b'\r\n'):
+            raise ValueError("invalid line")
+        return self.decode(lined[:-2], lazy)
+
+    # like backward, but for the line at buffer[start:end], and returning a
+    # LineView into the buffer wherever the decoded line would be identical
+    def view(self, buffer: Any, start: int = 0, end: Optional[int] = None) -> Line:
+        buffer = memoryview(buffer)
+        if end is None:
+            end = len(buffer)
+        if buffer[end - 2:end] != b'\r\n':
+            raise ValueError("invalid line")
+        end -= 2
+        if self.escapes is not None and self.escapes.search(buffer, start, end) is not None:
+            return self.decode(bytes(buffer[start:end]))
+        m = _word.search(buffer, start, end)
+        if m is None:
+            raise ValueError("invalid irc line")
+        source_start = source_end = -1
+        if buffer[m.start()] == 58:
+            source_start, source_end = m.start() + 1, m.end()
+            m = _word.search(buffer, source_end, end)
+            if m is None:
+                return self.decode(bytes(buffer[start:end]))
+        return LineView(buffer, (source_start, source_end, m.start(), m.end(), end))
+
+    # below this many bytes, bytes.split beats setting up the NumPy scan
+    numpy_threshold = 65536
+
+    # decode every complete line in a buffer, and return the offset at which
+    # the trailing partial line (if any) starts. Lines that fail to decode
+    # are skipped, and their offsets appended to errors; without an errors
+    # list, the first one raises ValueError saying where it is.
+    def backward_many(self, lined: bytes, errors: Optional[List[int]] = None) -> Tuple[List[Line], int]:
+        if len(lined) >= self.numpy_threshold and all(len(c) == 1 for c in self.escape_bytes) and _numpy() is not None:
+            return self.backward_many_numpy(lined, errors)
+        bodies = bytes(lined).split(b'\r\n')
+        partial = bodies.pop()
+        try_decode = self.try_decode
+        lines = []
+        start = 0
+        for body in bodies:
+            line = try_decode(body)
+            if line is not None:
+                lines.append(line)
+            else:
+                _bad_line(errors, start)
+            start += len(body) + 2
+        return lines, len(lined) - len(partial)
+
+    # backward_many for large buffers: NumPy finds every CRLF and escape byte
+    # in a few vectorised passes, and lines with no escapes in them go
+    # straight to the tokenizer
+    def backward_many_numpy(self, lined: bytes, errors: Optional[List[int]] = None) -> Tuple[List[Line], int]:
+        numpy = _numpy()
+        lined = bytes(lined)
+        data = numpy.frombuffer(lined, dtype=numpy.uint8)
+        crs = numpy.flatnonzero((data[:-1] == 13) & (data[1:] == 10))
+        starts = numpy.concatenate(([0], crs + 2))
+        escapes = numpy.flatnonzero(numpy.isin(data, numpy.frombuffer(b''.join(self.escape_bytes), dtype=numpy.uint8)))
+        escaped = numpy.searchsorted(escapes, crs) > numpy.searchsorted(escapes, starts[:-1])
+
+        try_decode = self.try_decode
+        tokenize = _tokenize_strict if self.strict else _tokenize
+        lines = []
+        for start, end, needs_decode in zip(starts[:-1].tolist(), crs.tolist(), escaped.tolist()):
+            body = lined[start:end]
+            line = try_decode(body) if needs_decode else tokenize(body, [])
+            if line is not None:
+                lines.append(line)
+            else:
+                _bad_line(errors, start)
+        return lines, int(starts[-1])
+
+    def decode(self, s: bytes, lazy: bool = False) -> Line:
+        line = self.try_decode(s, lazy)
+        if line is None:
+            raise ValueError("invalid irc line")
+        return line
+
+    # decode, but returning None rather than raising for lines without a
+    # command
+    def try_decode(self, s: bytes, lazy: bool = False) -> Optional[Line]:
+        tokenize = _tokenize_lazy if lazy else _tokenize_strict if self.strict else _tokenize
+        low, tagger, ctcp = self.low, self.tagger, self.ctcp
+        if low is not None and low.quote in s:
+            s = low.backward(s)
+        if tagger is None or tagger.delim not in s:
+            if ctcp is not None and ctcp.quote in s:
+                s = ctcp.backward(s)
+            return tokenize(s, [])
+        tags = _untag(s, tagger.delim)
+        if ctcp is not None:
+            for i, t in enumerate(tags):
+                if ctcp.quote in t:
+                    tags[i] = ctcp.backward(t)
+        return tokenize(tags[0], tags[1:])
+
+def _bad_line(errors: Optional[List[int]], offset: int) -> None:
+    if errors is None:
+        raise ValueError("invalid irc line at offset {}".format(offset))
+    errors.append(offset)
+
+fused_stack = Fused(low_level, Tagger(), ctcp_level)
+
+# Named protocol profiles, each a Fused stack that leaves out the stages it
+# does not use:
+#  rfc1459-ctcp: low-level quoting and CTCP tagging; the same as full_stack
+#  modern:       CTCP tagging, but no low-level quoting
+#  raw:          no quoting or tagging at all
+# and each of these with "-strict" on the end uses the strict tokenizer.
+profiles = {
+    'rfc1459-ctcp': fused_stack,
+    'modern': Fused(None, Tagger(), ctcp_level),
+    'raw': Fused(None, None, None),
+} # type: Dict[str, Fused]
+profiles.update({name + '-strict': Fused(stack.low, stack.tagger, stack.ctcp, strict=True) for name, stack in profiles.items()})
+
+# A Line with one argument left open, serialised once up to and after that
+# argument. render() then fills in a value by joining just four pieces.
+class LineTemplate:
+    def __init__(self, line: Line, index: int, profile: str = 'rfc1459-ctcp') -> None:
+        self.stack = profiles[profile]
+        arguments = list(line.arguments)
+        index = range(len(arguments))[index]
+        self.last = index == len(arguments) - 1
+        placeholder = b'placeholder'
+        while True:
+            arguments[index] = placeholder
+            raw = self.stack.forward(Line(line.source, line.command, arguments, list(line.ctcp)))
+            if raw.count(placeholder) == 1:
+                break
+            placeholder += b'_'
+        # the space before the placeholder is not part of the prefix, as the
+        # last argument may need a colon there
+        prefix, self.suffix = raw.split(placeholder)
+        self.prefix = prefix[:-1]
+
+    def render(self, argument: bytes) -> bytes:
+        separator = b' '
+        if argument.__class__ is not SafeArg:
+            if not self.last:
+                check_middle(argument)
+            elif not argument or b' ' in argument or b'\t' in argument:
+                separator = b' :'
+        return b''.join((self.prefix, separator, self.stack.quote(argument), self.suffix))
+
+# Append-only storage for many lines: the encoded lines sit end to end in one
+# bytearray, with an array of offsets into it, and are decoded into LazyLines
+# again when read.
+class LineTable:
+    def __init__(self, profile: str = 'rfc1459-ctcp') -> None:
+        self.stack = profiles[profile]
+        self.arena = bytearray()
+        self.offsets = array.array('Q', [0])
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> Line:
+        return self.stack.decode(self.raw(index), lazy=True)
+
+    def __iter__(self) -> Iterator[Line]:
+        decode = self.stack.decode
+        offsets = self.offsets
+        for i in range(len(self)):
+            yield decode(bytes(self.arena[offsets[i]:offsets[i + 1]]), True)
+
+    # the stored line, without its CRLF
+    def raw(self, index: int) -> bytes:
+        index = range(len(self))[index]
+        return bytes(self.arena[self.offsets[index]:self.offsets[index + 1]])
+
+    def append(self, line: Line) -> None:
+        self.append_raw(self.stack.forward(line))
+
+    def append_raw(self, line: bytes) -> None:
+        if not line.endswith(b'\r\n'):
+            raise ValueError("invalid line")
+        self.arena += memoryview(line)[:-2]
+        self.offsets.append(len(self.arena))
+
+MISSING_CRLF = 'missing-crlf'
+EMPTY_COMMAND = 'empty-command'
+LINE_TOO_LONG = 'line-too-long'
+
+# Parses lines without ever raising: try_parse returns either the Line or
+# MISSING_CRLF or EMPTY_COMMAND, and counts each error code in errors. (The
+# messages module's MessageParser does the same for typed messages.)
+class LineParser:
+    def __init__(self, profile: str = 'rfc1459-ctcp') -> None:
+        self.stack = profiles[profile]
+        self.errors = collections.Counter() # type: collections.Counter[str]
+
+    def try_parse(self, line: bytes) -> Union[Line, str]:
+        if not line.endswith(b'\r\n'):
+            self.errors[MISSING_CRLF] += 1
+            return MISSING_CRLF
+        parsed = self.stack.try_decode(line[:-2])
+        if parsed is None:
+            self.errors[EMPTY_COMMAND] += 1
+            return EMPTY_COMMAND
+        return parsed
+
+# A bounded LRU cache from raw lines to the FrozenLines they decode to. Use
+# cache_info() for hit and miss counts.
+class ParseCache:
+    def __init__(self, maxsize: int = 4096, profile: str = 'rfc1459-ctcp') -> None:
+        self.stack = profiles[profile]
+        self.from_raw = functools.lru_cache(maxsize)(self._from_raw) # type: Callable[[bytes], FrozenLine]
+
+    def _from_raw(self, line: bytes) -> FrozenLine:
+        return self.stack.backward(line).freeze()
+
+    def cache_info(self) -> Any:
+        return self.from_raw.cache_info() # type: ignore
+
+    def cache_clear(self) -> None:
+        self.from_raw.cache_clear() # type: ignore
+
+# An incremental, sans-IO line framer over one fixed bytearray. Either feed
+# it chunks, getting back the lines they complete, or write into
+# get_buffer() (say with socket.recv_into), call buffer_updated, and iterate
+# the reader. Overlong lines are skipped, as are lines ending in a bare LF if
+# require_crlf is set; iterating raises ValueError with an error code for each,
+# and can carry on afterwards, while feed counts them in errors instead.
+# Blank lines are ignored.
+class LineReader:
+    def __init__(self, profile: str = 'rfc1459-ctcp', max_length: int = 8192, bufsize: int = 65536, require_crlf: bool = False) -> None:
+        self.stack = profiles[profile]
+        self.max_length = max_length
+        self.require_crlf = require_crlf
+        self.buffer = bytearray(max(bufsize, max_length))
+        self.view = memoryview(self.buffer)
+        self.start = 0
+        self.scan = 0
+        self.end = 0
+        self.discarding = False
+        self.errors = collections.Counter() # type: collections.Counter[str]
+
+    def get_buffer(self) -> memoryview:
+        if self.start == self.end:
+            self.start = self.scan = self.end = 0
+        elif self.start:
+            n = self.end - self.start
+            self.view[:n] = self.view[self.start:self.end]
+            self.scan -= self.start
+            self.start = 0
+            self.end = n
+        return self.view[self.end:]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self.end += nbytes
+
+    def feed(self, data: bytes) -> List[Line]:
+        data = memoryview(data)
+        lines = []
+        while data:
+            buf = self.get_buffer()
+            n = min(len(buf), len(data))
+            buf[:n] = data[:n]
+            data = data[n:]
+            self.buffer_updated(n)
+            while True:
+                try:
+                    lines.append(next(self))
+                except StopIteration:
+                    break
+                except ValueError as e:
+                    self.errors[str(e)] += 1
+        return lines
+
+    def __iter__(self) -> 'LineReader':
+        return self
+
+    def __next__(self) -> Line:
+        buffer = self.buffer
+        while True:
+            nl = buffer.find(b'\n', self.scan, self.end)
+            if nl < 0:
+                if self.discarding:
+                    self.start = self.scan = self.end
+                elif self.end - self.start >= self.max_length:
+                    self.discarding = True
+                    self.start = self.scan = self.end
+                    raise ValueError(LINE_TOO_LONG)
+                else:
+                    self.scan = self.end
+                raise StopIteration
+
+            start = self.start
+            self.start = self.scan = nl + 1
+            if self.discarding:
+                self.discarding = False
+                continue
+            if nl + 1 - start > self.max_length:
+                raise ValueError(LINE_TOO_LONG)
+            end = nl
+            if end > start and buffer[end - 1] == 13:
+                end -= 1
+            elif self.require_crlf:
+                raise ValueError(MISSING_CRLF)
+            if end > start:
+                line = self.stack.try_decode(bytes(self.view[start:end]))
+                if line is None:
+                    raise ValueError(EMPTY_COMMAND)
+                return line
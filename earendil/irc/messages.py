@@ -5,14 +5,64 @@
 # IN THE CODEGEN DIRECTORY, AND RE-GEN  #
 #########################################
 
+import copy
+import functools
 import typing
-from .line import Line
+from .line import Line, LineParser, LineTemplate, check_middle, fused_stack, intern_commands
 
 #
 # This file has been generated from the Earendil IRC Protocol Specification,
 # version 0.0
 #
 
+class Source(str):
+    """
+    A decoded message source. Like the Prefix it comes from, it splits into
+    ``nick``, ``user`` and ``host`` the first time any of them is asked for.
+    Sources decoded from the wire come from ``decode_source``, so every
+    message from the same prefix shares one Source and one split.
+    """
+
+    @functools.cached_property
+    def _parts(self) -> typing.Tuple[str, typing.Optional[str], typing.Optional[str]]:
+        nick, at, host = self.partition('@')
+        nick, bang, user = nick.partition('!')
+        return str(nick), str(user) if bang else None, str(host) if at else None
+
+    @property
+    def nick(self) -> str:
+        return self._parts[0]
+
+    @property
+    def user(self) -> typing.Optional[str]:
+        return self._parts[1]
+
+    @property
+    def host(self) -> typing.Optional[str]:
+        return self._parts[2]
+
+# the default decode everywhere in this module; sources it decodes are
+# cached on their bytes alone, whichever entry point they came through
+def decode_utf8(b: bytes) -> str:
+    return b.decode('utf-8')
+
+@functools.lru_cache(maxsize=4096)
+def _decode_utf8_source(source: bytes) -> Source:
+    return Source(source.decode('utf-8'))
+
+@functools.lru_cache(maxsize=4096)
+def _decode_source(source: bytes, decode: typing.Callable[[bytes], str]) -> Source:
+    return Source(decode(source))
+
+def decode_source(source: bytes, decode: typing.Callable[[bytes], str] = decode_utf8) -> Source:
+    if decode is decode_utf8:
+        return _decode_utf8_source(source)
+    try:
+        hash(decode)
+    except TypeError:
+        return Source(decode(source))
+    return _decode_source(source, decode)
+
 class Message:
     __slots__ = ['source']
 
@@ -20,19 +70,107 @@ class Message:
         raise NotImplementedError('Message.to_line')
 
     def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode('utf-8')) -> bytes:
-        return self.to_line().to_raw()
+        return self.to_line(encode).to_raw()
+
+    def template(self, field: str, encode: typing.Callable[[str], bytes] = lambda s: s.encode('utf-8')) -> 'MessageTemplate':
+        return MessageTemplate(self, field, encode)
 
+    # with lazy=True, the result is one of the Lazy* classes, and any
+    # decoding errors are raised when the bad field is first read
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode('utf-8')) -> 'Message':
-        global from_lines_by_verb
-        try:
-            return from_lines_by_verb[line.command](line, decode)
-        except Exception:
-            return Unknown.from_line(line, decode)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8, lazy: bool = False) -> 'Message':
+        global from_lines_by_verb, lazy_from_lines_by_verb
+        parse = (lazy_from_lines_by_verb if lazy else from_lines_by_verb).get(line.command)
+        if parse is not None:
+            # a wrong verb or argument count comes back as None; only
+            # failures to decode an argument raise
+            try:
+                msg = parse(line, decode)
+            except Exception:
+                msg = None
+            if msg is not None:
+                return msg
+        return Unknown.from_line(line, decode)
 
     @classmethod
-    def from_raw(cls, line: bytes, decode: typing.Callable[[bytes], str] = lambda b: b.decode('utf-8')) -> 'Message':
-        return cls.from_line(Line.from_raw(line), decode)
+    def from_raw(cls, line: bytes, decode: typing.Callable[[bytes], str] = decode_utf8, lazy: bool = False) -> 'Message':
+        return cls.from_line(Line.from_raw(line), decode, lazy)
+
+class LazyField:
+    """
+    A slot of a generated message class, as seen from its Lazy* variant.
+    The slot holds the raw argument bytes until the first read, which
+    parses them with ``parse(decode, raw)`` and stores the result in their
+    place. (No parsed value is ever bytes.)
+    """
+
+    __slots__ = ['slot', 'parse']
+
+    def __init__(self, slot: typing.Any, parse: typing.Callable[[typing.Callable[[bytes], str], bytes], typing.Any]) -> None:
+        self.slot = slot
+        self.parse = parse
+
+    def __get__(self, obj: typing.Any, cls: typing.Optional[type] = None) -> typing.Any:
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, cls)
+        if isinstance(value, bytes):
+            value = self.parse(obj._decode, value)
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj: typing.Any, value: typing.Any) -> None:
+        self.slot.__set__(obj, value)
+
+    # the field's value, or its raw bytes if they fail to decode
+    def peek(self, obj: typing.Any) -> typing.Any:
+        try:
+            return self.__get__(obj)
+        except ValueError:
+            return self.slot.__get__(obj)
+
+lazy_source = LazyField(Message.source, lambda decode, b: decode_source(b, decode))
+
+# the tail of the generated to_raw methods: place the arguments whose
+# position depended on which optional arguments were present, then quote
+# and terminate the line the same way Line.to_raw would
+def finish_raw(pieces: typing.List[bytes], rest: typing.Sequence[bytes] = ()) -> bytes:
+    if rest:
+        n = len(rest) - 1
+        for i in range(n):
+            check_middle(rest[i])
+            pieces += (b' ', rest[i])
+        last = rest[n]
+        pieces += (b' :' if not last or 32 in last or 9 in last else b' ', last)
+    s = b''.join(pieces)
+    if fused_stack.special.search(s) is not None:
+        s = fused_stack.quote(s)
+    return s + b'\r\n'
+
+class MessageTemplate:
+    """
+    A message serialised once with one string field left open, for sending
+    the same message to many targets. ``render(value)`` returns the wire
+    bytes with ``value`` in place of that field.
+    """
+
+    def __init__(self, message: Message, field: str, encode: typing.Callable[[str], bytes] = lambda s: s.encode('utf-8')) -> None:
+        message = copy.copy(message)
+        placeholder = 'placeholder'
+        while True:
+            setattr(message, field, placeholder)
+            line = message.to_line(encode)
+            indices = [i for i, arg in enumerate(line.arguments) if arg == encode(placeholder)]
+            if len(indices) < 2:
+                break
+            placeholder += '_'
+        if not indices:
+            raise ValueError('{} is not a single string argument'.format(field))
+        self.template = LineTemplate(line, indices[0])
+        self.encode = encode
+
+    def render(self, value: str) -> bytes:
+        return self.template.render(self.encode(value))
 
 class Unknown(Message):
     __slots__ = ['command', 'arguments']
@@ -49,11 +187,11 @@ class Unknown(Message):
         return Line(source, self.command, self.arguments)
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode('utf-8')) -> Message:
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
         source = None
         if line.source is not None:
             try:
-                source = decode(line.source)
+                source = decode_source(line.source, decode)
             except Exception:
                 pass
         return cls(source, line.command, line.arguments)
@@ -61,6 +199,35 @@ class Unknown(Message):
     def __repr__(self) -> str:
         return "Unknown(source={}, command={}, arguments={})".format(repr(self.source), repr(self.command), repr(self.arguments))
 
+BAD_ARGUMENT_COUNT = 'bad-argument-count'
+DECODE_FAILED = 'decode-failed'
+
+# LineParser, one layer up: try_parse returns either a Message or an error
+# code (the LineParser ones, BAD_ARGUMENT_COUNT or DECODE_FAILED), and never
+# raises. Unrecognised verbs are not an error, and come back as Unknown.
+class MessageParser(LineParser):
+    def __init__(self, profile: str = 'rfc1459-ctcp', decode: typing.Callable[[bytes], str] = decode_utf8) -> None:
+        super().__init__(profile)
+        self.decode = decode
+
+    def try_parse(self, line: bytes) -> typing.Union[Message, str]: # type: ignore
+        global from_lines_by_verb
+        parsed = super().try_parse(line)
+        if isinstance(parsed, str):
+            return parsed
+        parse = from_lines_by_verb.get(parsed.command)
+        if parse is None:
+            return Unknown.from_line(parsed, self.decode)
+        try:
+            msg = parse(parsed, self.decode)
+        except Exception:
+            self.errors[DECODE_FAILED] += 1
+            return DECODE_FAILED
+        if msg is None:
+            self.errors[BAD_ARGUMENT_COUNT] += 1
+            return BAD_ARGUMENT_COUNT
+        return msg
+
 #
 # make-mod.header.py above ^
 # make-mod.py generated code below v
@@ -83,18 +250,26 @@ class Passwd(Message):
         return 'Passwd(source={}, password={})'.format(repr(self.source), repr(self.password))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'PASS':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 1):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         password = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, password=password)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -105,6 +280,17 @@ class Passwd(Message):
         arguments.append(encode(self.password))
         return Line(source, b'PASS', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'PASS')
+        arg = encode(self.password)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class Nick(Message):
     """
@@ -121,18 +307,26 @@ class Nick(Message):
         return 'Nick(source={}, nickname={})'.format(repr(self.source), repr(self.nickname))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'NICK':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 1):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         nickname = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, nickname=nickname)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -143,6 +337,17 @@ class Nick(Message):
         arguments.append(encode(self.nickname))
         return Line(source, b'NICK', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'NICK')
+        arg = encode(self.nickname)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class User(Message):
     """
@@ -161,14 +366,21 @@ class User(Message):
         return 'User(source={}, user={}, mode={}, realname={})'.format(repr(self.source), repr(self.user), repr(self.mode), repr(self.realname))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'USER':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         user = decode(line.arguments[i])
         i += 1
@@ -178,7 +390,8 @@ class User(Message):
         i += 1
         realname = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, user=user, mode=mode, realname=realname)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -192,6 +405,22 @@ class User(Message):
         arguments.append(encode(self.realname))
         return Line(source, b'USER', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'USER')
+        arg = encode(self.user)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces += (b' ', encode(str(self.mode)))
+        pieces.append(b' *')
+        arg = encode(self.realname)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class Oper(Message):
     """
@@ -209,20 +438,28 @@ class Oper(Message):
         return 'Oper(source={}, name={}, password={})'.format(repr(self.source), repr(self.name), repr(self.password))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'OPER':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         name = decode(line.arguments[i])
         i += 1
         password = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, name=name, password=password)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -234,6 +471,20 @@ class Oper(Message):
         arguments.append(encode(self.password))
         return Line(source, b'OPER', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'OPER')
+        arg = encode(self.name)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.password)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class Mode(Message):
     """
@@ -253,20 +504,28 @@ class Mode(Message):
         return 'Mode(source={}, name={}, mode={})'.format(repr(self.source), repr(self.name), repr(self.mode))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'MODE':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         name = decode(line.arguments[i])
         i += 1
         mode = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, name=name, mode=mode)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -278,6 +537,20 @@ class Mode(Message):
         arguments.append(encode(self.mode))
         return Line(source, b'MODE', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'MODE')
+        arg = encode(self.name)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.mode)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class Service(Message):
     """
@@ -297,14 +570,21 @@ class Service(Message):
         return 'Service(source={}, nickname={}, distribution={}, type={}, info={})'.format(repr(self.source), repr(self.nickname), repr(self.distribution), repr(self.type), repr(self.info))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'SERVICE':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 6):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         nickname = decode(line.arguments[i])
         i += 1
@@ -318,7 +598,8 @@ class Service(Message):
         i += 1
         info = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, nickname=nickname, distribution=distribution, type=type, info=info)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -334,6 +615,26 @@ class Service(Message):
         arguments.append(encode(self.info))
         return Line(source, b'SERVICE', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'SERVICE')
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' *')
+        arg = encode(self.distribution)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces += (b' ', encode(str(self.type)))
+        pieces.append(b' 0')
+        arg = encode(self.info)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class Quit(Message):
     """
@@ -350,21 +651,29 @@ class Quit(Message):
         return 'Quit(source={}, message={})'.format(repr(self.source), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'QUIT':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) <= 1):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         if len(line.arguments) > 0:
             message = decode(line.arguments[i])
             i += 1
         else:
             message = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -376,6 +685,18 @@ class Quit(Message):
             arguments.append(encode(self.message))
         return Line(source, b'QUIT', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'QUIT')
+        rest = []
+        if self.message is not None:
+            rest.append(encode(self.message))
+        return finish_raw(pieces, rest)
+
 
 class SQuit(Message):
     """
@@ -393,20 +714,28 @@ class SQuit(Message):
         return 'SQuit(source={}, server={}, comment={})'.format(repr(self.source), repr(self.server), repr(self.comment))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'SQUIT':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         server = decode(line.arguments[i])
         i += 1
         comment = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, server=server, comment=comment)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -418,10 +747,24 @@ class SQuit(Message):
         arguments.append(encode(self.comment))
         return Line(source, b'SQUIT', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'SQUIT')
+        arg = encode(self.server)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.comment)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class ChannelJoin(Message):
     """
-    ``JOIN <channels,> [keys,]``
+    ``JOIN <#channels,> [keys,]``
     """
 
     __slots__ = ['channels', 'keys']
@@ -435,14 +778,21 @@ class ChannelJoin(Message):
         return 'ChannelJoin(source={}, channels={}, keys={})'.format(repr(self.source), repr(self.channels), repr(self.keys))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'JOIN':
-            raise ValueError("incorrect verb")
+            return None
         if not (1 <= len(line.arguments) <= 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         channels = [decode(x) for x in line.arguments[i].split(b",")]
         i += 1
@@ -451,7 +801,8 @@ class ChannelJoin(Message):
             i += 1
         else:
             keys = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, channels=channels, keys=keys)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -464,10 +815,23 @@ class ChannelJoin(Message):
             arguments.append(b",".join(encode(x) for x in self.keys))
         return Line(source, b'JOIN', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'JOIN')
+        rest = []
+        rest.append(b",".join(encode(x) for x in self.channels))
+        if self.keys is not None:
+            rest.append(b",".join(encode(x) for x in self.keys))
+        return finish_raw(pieces, rest)
+
 
 class ChannelPart(Message):
     """
-    ``PART <channels,> [message]``
+    ``PART <#channels,> [message]``
     """
 
     __slots__ = ['channels', 'message']
@@ -481,14 +845,21 @@ class ChannelPart(Message):
         return 'ChannelPart(source={}, channels={}, message={})'.format(repr(self.source), repr(self.channels), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'PART':
-            raise ValueError("incorrect verb")
+            return None
         if not (1 <= len(line.arguments) <= 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         channels = [decode(x) for x in line.arguments[i].split(b",")]
         i += 1
@@ -497,7 +868,8 @@ class ChannelPart(Message):
             i += 1
         else:
             message = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, channels=channels, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -510,10 +882,23 @@ class ChannelPart(Message):
             arguments.append(encode(self.message))
         return Line(source, b'PART', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'PART')
+        rest = []
+        rest.append(b",".join(encode(x) for x in self.channels))
+        if self.message is not None:
+            rest.append(encode(self.message))
+        return finish_raw(pieces, rest)
+
 
 class Topic(Message):
     """
-    ``TOPIC <channel> [topic]``
+    ``TOPIC <#channel> [topic]``
     """
 
     __slots__ = ['channel', 'topic']
@@ -527,14 +912,21 @@ class Topic(Message):
         return 'Topic(source={}, channel={}, topic={})'.format(repr(self.source), repr(self.channel), repr(self.topic))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'TOPIC':
-            raise ValueError("incorrect verb")
+            return None
         if not (1 <= len(line.arguments) <= 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         channel = decode(line.arguments[i])
         i += 1
@@ -543,7 +935,8 @@ class Topic(Message):
             i += 1
         else:
             topic = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, channel=channel, topic=topic)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -556,10 +949,23 @@ class Topic(Message):
             arguments.append(encode(self.topic))
         return Line(source, b'TOPIC', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'TOPIC')
+        rest = []
+        rest.append(encode(self.channel))
+        if self.topic is not None:
+            rest.append(encode(self.topic))
+        return finish_raw(pieces, rest)
+
 
 class Names(Message):
     """
-    ``NAMES [channels,] [target]``
+    ``NAMES [#channels,] [target]``
     """
 
     __slots__ = ['channels', 'target']
@@ -573,14 +979,21 @@ class Names(Message):
         return 'Names(source={}, channels={}, target={})'.format(repr(self.source), repr(self.channels), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'NAMES':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) <= 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         if len(line.arguments) > 0:
             channels = [decode(x) for x in line.arguments[i].split(b",")]
@@ -592,7 +1005,8 @@ class Names(Message):
             i += 1
         else:
             target = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, channels=channels, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -606,10 +1020,24 @@ class Names(Message):
             arguments.append(encode(self.target))
         return Line(source, b'NAMES', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'NAMES')
+        rest = []
+        if self.channels is not None:
+            rest.append(b",".join(encode(x) for x in self.channels))
+        if self.target is not None:
+            rest.append(encode(self.target))
+        return finish_raw(pieces, rest)
+
 
 class List(Message):
     """
-    ``LIST [channels,] [target]``
+    ``LIST [#channels,] [target]``
     """
 
     __slots__ = ['channels', 'target']
@@ -623,14 +1051,21 @@ class List(Message):
         return 'List(source={}, channels={}, target={})'.format(repr(self.source), repr(self.channels), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'LIST':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) <= 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         if len(line.arguments) > 0:
             channels = [decode(x) for x in line.arguments[i].split(b",")]
@@ -642,7 +1077,8 @@ class List(Message):
             i += 1
         else:
             target = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, channels=channels, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -656,10 +1092,24 @@ class List(Message):
             arguments.append(encode(self.target))
         return Line(source, b'LIST', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'LIST')
+        rest = []
+        if self.channels is not None:
+            rest.append(b",".join(encode(x) for x in self.channels))
+        if self.target is not None:
+            rest.append(encode(self.target))
+        return finish_raw(pieces, rest)
+
 
 class Invite(Message):
     """
-    ``INVITE <nickname> <channel>``
+    ``INVITE <nickname> <#channel>``
     """
 
     __slots__ = ['nickname', 'channel']
@@ -673,20 +1123,28 @@ class Invite(Message):
         return 'Invite(source={}, nickname={}, channel={})'.format(repr(self.source), repr(self.nickname), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'INVITE':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         nickname = decode(line.arguments[i])
         i += 1
         channel = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, nickname=nickname, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -698,6 +1156,20 @@ class Invite(Message):
         arguments.append(encode(self.channel))
         return Line(source, b'INVITE', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'INVITE')
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class Kick(Message):
     """
@@ -716,14 +1188,21 @@ class Kick(Message):
         return 'Kick(source={}, channels={}, users={}, comment={})'.format(repr(self.source), repr(self.channels), repr(self.users), repr(self.comment))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'KICK':
-            raise ValueError("incorrect verb")
+            return None
         if not (2 <= len(line.arguments) <= 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         channels = [decode(x) for x in line.arguments[i].split(b",")]
         i += 1
@@ -734,7 +1213,8 @@ class Kick(Message):
             i += 1
         else:
             comment = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, channels=channels, users=users, comment=comment)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -748,6 +1228,22 @@ class Kick(Message):
             arguments.append(encode(self.comment))
         return Line(source, b'KICK', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'KICK')
+        rest = []
+        arg = b",".join(encode(x) for x in self.channels)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        rest.append(b",".join(encode(x) for x in self.users))
+        if self.comment is not None:
+            rest.append(encode(self.comment))
+        return finish_raw(pieces, rest)
+
 
 class Privmsg(Message):
     """
@@ -765,20 +1261,28 @@ class Privmsg(Message):
         return 'Privmsg(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'PRIVMSG':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -790,6 +1294,20 @@ class Privmsg(Message):
         arguments.append(encode(self.message))
         return Line(source, b'PRIVMSG', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'PRIVMSG')
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class Notice(Message):
     """
@@ -807,20 +1325,28 @@ class Notice(Message):
         return 'Notice(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'NOTICE':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -832,6 +1358,20 @@ class Notice(Message):
         arguments.append(encode(self.message))
         return Line(source, b'NOTICE', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'NOTICE')
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class Motd(Message):
     """
@@ -848,21 +1388,29 @@ class Motd(Message):
         return 'Motd(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'MOTD':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) <= 1):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         if len(line.arguments) > 0:
             target = decode(line.arguments[i])
             i += 1
         else:
             target = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -874,6 +1422,18 @@ class Motd(Message):
             arguments.append(encode(self.target))
         return Line(source, b'MOTD', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'MOTD')
+        rest = []
+        if self.target is not None:
+            rest.append(encode(self.target))
+        return finish_raw(pieces, rest)
+
 
 class Lusers(Message):
     """
@@ -891,14 +1451,21 @@ class Lusers(Message):
         return 'Lusers(source={}, mask={}, target={})'.format(repr(self.source), repr(self.mask), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'LUSERS':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) <= 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         if len(line.arguments) > 0:
             mask = decode(line.arguments[i])
@@ -910,7 +1477,8 @@ class Lusers(Message):
             i += 1
         else:
             target = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, mask=mask, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -924,6 +1492,20 @@ class Lusers(Message):
             arguments.append(encode(self.target))
         return Line(source, b'LUSERS', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'LUSERS')
+        rest = []
+        if self.mask is not None:
+            rest.append(encode(self.mask))
+        if self.target is not None:
+            rest.append(encode(self.target))
+        return finish_raw(pieces, rest)
+
 
 class Version(Message):
     """
@@ -940,21 +1522,29 @@ class Version(Message):
         return 'Version(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'VERSION':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) <= 1):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         if len(line.arguments) > 0:
             target = decode(line.arguments[i])
             i += 1
         else:
             target = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -966,6 +1556,18 @@ class Version(Message):
             arguments.append(encode(self.target))
         return Line(source, b'VERSION', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'VERSION')
+        rest = []
+        if self.target is not None:
+            rest.append(encode(self.target))
+        return finish_raw(pieces, rest)
+
 
 class Stats(Message):
     """
@@ -983,14 +1585,21 @@ class Stats(Message):
         return 'Stats(source={}, query={}, target={})'.format(repr(self.source), repr(self.query), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'STATS':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) <= 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         if len(line.arguments) > 0:
             query = decode(line.arguments[i])
@@ -1002,7 +1611,8 @@ class Stats(Message):
             i += 1
         else:
             target = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, query=query, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1016,6 +1626,20 @@ class Stats(Message):
             arguments.append(encode(self.target))
         return Line(source, b'STATS', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'STATS')
+        rest = []
+        if self.query is not None:
+            rest.append(encode(self.query))
+        if self.target is not None:
+            rest.append(encode(self.target))
+        return finish_raw(pieces, rest)
+
 
 class Links(Message):
     """
@@ -1033,14 +1657,21 @@ class Links(Message):
         return 'Links(source={}, server={}, mask={})'.format(repr(self.source), repr(self.server), repr(self.mask))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'LINKS':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) <= 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = len(line.arguments) - 1
         if len(line.arguments) > 0:
             server = decode(line.arguments[i])
@@ -1052,7 +1683,8 @@ class Links(Message):
             i -= 1
         else:
             mask = None
-        assert i == -1
+        if i != -1:
+            return None
         return cls(source=source, server=server, mask=mask)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1066,6 +1698,20 @@ class Links(Message):
             arguments.append(encode(self.mask))
         return Line(source, b'LINKS', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'LINKS')
+        rest = []
+        if self.server is not None:
+            rest.append(encode(self.server))
+        if self.mask is not None:
+            rest.append(encode(self.mask))
+        return finish_raw(pieces, rest)
+
 
 class Time(Message):
     """
@@ -1082,21 +1728,29 @@ class Time(Message):
         return 'Time(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'TIME':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) <= 1):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         if len(line.arguments) > 0:
             target = decode(line.arguments[i])
             i += 1
         else:
             target = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1108,6 +1762,18 @@ class Time(Message):
             arguments.append(encode(self.target))
         return Line(source, b'TIME', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'TIME')
+        rest = []
+        if self.target is not None:
+            rest.append(encode(self.target))
+        return finish_raw(pieces, rest)
+
 
 class ServerConnect(Message):
     """
@@ -1126,14 +1792,21 @@ class ServerConnect(Message):
         return 'ServerConnect(source={}, target={}, port={}, remote={})'.format(repr(self.source), repr(self.target), repr(self.port), repr(self.remote))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'CONNECT':
-            raise ValueError("incorrect verb")
+            return None
         if not (2 <= len(line.arguments) <= 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -1144,7 +1817,8 @@ class ServerConnect(Message):
             i += 1
         else:
             remote = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, port=port, remote=remote)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1158,6 +1832,22 @@ class ServerConnect(Message):
             arguments.append(encode(self.remote))
         return Line(source, b'CONNECT', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'CONNECT')
+        rest = []
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        rest.append(encode(str(self.port)))
+        if self.remote is not None:
+            rest.append(encode(self.remote))
+        return finish_raw(pieces, rest)
+
 
 class Trace(Message):
     """
@@ -1174,21 +1864,29 @@ class Trace(Message):
         return 'Trace(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'TRACE':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) <= 1):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         if len(line.arguments) > 0:
             target = decode(line.arguments[i])
             i += 1
         else:
             target = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1200,6 +1898,18 @@ class Trace(Message):
             arguments.append(encode(self.target))
         return Line(source, b'TRACE', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'TRACE')
+        rest = []
+        if self.target is not None:
+            rest.append(encode(self.target))
+        return finish_raw(pieces, rest)
+
 
 class Admin(Message):
     """
@@ -1216,21 +1926,29 @@ class Admin(Message):
         return 'Admin(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'ADMIN':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) <= 1):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         if len(line.arguments) > 0:
             target = decode(line.arguments[i])
             i += 1
         else:
             target = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1242,6 +1960,18 @@ class Admin(Message):
             arguments.append(encode(self.target))
         return Line(source, b'ADMIN', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'ADMIN')
+        rest = []
+        if self.target is not None:
+            rest.append(encode(self.target))
+        return finish_raw(pieces, rest)
+
 
 class Info(Message):
     """
@@ -1258,21 +1988,29 @@ class Info(Message):
         return 'Info(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'INFO':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) <= 1):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         if len(line.arguments) > 0:
             target = decode(line.arguments[i])
             i += 1
         else:
             target = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1284,6 +2022,18 @@ class Info(Message):
             arguments.append(encode(self.target))
         return Line(source, b'INFO', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'INFO')
+        rest = []
+        if self.target is not None:
+            rest.append(encode(self.target))
+        return finish_raw(pieces, rest)
+
 
 class ServList(Message):
     """
@@ -1301,14 +2051,21 @@ class ServList(Message):
         return 'ServList(source={}, mask={}, type={})'.format(repr(self.source), repr(self.mask), repr(self.type))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'SERVLIST':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) <= 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         if len(line.arguments) > 0:
             mask = decode(line.arguments[i])
@@ -1320,7 +2077,8 @@ class ServList(Message):
             i += 1
         else:
             type = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, mask=mask, type=type)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1334,6 +2092,20 @@ class ServList(Message):
             arguments.append(encode(self.type))
         return Line(source, b'SERVLIST', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'SERVLIST')
+        rest = []
+        if self.mask is not None:
+            rest.append(encode(self.mask))
+        if self.type is not None:
+            rest.append(encode(self.type))
+        return finish_raw(pieces, rest)
+
 
 class SQuery(Message):
     """
@@ -1351,20 +2123,28 @@ class SQuery(Message):
         return 'SQuery(source={}, servicename={}, text={})'.format(repr(self.source), repr(self.servicename), repr(self.text))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'SQUERY':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         servicename = decode(line.arguments[i])
         i += 1
         text = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, servicename=servicename, text=text)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1376,6 +2156,20 @@ class SQuery(Message):
         arguments.append(encode(self.text))
         return Line(source, b'SQUERY', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'SQUERY')
+        arg = encode(self.servicename)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.text)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class Who(Message):
     """
@@ -1393,14 +2187,21 @@ class Who(Message):
         return 'Who(source={}, mask={}, operators={})'.format(repr(self.source), repr(self.mask), repr(self.operators))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'WHO':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) <= 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         if len(line.arguments) > 0:
             mask = decode(line.arguments[i])
@@ -1412,7 +2213,8 @@ class Who(Message):
             i += 1
         else:
             operators = False
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, mask=mask, operators=operators)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1426,6 +2228,20 @@ class Who(Message):
             arguments.append(b'o')
         return Line(source, b'WHO', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'WHO')
+        rest = []
+        if self.mask is not None:
+            rest.append(encode(self.mask))
+        if self.operators is not None:
+            rest.append(b'o')
+        return finish_raw(pieces, rest)
+
 
 class WhoIs(Message):
     """
@@ -1443,14 +2259,21 @@ class WhoIs(Message):
         return 'WhoIs(source={}, target={}, masks={})'.format(repr(self.source), repr(self.target), repr(self.masks))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'WHOIS':
-            raise ValueError("incorrect verb")
+            return None
         if not (1 <= len(line.arguments) <= 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         if len(line.arguments) > 1:
             target = decode(line.arguments[i])
@@ -1459,7 +2282,8 @@ class WhoIs(Message):
             target = None
         masks = [decode(x) for x in line.arguments[i].split(b",")]
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, masks=masks)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1472,6 +2296,21 @@ class WhoIs(Message):
         arguments.append(b",".join(encode(x) for x in self.masks))
         return Line(source, b'WHOIS', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'WHOIS')
+        if self.target is not None:
+            arg = encode(self.target)
+            check_middle(arg)
+            pieces += (b' ', arg)
+        arg = b",".join(encode(x) for x in self.masks)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class WhoWas(Message):
     """
@@ -1490,14 +2329,21 @@ class WhoWas(Message):
         return 'WhoWas(source={}, nicknames={}, count={}, target={})'.format(repr(self.source), repr(self.nicknames), repr(self.count), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'WHOWAS':
-            raise ValueError("incorrect verb")
+            return None
         if not (1 <= len(line.arguments) <= 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         nicknames = [decode(x) for x in line.arguments[i].split(b",")]
         i += 1
@@ -1511,7 +2357,8 @@ class WhoWas(Message):
             i += 1
         else:
             target = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, nicknames=nicknames, count=count, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1526,6 +2373,21 @@ class WhoWas(Message):
             arguments.append(encode(self.target))
         return Line(source, b'WHOWAS', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'WHOWAS')
+        rest = []
+        rest.append(b",".join(encode(x) for x in self.nicknames))
+        if self.count is not None:
+            rest.append(encode(str(self.count)))
+        if self.target is not None:
+            rest.append(encode(self.target))
+        return finish_raw(pieces, rest)
+
 
 class Kill(Message):
     """
@@ -1543,20 +2405,28 @@ class Kill(Message):
         return 'Kill(source={}, nickname={}, comment={})'.format(repr(self.source), repr(self.nickname), repr(self.comment))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'KILL':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         nickname = decode(line.arguments[i])
         i += 1
         comment = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, nickname=nickname, comment=comment)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1568,6 +2438,20 @@ class Kill(Message):
         arguments.append(encode(self.comment))
         return Line(source, b'KILL', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'KILL')
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.comment)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class Ping(Message):
     """
@@ -1585,14 +2469,21 @@ class Ping(Message):
         return 'Ping(source={}, server1={}, server2={})'.format(repr(self.source), repr(self.server1), repr(self.server2))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'PING':
-            raise ValueError("incorrect verb")
+            return None
         if not (1 <= len(line.arguments) <= 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         server1 = decode(line.arguments[i])
         i += 1
@@ -1601,7 +2492,8 @@ class Ping(Message):
             i += 1
         else:
             server2 = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, server1=server1, server2=server2)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1614,6 +2506,19 @@ class Ping(Message):
             arguments.append(encode(self.server2))
         return Line(source, b'PING', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'PING')
+        rest = []
+        rest.append(encode(self.server1))
+        if self.server2 is not None:
+            rest.append(encode(self.server2))
+        return finish_raw(pieces, rest)
+
 
 class Pong(Message):
     """
@@ -1631,14 +2536,21 @@ class Pong(Message):
         return 'Pong(source={}, server={}, server2={})'.format(repr(self.source), repr(self.server), repr(self.server2))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'PONG':
-            raise ValueError("incorrect verb")
+            return None
         if not (1 <= len(line.arguments) <= 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         server = decode(line.arguments[i])
         i += 1
@@ -1647,7 +2559,8 @@ class Pong(Message):
             i += 1
         else:
             server2 = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, server=server, server2=server2)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1660,6 +2573,19 @@ class Pong(Message):
             arguments.append(encode(self.server2))
         return Line(source, b'PONG', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'PONG')
+        rest = []
+        rest.append(encode(self.server))
+        if self.server2 is not None:
+            rest.append(encode(self.server2))
+        return finish_raw(pieces, rest)
+
 
 class Error(Message):
     """
@@ -1676,18 +2602,26 @@ class Error(Message):
         return 'Error(source={}, message={})'.format(repr(self.source), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'ERROR':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 1):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1698,6 +2632,17 @@ class Error(Message):
         arguments.append(encode(self.message))
         return Line(source, b'ERROR', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'ERROR')
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class Away(Message):
     """
@@ -1714,21 +2659,29 @@ class Away(Message):
         return 'Away(source={}, text={})'.format(repr(self.source), repr(self.text))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'AWAY':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) <= 1):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         if len(line.arguments) > 0:
             text = decode(line.arguments[i])
             i += 1
         else:
             text = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, text=text)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1740,6 +2693,18 @@ class Away(Message):
             arguments.append(encode(self.text))
         return Line(source, b'AWAY', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'AWAY')
+        rest = []
+        if self.text is not None:
+            rest.append(encode(self.text))
+        return finish_raw(pieces, rest)
+
 
 class Rehash(Message):
     """
@@ -1753,14 +2718,21 @@ class Rehash(Message):
         return 'Rehash(source={})'.format(repr(self.source))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'REHASH':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 0):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         return cls(source=source)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1769,6 +2741,15 @@ class Rehash(Message):
             source = encode(self.source)
         return Line(source, b'REHASH')
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'REHASH')
+        return finish_raw(pieces)
+
 
 class Die(Message):
     """
@@ -1782,14 +2763,21 @@ class Die(Message):
         return 'Die(source={})'.format(repr(self.source))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'DIE':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 0):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         return cls(source=source)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1798,6 +2786,15 @@ class Die(Message):
             source = encode(self.source)
         return Line(source, b'DIE')
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'DIE')
+        return finish_raw(pieces)
+
 
 class Restart(Message):
     """
@@ -1811,14 +2808,21 @@ class Restart(Message):
         return 'Restart(source={})'.format(repr(self.source))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'RESTART':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 0):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         return cls(source=source)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1827,6 +2831,15 @@ class Restart(Message):
             source = encode(self.source)
         return Line(source, b'RESTART')
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'RESTART')
+        return finish_raw(pieces)
+
 
 class Summon(Message):
     """
@@ -1845,14 +2858,21 @@ class Summon(Message):
         return 'Summon(source={}, user={}, target={}, channel={})'.format(repr(self.source), repr(self.user), repr(self.target), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'SUMMON':
-            raise ValueError("incorrect verb")
+            return None
         if not (1 <= len(line.arguments) <= 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         user = decode(line.arguments[i])
         i += 1
@@ -1866,7 +2886,8 @@ class Summon(Message):
             i += 1
         else:
             channel = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, user=user, target=target, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1881,6 +2902,21 @@ class Summon(Message):
             arguments.append(encode(self.channel))
         return Line(source, b'SUMMON', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'SUMMON')
+        rest = []
+        rest.append(encode(self.user))
+        if self.target is not None:
+            rest.append(encode(self.target))
+        if self.channel is not None:
+            rest.append(encode(self.channel))
+        return finish_raw(pieces, rest)
+
 
 class Users(Message):
     """
@@ -1897,21 +2933,29 @@ class Users(Message):
         return 'Users(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'USERS':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) <= 1):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         if len(line.arguments) > 0:
             target = decode(line.arguments[i])
             i += 1
         else:
             target = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1923,6 +2967,18 @@ class Users(Message):
             arguments.append(encode(self.target))
         return Line(source, b'USERS', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'USERS')
+        rest = []
+        if self.target is not None:
+            rest.append(encode(self.target))
+        return finish_raw(pieces, rest)
+
 
 class WallOps(Message):
     """
@@ -1939,18 +2995,26 @@ class WallOps(Message):
         return 'WallOps(source={}, message={})'.format(repr(self.source), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'WALLOPS':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 1):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -1961,6 +3025,17 @@ class WallOps(Message):
         arguments.append(encode(self.message))
         return Line(source, b'WALLOPS', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'WALLOPS')
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class UserHost(Message):
     """
@@ -1979,18 +3054,26 @@ class UserHost(Message):
         return 'UserHost(source={}, nickname={})'.format(repr(self.source), repr(self.nickname))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'USERHOST':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 1):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         nickname = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, nickname=nickname)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2001,6 +3084,17 @@ class UserHost(Message):
         arguments.append(encode(self.nickname))
         return Line(source, b'USERHOST', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'USERHOST')
+        arg = encode(self.nickname)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class IsOn(Message):
     """
@@ -2019,18 +3113,26 @@ class IsOn(Message):
         return 'IsOn(source={}, nickname={})'.format(repr(self.source), repr(self.nickname))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != b'ISON':
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 1):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         nickname = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, nickname=nickname)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2041,6 +3143,17 @@ class IsOn(Message):
         arguments.append(encode(self.nickname))
         return Line(source, b'ISON', arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b'ISON')
+        arg = encode(self.nickname)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class Welcome(Message):
     """
@@ -2058,20 +3171,28 @@ class Welcome(Message):
         return 'Welcome(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 1:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2083,6 +3204,20 @@ class Welcome(Message):
         arguments.append(encode(self.message))
         return Line(source, b"001", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"001")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class YourHost(Message):
     """
@@ -2100,20 +3235,28 @@ class YourHost(Message):
         return 'YourHost(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 2:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2125,6 +3268,20 @@ class YourHost(Message):
         arguments.append(encode(self.message))
         return Line(source, b"002", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"002")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class Created(Message):
     """
@@ -2142,20 +3299,28 @@ class Created(Message):
         return 'Created(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 3:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2167,6 +3332,20 @@ class Created(Message):
         arguments.append(encode(self.message))
         return Line(source, b"003", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"003")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class MyInfo(Message):
     """
@@ -2184,20 +3363,28 @@ class MyInfo(Message):
         return 'MyInfo(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 4:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2209,6 +3396,20 @@ class MyInfo(Message):
         arguments.append(encode(self.message))
         return Line(source, b"004", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"004")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class Bounce(Message):
     """
@@ -2226,20 +3427,28 @@ class Bounce(Message):
         return 'Bounce(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 5:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2251,6 +3460,20 @@ class Bounce(Message):
         arguments.append(encode(self.message))
         return Line(source, b"005", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"005")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class TraceLinkReply(Message):
     """
@@ -2274,14 +3497,21 @@ class TraceLinkReply(Message):
         return 'TraceLinkReply(source={}, target={}, version={}, destination={}, next={}, protocol_version={}, link_uptime={}, back_send_q={}, up_send_q={})'.format(repr(self.source), repr(self.target), repr(self.version), repr(self.destination), repr(self.next), repr(self.protocol_version), repr(self.link_uptime), repr(self.back_send_q), repr(self.up_send_q))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 200:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 9):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -2301,7 +3531,8 @@ class TraceLinkReply(Message):
         i += 1
         up_send_q = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, version=version, destination=destination, next=next, protocol_version=protocol_version, link_uptime=link_uptime, back_send_q=back_send_q, up_send_q=up_send_q)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2320,6 +3551,39 @@ class TraceLinkReply(Message):
         arguments.append(encode(self.up_send_q))
         return Line(source, b"200", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"200")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' Link')
+        arg = encode(self.version)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.destination)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.next)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.protocol_version)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.link_uptime)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.back_send_q)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.up_send_q)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class TraceConnecting(Message):
     """
@@ -2338,14 +3602,21 @@ class TraceConnecting(Message):
         return 'TraceConnecting(source={}, target={}, klass={}, server={})'.format(repr(self.source), repr(self.target), repr(self.klass), repr(self.server))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 201:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -2355,7 +3626,8 @@ class TraceConnecting(Message):
         i += 1
         server = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, klass=klass, server=server)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2369,6 +3641,24 @@ class TraceConnecting(Message):
         arguments.append(encode(self.server))
         return Line(source, b"201", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"201")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' Try.')
+        arg = encode(self.klass)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.server)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class TraceHandshake(Message):
     """
@@ -2387,14 +3677,21 @@ class TraceHandshake(Message):
         return 'TraceHandshake(source={}, target={}, klass={}, server={})'.format(repr(self.source), repr(self.target), repr(self.klass), repr(self.server))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 202:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -2404,7 +3701,8 @@ class TraceHandshake(Message):
         i += 1
         server = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, klass=klass, server=server)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2418,6 +3716,24 @@ class TraceHandshake(Message):
         arguments.append(encode(self.server))
         return Line(source, b"202", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"202")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' H.S.')
+        arg = encode(self.klass)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.server)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class TraceUnknown(Message):
     """
@@ -2436,14 +3752,21 @@ class TraceUnknown(Message):
         return 'TraceUnknown(source={}, target={}, klass={}, ip={})'.format(repr(self.source), repr(self.target), repr(self.klass), repr(self.ip))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 203:
-            raise ValueError("incorrect verb")
+            return None
         if not (3 <= len(line.arguments) <= 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -2456,7 +3779,8 @@ class TraceUnknown(Message):
             i += 1
         else:
             ip = None
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, klass=klass, ip=ip)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2471,6 +3795,23 @@ class TraceUnknown(Message):
             arguments.append(encode(self.ip))
         return Line(source, b"203", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"203")
+        rest = []
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' ????')
+        rest.append(encode(self.klass))
+        if self.ip is not None:
+            rest.append(encode(self.ip))
+        return finish_raw(pieces, rest)
+
 
 class TraceOperator(Message):
     """
@@ -2489,14 +3830,21 @@ class TraceOperator(Message):
         return 'TraceOperator(source={}, target={}, klass={}, nickname={})'.format(repr(self.source), repr(self.target), repr(self.klass), repr(self.nickname))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 204:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -2506,7 +3854,8 @@ class TraceOperator(Message):
         i += 1
         nickname = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, klass=klass, nickname=nickname)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2520,6 +3869,24 @@ class TraceOperator(Message):
         arguments.append(encode(self.nickname))
         return Line(source, b"204", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"204")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' Oper')
+        arg = encode(self.klass)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class TraceUser(Message):
     """
@@ -2538,14 +3905,21 @@ class TraceUser(Message):
         return 'TraceUser(source={}, target={}, klass={}, nickname={})'.format(repr(self.source), repr(self.target), repr(self.klass), repr(self.nickname))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 205:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -2555,7 +3929,8 @@ class TraceUser(Message):
         i += 1
         nickname = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, klass=klass, nickname=nickname)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2569,6 +3944,24 @@ class TraceUser(Message):
         arguments.append(encode(self.nickname))
         return Line(source, b"205", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"205")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' User')
+        arg = encode(self.klass)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class TraceServer(Message):
     """
@@ -2591,14 +3984,21 @@ class TraceServer(Message):
         return 'TraceServer(source={}, target={}, klass={}, s={}, c={}, server={}, hostmask={}, protocol_version={})'.format(repr(self.source), repr(self.target), repr(self.klass), repr(self.s), repr(self.c), repr(self.server), repr(self.hostmask), repr(self.protocol_version))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 206:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 8):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -2616,7 +4016,8 @@ class TraceServer(Message):
         i += 1
         protocol_version = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, klass=klass, s=s, c=c, server=server, hostmask=hostmask, protocol_version=protocol_version)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2634,6 +4035,36 @@ class TraceServer(Message):
         arguments.append(encode(self.protocol_version))
         return Line(source, b"206", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"206")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' Serv')
+        arg = encode(self.klass)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.s)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.c)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.server)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.hostmask)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.protocol_version)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class TraceService(Message):
     """
@@ -2654,14 +4085,21 @@ class TraceService(Message):
         return 'TraceService(source={}, target={}, klass={}, name={}, type={}, active_type={})'.format(repr(self.source), repr(self.target), repr(self.klass), repr(self.name), repr(self.type), repr(self.active_type))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 207:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 6):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -2675,7 +4113,8 @@ class TraceService(Message):
         i += 1
         active_type = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, klass=klass, name=name, type=type, active_type=active_type)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2691,6 +4130,30 @@ class TraceService(Message):
         arguments.append(encode(self.active_type))
         return Line(source, b"207", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"207")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' Service')
+        arg = encode(self.klass)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.name)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.type)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.active_type)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class TraceNewtype(Message):
     """
@@ -2709,14 +4172,21 @@ class TraceNewtype(Message):
         return 'TraceNewtype(source={}, target={}, newtype={}, name={})'.format(repr(self.source), repr(self.target), repr(self.newtype), repr(self.name))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 208:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -2726,7 +4196,8 @@ class TraceNewtype(Message):
         i += 1
         name = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, newtype=newtype, name=name)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2740,6 +4211,24 @@ class TraceNewtype(Message):
         arguments.append(encode(self.name))
         return Line(source, b"208", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"208")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.newtype)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' 0')
+        arg = encode(self.name)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class TraceClass(Message):
     """
@@ -2758,14 +4247,21 @@ class TraceClass(Message):
         return 'TraceClass(source={}, target={}, klass={}, count={})'.format(repr(self.source), repr(self.target), repr(self.klass), repr(self.count))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 209:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -2775,7 +4271,8 @@ class TraceClass(Message):
         i += 1
         count = int(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, klass=klass, count=count)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2789,6 +4286,23 @@ class TraceClass(Message):
         arguments.append(encode(str(self.count)))
         return Line(source, b"209", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"209")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' Class')
+        arg = encode(self.klass)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces += (b' ', encode(str(self.count)))
+        return finish_raw(pieces)
+
 
 class StatsLinkInfo(Message):
     """
@@ -2812,14 +4326,21 @@ class StatsLinkInfo(Message):
         return 'StatsLinkInfo(source={}, target={}, name={}, sendq={}, sent_messages={}, sent_kbytes={}, recv_messages={}, recv_kbytes={}, uptime={})'.format(repr(self.source), repr(self.target), repr(self.name), repr(self.sendq), repr(self.sent_messages), repr(self.sent_kbytes), repr(self.recv_messages), repr(self.recv_kbytes), repr(self.uptime))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 211:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 8):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -2837,7 +4358,8 @@ class StatsLinkInfo(Message):
         i += 1
         uptime = int(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, name=name, sendq=sendq, sent_messages=sent_messages, sent_kbytes=sent_kbytes, recv_messages=recv_messages, recv_kbytes=recv_kbytes, uptime=uptime)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2855,6 +4377,29 @@ class StatsLinkInfo(Message):
         arguments.append(encode(str(self.uptime)))
         return Line(source, b"211", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"211")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.name)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.sendq)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces += (b' ', encode(str(self.sent_messages)))
+        pieces += (b' ', encode(str(self.sent_kbytes)))
+        pieces += (b' ', encode(str(self.recv_messages)))
+        pieces += (b' ', encode(str(self.recv_kbytes)))
+        pieces += (b' ', encode(str(self.uptime)))
+        return finish_raw(pieces)
+
 
 class StatsCommands(Message):
     """
@@ -2875,14 +4420,21 @@ class StatsCommands(Message):
         return 'StatsCommands(source={}, target={}, command={}, count={}, bytecount={}, remote_count={})'.format(repr(self.source), repr(self.target), repr(self.command), repr(self.count), repr(self.bytecount), repr(self.remote_count))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 212:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 5):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -2894,7 +4446,8 @@ class StatsCommands(Message):
         i += 1
         remote_count = int(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, command=command, count=count, bytecount=bytecount, remote_count=remote_count)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2909,6 +4462,24 @@ class StatsCommands(Message):
         arguments.append(encode(str(self.remote_count)))
         return Line(source, b"212", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"212")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.command)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces += (b' ', encode(str(self.count)))
+        pieces += (b' ', encode(str(self.bytecount)))
+        pieces += (b' ', encode(str(self.remote_count)))
+        return finish_raw(pieces)
+
 
 class StatsEnd(Message):
     """
@@ -2926,14 +4497,21 @@ class StatsEnd(Message):
         return 'StatsEnd(source={}, target={}, letter={})'.format(repr(self.source), repr(self.target), repr(self.letter))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 219:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -2941,7 +4519,8 @@ class StatsEnd(Message):
         i += 1
         # line.arguments[i]: 'End of STATS report'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, letter=letter)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2954,6 +4533,22 @@ class StatsEnd(Message):
         arguments.append(b'End of STATS report')
         return Line(source, b"219", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"219")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.letter)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :End of STATS report')
+        return finish_raw(pieces)
+
 
 class UserModeIs(Message):
     """
@@ -2971,20 +4566,28 @@ class UserModeIs(Message):
         return 'UserModeIs(source={}, target={}, mode={})'.format(repr(self.source), repr(self.target), repr(self.mode))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 221:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         mode = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, mode=mode)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -2996,6 +4599,20 @@ class UserModeIs(Message):
         arguments.append(encode(self.mode))
         return Line(source, b"221", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"221")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.mode)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class ServListReply(Message):
     """
@@ -3018,14 +4635,21 @@ class ServListReply(Message):
         return 'ServListReply(source={}, target={}, name={}, server={}, mask={}, type={}, hopcount={}, info={})'.format(repr(self.source), repr(self.target), repr(self.name), repr(self.server), repr(self.mask), repr(self.type), repr(self.hopcount), repr(self.info))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 234:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 7):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -3041,7 +4665,8 @@ class ServListReply(Message):
         i += 1
         info = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, name=name, server=server, mask=mask, type=type, hopcount=hopcount, info=info)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3058,6 +4683,33 @@ class ServListReply(Message):
         arguments.append(encode(self.info))
         return Line(source, b"234", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"234")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.name)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.server)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.mask)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.type)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces += (b' ', encode(str(self.hopcount)))
+        arg = encode(self.info)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class ServListEnd(Message):
     """
@@ -3076,14 +4728,21 @@ class ServListEnd(Message):
         return 'ServListEnd(source={}, target={}, mask={}, type={})'.format(repr(self.source), repr(self.target), repr(self.mask), repr(self.type))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 235:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -3093,7 +4752,8 @@ class ServListEnd(Message):
         i += 1
         # line.arguments[i]: 'End of service listing'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, mask=mask, type=type)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3107,6 +4767,25 @@ class ServListEnd(Message):
         arguments.append(b'End of service listing')
         return Line(source, b"235", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"235")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.mask)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.type)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :End of service listing')
+        return finish_raw(pieces)
+
 
 class StatsUptime(Message):
     """
@@ -3124,20 +4803,28 @@ class StatsUptime(Message):
         return 'StatsUptime(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 242:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3149,6 +4836,20 @@ class StatsUptime(Message):
         arguments.append(encode(self.message))
         return Line(source, b"242", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"242")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class StatsOline(Message):
     """
@@ -3167,14 +4868,21 @@ class StatsOline(Message):
         return 'StatsOline(source={}, target={}, hostmask={}, name={})'.format(repr(self.source), repr(self.target), repr(self.hostmask), repr(self.name))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 243:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 5):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -3186,7 +4894,8 @@ class StatsOline(Message):
         i += 1
         name = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, hostmask=hostmask, name=name)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3201,6 +4910,25 @@ class StatsOline(Message):
         arguments.append(encode(self.name))
         return Line(source, b"243", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"243")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' O')
+        arg = encode(self.hostmask)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' *')
+        arg = encode(self.name)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class LuserClient(Message):
     """
@@ -3218,20 +4946,28 @@ class LuserClient(Message):
         return 'LuserClient(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 251:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3243,6 +4979,20 @@ class LuserClient(Message):
         arguments.append(encode(self.message))
         return Line(source, b"251", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"251")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class LuserOp(Message):
     """
@@ -3260,14 +5010,21 @@ class LuserOp(Message):
         return 'LuserOp(source={}, target={}, count={})'.format(repr(self.source), repr(self.target), repr(self.count))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 252:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -3275,7 +5032,8 @@ class LuserOp(Message):
         i += 1
         # line.arguments[i]: 'operator(s) online'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, count=count)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3288,6 +5046,20 @@ class LuserOp(Message):
         arguments.append(b'operator(s) online')
         return Line(source, b"252", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"252")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces += (b' ', encode(str(self.count)))
+        pieces.append(b' :operator(s) online')
+        return finish_raw(pieces)
+
 
 class LuserUnknown(Message):
     """
@@ -3305,14 +5077,21 @@ class LuserUnknown(Message):
         return 'LuserUnknown(source={}, target={}, count={})'.format(repr(self.source), repr(self.target), repr(self.count))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 253:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -3320,7 +5099,8 @@ class LuserUnknown(Message):
         i += 1
         # line.arguments[i]: 'unknown connection(s)'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, count=count)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3333,6 +5113,20 @@ class LuserUnknown(Message):
         arguments.append(b'unknown connection(s)')
         return Line(source, b"253", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"253")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces += (b' ', encode(str(self.count)))
+        pieces.append(b' :unknown connection(s)')
+        return finish_raw(pieces)
+
 
 class LuserChannels(Message):
     """
@@ -3350,14 +5144,21 @@ class LuserChannels(Message):
         return 'LuserChannels(source={}, target={}, count={})'.format(repr(self.source), repr(self.target), repr(self.count))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 254:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -3365,7 +5166,8 @@ class LuserChannels(Message):
         i += 1
         # line.arguments[i]: 'channels formed'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, count=count)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3378,6 +5180,20 @@ class LuserChannels(Message):
         arguments.append(b'channels formed')
         return Line(source, b"254", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"254")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces += (b' ', encode(str(self.count)))
+        pieces.append(b' :channels formed')
+        return finish_raw(pieces)
+
 
 class LuserMe(Message):
     """
@@ -3395,20 +5211,28 @@ class LuserMe(Message):
         return 'LuserMe(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 255:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3420,6 +5244,20 @@ class LuserMe(Message):
         arguments.append(encode(self.message))
         return Line(source, b"255", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"255")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class AdminMe(Message):
     """
@@ -3437,14 +5275,21 @@ class AdminMe(Message):
         return 'AdminMe(source={}, target={}, server={})'.format(repr(self.source), repr(self.target), repr(self.server))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 256:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -3452,7 +5297,8 @@ class AdminMe(Message):
         i += 1
         # line.arguments[i]: 'Administrative info'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, server=server)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3465,6 +5311,22 @@ class AdminMe(Message):
         arguments.append(b'Administrative info')
         return Line(source, b"256", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"256")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.server)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Administrative info')
+        return finish_raw(pieces)
+
 
 class AdminLoc1(Message):
     """
@@ -3482,20 +5344,28 @@ class AdminLoc1(Message):
         return 'AdminLoc1(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 257:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3507,6 +5377,20 @@ class AdminLoc1(Message):
         arguments.append(encode(self.message))
         return Line(source, b"257", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"257")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class AdminLoc2(Message):
     """
@@ -3524,20 +5408,28 @@ class AdminLoc2(Message):
         return 'AdminLoc2(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 258:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3549,6 +5441,20 @@ class AdminLoc2(Message):
         arguments.append(encode(self.message))
         return Line(source, b"258", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"258")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class AdminEmail(Message):
     """
@@ -3566,20 +5472,28 @@ class AdminEmail(Message):
         return 'AdminEmail(source={}, target={}, email={})'.format(repr(self.source), repr(self.target), repr(self.email))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 259:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         email = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, email=email)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3591,6 +5505,20 @@ class AdminEmail(Message):
         arguments.append(encode(self.email))
         return Line(source, b"259", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"259")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.email)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class TraceLog(Message):
     """
@@ -3609,14 +5537,21 @@ class TraceLog(Message):
         return 'TraceLog(source={}, target={}, logfile={}, debug_level={})'.format(repr(self.source), repr(self.target), repr(self.logfile), repr(self.debug_level))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 261:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -3626,7 +5561,8 @@ class TraceLog(Message):
         i += 1
         debug_level = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, logfile=logfile, debug_level=debug_level)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3640,7 +5576,25 @@ class TraceLog(Message):
         arguments.append(encode(self.debug_level))
         return Line(source, b"261", arguments)
 
-
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"261")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' File')
+        arg = encode(self.logfile)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.debug_level)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
+
 class TraceEnd(Message):
     """
     ``262 <target> <server> <version> :End of TRACE``
@@ -3658,14 +5612,21 @@ class TraceEnd(Message):
         return 'TraceEnd(source={}, target={}, server={}, version={})'.format(repr(self.source), repr(self.target), repr(self.server), repr(self.version))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 262:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -3675,7 +5636,8 @@ class TraceEnd(Message):
         i += 1
         # line.arguments[i]: 'End of TRACE'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, server=server, version=version)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3689,6 +5651,25 @@ class TraceEnd(Message):
         arguments.append(b'End of TRACE')
         return Line(source, b"262", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"262")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.server)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.version)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :End of TRACE')
+        return finish_raw(pieces)
+
 
 class TryAgain(Message):
     """
@@ -3706,14 +5687,21 @@ class TryAgain(Message):
         return 'TryAgain(source={}, target={}, command={})'.format(repr(self.source), repr(self.target), repr(self.command))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 263:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -3721,7 +5709,8 @@ class TryAgain(Message):
         i += 1
         # line.arguments[i]: 'Please wait a while and try again.'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, command=command)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3734,6 +5723,22 @@ class TryAgain(Message):
         arguments.append(b'Please wait a while and try again.')
         return Line(source, b"263", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"263")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.command)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Please wait a while and try again.')
+        return finish_raw(pieces)
+
 
 class AwayReply(Message):
     """
@@ -3752,14 +5757,21 @@ class AwayReply(Message):
         return 'AwayReply(source={}, target={}, nickname={}, message={})'.format(repr(self.source), repr(self.target), repr(self.nickname), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 301:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -3767,7 +5779,8 @@ class AwayReply(Message):
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, nickname=nickname, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3780,6 +5793,23 @@ class AwayReply(Message):
         arguments.append(encode(self.message))
         return Line(source, b"301", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"301")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class UserHostReply(Message):
     """
@@ -3799,20 +5829,28 @@ class UserHostReply(Message):
         return 'UserHostReply(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 302:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3824,6 +5862,20 @@ class UserHostReply(Message):
         arguments.append(encode(self.message))
         return Line(source, b"302", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"302")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class IsOnReply(Message):
     """
@@ -3843,20 +5895,28 @@ class IsOnReply(Message):
         return 'IsOnReply(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 303:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3868,6 +5928,20 @@ class IsOnReply(Message):
         arguments.append(encode(self.message))
         return Line(source, b"303", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"303")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class UnawayReply(Message):
     """
@@ -3884,20 +5958,28 @@ class UnawayReply(Message):
         return 'UnawayReply(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 305:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'You are no longer marked as being away'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3909,6 +5991,19 @@ class UnawayReply(Message):
         arguments.append(b'You are no longer marked as being away')
         return Line(source, b"305", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"305")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :You are no longer marked as being away')
+        return finish_raw(pieces)
+
 
 class NowAwayReply(Message):
     """
@@ -3925,20 +6020,28 @@ class NowAwayReply(Message):
         return 'NowAwayReply(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 306:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'You have been marked as being away'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -3950,6 +6053,19 @@ class NowAwayReply(Message):
         arguments.append(b'You have been marked as being away')
         return Line(source, b"306", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"306")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :You have been marked as being away')
+        return finish_raw(pieces)
+
 
 class WhoIsUser(Message):
     """
@@ -3970,14 +6086,21 @@ class WhoIsUser(Message):
         return 'WhoIsUser(source={}, target={}, nickname={}, user={}, host={}, realname={})'.format(repr(self.source), repr(self.target), repr(self.nickname), repr(self.user), repr(self.host), repr(self.realname))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 311:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 6):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -3991,7 +6114,8 @@ class WhoIsUser(Message):
         i += 1
         realname = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, nickname=nickname, user=user, host=host, realname=realname)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4007,6 +6131,30 @@ class WhoIsUser(Message):
         arguments.append(encode(self.realname))
         return Line(source, b"311", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"311")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.user)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.host)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' *')
+        arg = encode(self.realname)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class WhoIsServer(Message):
     """
@@ -4026,14 +6174,21 @@ class WhoIsServer(Message):
         return 'WhoIsServer(source={}, target={}, nickname={}, server={}, info={})'.format(repr(self.source), repr(self.target), repr(self.nickname), repr(self.server), repr(self.info))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 312:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4043,7 +6198,8 @@ class WhoIsServer(Message):
         i += 1
         info = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, nickname=nickname, server=server, info=info)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4057,6 +6213,26 @@ class WhoIsServer(Message):
         arguments.append(encode(self.info))
         return Line(source, b"312", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"312")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.server)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.info)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class WhoIsOperator(Message):
     """
@@ -4074,14 +6250,21 @@ class WhoIsOperator(Message):
         return 'WhoIsOperator(source={}, target={}, nickname={})'.format(repr(self.source), repr(self.target), repr(self.nickname))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 313:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4089,7 +6272,8 @@ class WhoIsOperator(Message):
         i += 1
         # line.arguments[i]: 'is an IRC operator'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, nickname=nickname)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4102,6 +6286,22 @@ class WhoIsOperator(Message):
         arguments.append(b'is an IRC operator')
         return Line(source, b"313", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"313")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :is an IRC operator')
+        return finish_raw(pieces)
+
 
 class WhoWasUser(Message):
     """
@@ -4122,14 +6322,21 @@ class WhoWasUser(Message):
         return 'WhoWasUser(source={}, target={}, nickname={}, user={}, host={}, realname={})'.format(repr(self.source), repr(self.target), repr(self.nickname), repr(self.user), repr(self.host), repr(self.realname))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 314:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 6):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4143,7 +6350,8 @@ class WhoWasUser(Message):
         i += 1
         realname = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, nickname=nickname, user=user, host=host, realname=realname)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4159,6 +6367,30 @@ class WhoWasUser(Message):
         arguments.append(encode(self.realname))
         return Line(source, b"314", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"314")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.user)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.host)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' *')
+        arg = encode(self.realname)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class WhoEnd(Message):
     """
@@ -4176,14 +6408,21 @@ class WhoEnd(Message):
         return 'WhoEnd(source={}, target={}, name={})'.format(repr(self.source), repr(self.target), repr(self.name))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 315:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4191,7 +6430,8 @@ class WhoEnd(Message):
         i += 1
         # line.arguments[i]: 'End of WHO list'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, name=name)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4204,6 +6444,22 @@ class WhoEnd(Message):
         arguments.append(b'End of WHO list')
         return Line(source, b"315", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"315")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.name)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :End of WHO list')
+        return finish_raw(pieces)
+
 
 class WhoIsIdle(Message):
     """
@@ -4222,14 +6478,21 @@ class WhoIsIdle(Message):
         return 'WhoIsIdle(source={}, target={}, nickname={}, time={})'.format(repr(self.source), repr(self.target), repr(self.nickname), repr(self.time))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 317:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4239,7 +6502,8 @@ class WhoIsIdle(Message):
         i += 1
         # line.arguments[i]: 'seconds idle'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, nickname=nickname, time=time)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4253,6 +6517,23 @@ class WhoIsIdle(Message):
         arguments.append(b'seconds idle')
         return Line(source, b"317", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"317")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces += (b' ', encode(str(self.time)))
+        pieces.append(b' :seconds idle')
+        return finish_raw(pieces)
+
 
 class WhoIsEnd(Message):
     """
@@ -4270,14 +6551,21 @@ class WhoIsEnd(Message):
         return 'WhoIsEnd(source={}, target={}, nickname={})'.format(repr(self.source), repr(self.target), repr(self.nickname))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 318:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4285,7 +6573,8 @@ class WhoIsEnd(Message):
         i += 1
         # line.arguments[i]: 'End of WHOIS list'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, nickname=nickname)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4298,10 +6587,26 @@ class WhoIsEnd(Message):
         arguments.append(b'End of WHOIS list')
         return Line(source, b"318", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"318")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :End of WHOIS list')
+        return finish_raw(pieces)
+
 
 class WhoIsChannels(Message):
     """
-    ``319 <target> <nickname> <channels>``
+    ``319 <target> <nickname> <#channels>``
     """
 
     __slots__ = ['target', 'nickname', 'channels']
@@ -4316,14 +6621,21 @@ class WhoIsChannels(Message):
         return 'WhoIsChannels(source={}, target={}, nickname={}, channels={})'.format(repr(self.source), repr(self.target), repr(self.nickname), repr(self.channels))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 319:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4331,7 +6643,8 @@ class WhoIsChannels(Message):
         i += 1
         channels = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, nickname=nickname, channels=channels)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4344,10 +6657,27 @@ class WhoIsChannels(Message):
         arguments.append(encode(self.channels))
         return Line(source, b"319", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"319")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channels)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class ListReply(Message):
     """
-    ``322 <target> <channel> <int:visible> <topic>``
+    ``322 <target> <#channel> <int:visible> <topic>``
     """
 
     __slots__ = ['target', 'channel', 'visible', 'topic']
@@ -4363,14 +6693,21 @@ class ListReply(Message):
         return 'ListReply(source={}, target={}, channel={}, visible={}, topic={})'.format(repr(self.source), repr(self.target), repr(self.channel), repr(self.visible), repr(self.topic))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 322:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4380,7 +6717,8 @@ class ListReply(Message):
         i += 1
         topic = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel, visible=visible, topic=topic)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4394,6 +6732,24 @@ class ListReply(Message):
         arguments.append(encode(self.topic))
         return Line(source, b"322", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"322")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces += (b' ', encode(str(self.visible)))
+        arg = encode(self.topic)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class ListEnd(Message):
     """
@@ -4410,20 +6766,28 @@ class ListEnd(Message):
         return 'ListEnd(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 323:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'End of LIST'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4435,10 +6799,23 @@ class ListEnd(Message):
         arguments.append(b'End of LIST')
         return Line(source, b"323", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"323")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :End of LIST')
+        return finish_raw(pieces)
+
 
 class ChannelModeIs(Message):
     """
-    ``324 <target> <channel> <mode> <params>``
+    ``324 <target> <#channel> <mode> <params>``
     """
 
     __slots__ = ['target', 'channel', 'mode', 'params']
@@ -4454,14 +6831,21 @@ class ChannelModeIs(Message):
         return 'ChannelModeIs(source={}, target={}, channel={}, mode={}, params={})'.format(repr(self.source), repr(self.target), repr(self.channel), repr(self.mode), repr(self.params))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 324:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4471,7 +6855,8 @@ class ChannelModeIs(Message):
         i += 1
         params = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel, mode=mode, params=params)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4485,10 +6870,30 @@ class ChannelModeIs(Message):
         arguments.append(encode(self.params))
         return Line(source, b"324", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"324")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.mode)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.params)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class UniqOpIs(Message):
     """
-    ``325 <target> <channel> <nickname>``
+    ``325 <target> <#channel> <nickname>``
     """
 
     __slots__ = ['target', 'channel', 'nickname']
@@ -4503,14 +6908,21 @@ class UniqOpIs(Message):
         return 'UniqOpIs(source={}, target={}, channel={}, nickname={})'.format(repr(self.source), repr(self.target), repr(self.channel), repr(self.nickname))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 325:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4518,7 +6930,8 @@ class UniqOpIs(Message):
         i += 1
         nickname = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel, nickname=nickname)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4531,10 +6944,27 @@ class UniqOpIs(Message):
         arguments.append(encode(self.nickname))
         return Line(source, b"325", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"325")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class NoTopicReply(Message):
     """
-    ``331 <target> <channel> :No topic is set``
+    ``331 <target> <#channel> :No topic is set``
     """
 
     __slots__ = ['target', 'channel']
@@ -4548,14 +6978,21 @@ class NoTopicReply(Message):
         return 'NoTopicReply(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 331:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4563,7 +7000,8 @@ class NoTopicReply(Message):
         i += 1
         # line.arguments[i]: 'No topic is set'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4576,10 +7014,26 @@ class NoTopicReply(Message):
         arguments.append(b'No topic is set')
         return Line(source, b"331", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"331")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :No topic is set')
+        return finish_raw(pieces)
+
 
 class TopicReply(Message):
     """
-    ``332 <target> <channel> <topic>``
+    ``332 <target> <#channel> <topic>``
     """
 
     __slots__ = ['target', 'channel', 'topic']
@@ -4594,14 +7048,21 @@ class TopicReply(Message):
         return 'TopicReply(source={}, target={}, channel={}, topic={})'.format(repr(self.source), repr(self.target), repr(self.channel), repr(self.topic))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 332:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4609,7 +7070,8 @@ class TopicReply(Message):
         i += 1
         topic = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel, topic=topic)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4622,10 +7084,27 @@ class TopicReply(Message):
         arguments.append(encode(self.topic))
         return Line(source, b"332", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"332")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.topic)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class Inviting(Message):
     """
-    ``341 <target> <channel> <nick>``
+    ``341 <target> <#channel> <nick>``
     """
 
     __slots__ = ['target', 'channel', 'nick']
@@ -4640,14 +7119,21 @@ class Inviting(Message):
         return 'Inviting(source={}, target={}, channel={}, nick={})'.format(repr(self.source), repr(self.target), repr(self.channel), repr(self.nick))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 341:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4655,7 +7141,8 @@ class Inviting(Message):
         i += 1
         nick = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel, nick=nick)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4668,6 +7155,23 @@ class Inviting(Message):
         arguments.append(encode(self.nick))
         return Line(source, b"341", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"341")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nick)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class Summoning(Message):
     """
@@ -4685,14 +7189,21 @@ class Summoning(Message):
         return 'Summoning(source={}, target={}, user={})'.format(repr(self.source), repr(self.target), repr(self.user))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 342:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4700,7 +7211,8 @@ class Summoning(Message):
         i += 1
         # line.arguments[i]: 'Summoning user to IRC'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, user=user)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4713,10 +7225,26 @@ class Summoning(Message):
         arguments.append(b'Summoning user to IRC')
         return Line(source, b"342", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"342")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.user)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Summoning user to IRC')
+        return finish_raw(pieces)
+
 
 class InviteList(Message):
     """
-    ``346 <target> <channel> <mask>``
+    ``346 <target> <#channel> <mask>``
     """
 
     __slots__ = ['target', 'channel', 'mask']
@@ -4731,14 +7259,21 @@ class InviteList(Message):
         return 'InviteList(source={}, target={}, channel={}, mask={})'.format(repr(self.source), repr(self.target), repr(self.channel), repr(self.mask))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 346:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4746,7 +7281,8 @@ class InviteList(Message):
         i += 1
         mask = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel, mask=mask)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4759,10 +7295,27 @@ class InviteList(Message):
         arguments.append(encode(self.mask))
         return Line(source, b"346", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"346")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.mask)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class InviteListEnd(Message):
     """
-    ``347 <target> <channel> :End of channel invite list``
+    ``347 <target> <#channel> :End of channel invite list``
     """
 
     __slots__ = ['target', 'channel']
@@ -4776,14 +7329,21 @@ class InviteListEnd(Message):
         return 'InviteListEnd(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 347:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4791,7 +7351,8 @@ class InviteListEnd(Message):
         i += 1
         # line.arguments[i]: 'End of channel invite list'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4804,10 +7365,26 @@ class InviteListEnd(Message):
         arguments.append(b'End of channel invite list')
         return Line(source, b"347", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"347")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :End of channel invite list')
+        return finish_raw(pieces)
+
 
 class ExceptList(Message):
     """
-    ``348 <target> <channel> <mask>``
+    ``348 <target> <#channel> <mask>``
     """
 
     __slots__ = ['target', 'channel', 'mask']
@@ -4822,14 +7399,21 @@ class ExceptList(Message):
         return 'ExceptList(source={}, target={}, channel={}, mask={})'.format(repr(self.source), repr(self.target), repr(self.channel), repr(self.mask))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 348:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4837,7 +7421,8 @@ class ExceptList(Message):
         i += 1
         mask = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel, mask=mask)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4850,10 +7435,27 @@ class ExceptList(Message):
         arguments.append(encode(self.mask))
         return Line(source, b"348", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"348")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.mask)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class ExceptListEnd(Message):
     """
-    ``349 <target> <channel> :End of channel exception list``
+    ``349 <target> <#channel> :End of channel exception list``
     """
 
     __slots__ = ['target', 'channel']
@@ -4867,14 +7469,21 @@ class ExceptListEnd(Message):
         return 'ExceptListEnd(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 349:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4882,7 +7491,8 @@ class ExceptListEnd(Message):
         i += 1
         # line.arguments[i]: 'End of channel exception list'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4895,6 +7505,22 @@ class ExceptListEnd(Message):
         arguments.append(b'End of channel exception list')
         return Line(source, b"349", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"349")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :End of channel exception list')
+        return finish_raw(pieces)
+
 
 class VersionReply(Message):
     """
@@ -4914,14 +7540,21 @@ class VersionReply(Message):
         return 'VersionReply(source={}, target={}, version={}, server={}, comments={})'.format(repr(self.source), repr(self.target), repr(self.version), repr(self.server), repr(self.comments))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 351:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4931,7 +7564,8 @@ class VersionReply(Message):
         i += 1
         comments = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, version=version, server=server, comments=comments)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -4945,10 +7579,30 @@ class VersionReply(Message):
         arguments.append(encode(self.comments))
         return Line(source, b"351", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"351")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.version)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.server)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.comments)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class WhoReply(Message):
     """
-    ``352 <target> <channel> <user> <host> <server> <nickname> <props> <realname>``
+    ``352 <target> <#channel> <user> <host> <server> <nickname> <props> <realname>``
     """
 
     __slots__ = ['target', 'channel', 'user', 'host', 'server', 'nickname', 'props', 'realname']
@@ -4968,14 +7622,21 @@ class WhoReply(Message):
         return 'WhoReply(source={}, target={}, channel={}, user={}, host={}, server={}, nickname={}, props={}, realname={})'.format(repr(self.source), repr(self.target), repr(self.channel), repr(self.user), repr(self.host), repr(self.server), repr(self.nickname), repr(self.props), repr(self.realname))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 352:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 8):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -4993,7 +7654,8 @@ class WhoReply(Message):
         i += 1
         realname = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel, user=user, host=host, server=server, nickname=nickname, props=props, realname=realname)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5011,10 +7673,42 @@ class WhoReply(Message):
         arguments.append(encode(self.realname))
         return Line(source, b"352", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"352")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.user)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.host)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.server)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.props)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.realname)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class NamesReply(Message):
     """
-    ``353 <target> <mode> <channel> <nicknames_>``
+    ``353 <target> <mode> <#channel> <nicknames_>``
     """
 
     __slots__ = ['target', 'mode', 'channel', 'nicknames']
@@ -5030,14 +7724,21 @@ class NamesReply(Message):
         return 'NamesReply(source={}, target={}, mode={}, channel={}, nicknames={})'.format(repr(self.source), repr(self.target), repr(self.mode), repr(self.channel), repr(self.nicknames))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 353:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -5047,7 +7748,8 @@ class NamesReply(Message):
         i += 1
         nicknames = [decode(x) for x in line.arguments[i].split()]
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, mode=mode, channel=channel, nicknames=nicknames)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5061,6 +7763,26 @@ class NamesReply(Message):
         arguments.append(b" ".join(encode(x) for x in self.nicknames))
         return Line(source, b"353", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"353")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.mode)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = b" ".join(encode(x) for x in self.nicknames)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class LinksReply(Message):
     """
@@ -5080,14 +7802,21 @@ class LinksReply(Message):
         return 'LinksReply(source={}, target={}, mask={}, server={}, info={})'.format(repr(self.source), repr(self.target), repr(self.mask), repr(self.server), repr(self.info))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 364:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -5097,7 +7826,8 @@ class LinksReply(Message):
         i += 1
         info = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, mask=mask, server=server, info=info)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5111,6 +7841,26 @@ class LinksReply(Message):
         arguments.append(encode(self.info))
         return Line(source, b"364", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"364")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.mask)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.server)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.info)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class LinksEnd(Message):
     """
@@ -5128,14 +7878,21 @@ class LinksEnd(Message):
         return 'LinksEnd(source={}, target={}, mask={})'.format(repr(self.source), repr(self.target), repr(self.mask))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 365:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -5143,7 +7900,8 @@ class LinksEnd(Message):
         i += 1
         # line.arguments[i]: 'End of LINKS list'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, mask=mask)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5156,10 +7914,26 @@ class LinksEnd(Message):
         arguments.append(b'End of LINKS list')
         return Line(source, b"365", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"365")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.mask)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :End of LINKS list')
+        return finish_raw(pieces)
+
 
 class NamesEnd(Message):
     """
-    ``366 <target> <channel> :End of NAMES list``
+    ``366 <target> <#channel> :End of NAMES list``
     """
 
     __slots__ = ['target', 'channel']
@@ -5173,14 +7947,21 @@ class NamesEnd(Message):
         return 'NamesEnd(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 366:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -5188,7 +7969,8 @@ class NamesEnd(Message):
         i += 1
         # line.arguments[i]: 'End of NAMES list'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5201,10 +7983,26 @@ class NamesEnd(Message):
         arguments.append(b'End of NAMES list')
         return Line(source, b"366", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"366")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :End of NAMES list')
+        return finish_raw(pieces)
+
 
 class BanList(Message):
     """
-    ``367 <target> <channel> <mask>``
+    ``367 <target> <#channel> <mask>``
     """
 
     __slots__ = ['target', 'channel', 'mask']
@@ -5219,14 +8017,21 @@ class BanList(Message):
         return 'BanList(source={}, target={}, channel={}, mask={})'.format(repr(self.source), repr(self.target), repr(self.channel), repr(self.mask))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 367:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -5234,7 +8039,8 @@ class BanList(Message):
         i += 1
         mask = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel, mask=mask)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5247,10 +8053,27 @@ class BanList(Message):
         arguments.append(encode(self.mask))
         return Line(source, b"367", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"367")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.mask)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class BanListEnd(Message):
     """
-    ``368 <target> <channel> :End of channel ban list``
+    ``368 <target> <#channel> :End of channel ban list``
     """
 
     __slots__ = ['target', 'channel']
@@ -5264,14 +8087,21 @@ class BanListEnd(Message):
         return 'BanListEnd(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 368:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -5279,7 +8109,8 @@ class BanListEnd(Message):
         i += 1
         # line.arguments[i]: 'End of channel ban list'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5292,6 +8123,22 @@ class BanListEnd(Message):
         arguments.append(b'End of channel ban list')
         return Line(source, b"368", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"368")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :End of channel ban list')
+        return finish_raw(pieces)
+
 
 class WhoWasEnd(Message):
     """
@@ -5309,14 +8156,21 @@ class WhoWasEnd(Message):
         return 'WhoWasEnd(source={}, target={}, nickname={})'.format(repr(self.source), repr(self.target), repr(self.nickname))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 369:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -5324,7 +8178,8 @@ class WhoWasEnd(Message):
         i += 1
         # line.arguments[i]: 'End of WHOWAS'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, nickname=nickname)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5337,6 +8192,22 @@ class WhoWasEnd(Message):
         arguments.append(b'End of WHOWAS')
         return Line(source, b"369", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"369")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :End of WHOWAS')
+        return finish_raw(pieces)
+
 
 class InfoReply(Message):
     """
@@ -5354,20 +8225,28 @@ class InfoReply(Message):
         return 'InfoReply(source={}, target={}, info={})'.format(repr(self.source), repr(self.target), repr(self.info))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 371:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         info = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, info=info)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5379,6 +8258,20 @@ class InfoReply(Message):
         arguments.append(encode(self.info))
         return Line(source, b"371", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"371")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.info)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class MotdText(Message):
     """
@@ -5396,20 +8289,28 @@ class MotdText(Message):
         return 'MotdText(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 372:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5421,6 +8322,20 @@ class MotdText(Message):
         arguments.append(encode(self.message))
         return Line(source, b"372", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"372")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class InfoEnd(Message):
     """
@@ -5437,20 +8352,28 @@ class InfoEnd(Message):
         return 'InfoEnd(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 374:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'End of INFO list'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5462,6 +8385,19 @@ class InfoEnd(Message):
         arguments.append(b'End of INFO list')
         return Line(source, b"374", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"374")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :End of INFO list')
+        return finish_raw(pieces)
+
 
 class MotdStart(Message):
     """
@@ -5479,20 +8415,28 @@ class MotdStart(Message):
         return 'MotdStart(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 375:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5504,6 +8448,20 @@ class MotdStart(Message):
         arguments.append(encode(self.message))
         return Line(source, b"375", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"375")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class MotdEnd(Message):
     """
@@ -5520,20 +8478,28 @@ class MotdEnd(Message):
         return 'MotdEnd(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 376:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'End of MOTD command'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5545,6 +8511,19 @@ class MotdEnd(Message):
         arguments.append(b'End of MOTD command')
         return Line(source, b"376", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"376")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :End of MOTD command')
+        return finish_raw(pieces)
+
 
 class YoureOper(Message):
     """
@@ -5561,20 +8540,28 @@ class YoureOper(Message):
         return 'YoureOper(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 381:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'You are now an IRC operator'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5586,6 +8573,19 @@ class YoureOper(Message):
         arguments.append(b'You are now an IRC operator')
         return Line(source, b"381", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"381")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :You are now an IRC operator')
+        return finish_raw(pieces)
+
 
 class Rehashing(Message):
     """
@@ -5603,14 +8603,21 @@ class Rehashing(Message):
         return 'Rehashing(source={}, target={}, file={})'.format(repr(self.source), repr(self.target), repr(self.file))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 382:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -5618,7 +8625,8 @@ class Rehashing(Message):
         i += 1
         # line.arguments[i]: 'Rehashing'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, file=file)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5631,6 +8639,22 @@ class Rehashing(Message):
         arguments.append(b'Rehashing')
         return Line(source, b"382", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"382")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.file)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' Rehashing')
+        return finish_raw(pieces)
+
 
 class YoureService(Message):
     """
@@ -5648,20 +8672,28 @@ class YoureService(Message):
         return 'YoureService(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 383:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5673,6 +8705,20 @@ class YoureService(Message):
         arguments.append(encode(self.message))
         return Line(source, b"383", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"383")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class TimeReply(Message):
     """
@@ -5691,14 +8737,21 @@ class TimeReply(Message):
         return 'TimeReply(source={}, target={}, server={}, time={})'.format(repr(self.source), repr(self.target), repr(self.server), repr(self.time))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 391:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -5706,7 +8759,8 @@ class TimeReply(Message):
         i += 1
         time = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, server=server, time=time)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5719,6 +8773,23 @@ class TimeReply(Message):
         arguments.append(encode(self.time))
         return Line(source, b"391", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"391")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.server)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.time)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class UsersStart(Message):
     """
@@ -5735,20 +8806,28 @@ class UsersStart(Message):
         return 'UsersStart(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 392:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'UserID   Terminal  Host'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5760,6 +8839,19 @@ class UsersStart(Message):
         arguments.append(b'UserID   Terminal  Host')
         return Line(source, b"392", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"392")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :UserID   Terminal  Host')
+        return finish_raw(pieces)
+
 
 class UsersReply(Message):
     """
@@ -5777,20 +8869,28 @@ class UsersReply(Message):
         return 'UsersReply(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 393:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5802,6 +8902,20 @@ class UsersReply(Message):
         arguments.append(encode(self.message))
         return Line(source, b"393", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"393")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class UsersEnd(Message):
     """
@@ -5818,20 +8932,28 @@ class UsersEnd(Message):
         return 'UsersEnd(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 394:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'End of users'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5843,6 +8965,19 @@ class UsersEnd(Message):
         arguments.append(b'End of users')
         return Line(source, b"394", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"394")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :End of users')
+        return finish_raw(pieces)
+
 
 class NoUsers(Message):
     """
@@ -5859,20 +8994,28 @@ class NoUsers(Message):
         return 'NoUsers(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 395:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'Nobody logged in'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5884,6 +9027,19 @@ class NoUsers(Message):
         arguments.append(b'Nobody logged in')
         return Line(source, b"395", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"395")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Nobody logged in')
+        return finish_raw(pieces)
+
 
 class NoSuchNick(Message):
     """
@@ -5901,14 +9057,21 @@ class NoSuchNick(Message):
         return 'NoSuchNick(source={}, target={}, nickname={})'.format(repr(self.source), repr(self.target), repr(self.nickname))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 401:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -5916,7 +9079,8 @@ class NoSuchNick(Message):
         i += 1
         # line.arguments[i]: 'No such nick/channel'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, nickname=nickname)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5929,6 +9093,22 @@ class NoSuchNick(Message):
         arguments.append(b'No such nick/channel')
         return Line(source, b"401", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"401")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :No such nick/channel')
+        return finish_raw(pieces)
+
 
 class NoSuchServer(Message):
     """
@@ -5946,14 +9126,21 @@ class NoSuchServer(Message):
         return 'NoSuchServer(source={}, target={}, server={})'.format(repr(self.source), repr(self.target), repr(self.server))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 402:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -5961,7 +9148,8 @@ class NoSuchServer(Message):
         i += 1
         # line.arguments[i]: 'No such server'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, server=server)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -5974,10 +9162,26 @@ class NoSuchServer(Message):
         arguments.append(b'No such server')
         return Line(source, b"402", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"402")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.server)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :No such server')
+        return finish_raw(pieces)
+
 
 class NoSuchChannel(Message):
     """
-    ``403 <target> <channel> :No such channel``
+    ``403 <target> <#channel> :No such channel``
     """
 
     __slots__ = ['target', 'channel']
@@ -5991,14 +9195,21 @@ class NoSuchChannel(Message):
         return 'NoSuchChannel(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 403:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -6006,7 +9217,8 @@ class NoSuchChannel(Message):
         i += 1
         # line.arguments[i]: 'No such channel'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6019,10 +9231,26 @@ class NoSuchChannel(Message):
         arguments.append(b'No such channel')
         return Line(source, b"403", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"403")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :No such channel')
+        return finish_raw(pieces)
+
 
 class CantSendToChan(Message):
     """
-    ``404 <target> <channel> :Cannot send to channel``
+    ``404 <target> <#channel> :Cannot send to channel``
     """
 
     __slots__ = ['target', 'channel']
@@ -6036,14 +9264,21 @@ class CantSendToChan(Message):
         return 'CantSendToChan(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 404:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -6051,7 +9286,8 @@ class CantSendToChan(Message):
         i += 1
         # line.arguments[i]: 'Cannot send to channel'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6064,10 +9300,26 @@ class CantSendToChan(Message):
         arguments.append(b'Cannot send to channel')
         return Line(source, b"404", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"404")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Cannot send to channel')
+        return finish_raw(pieces)
+
 
 class TooManyChannels(Message):
     """
-    ``405 <target> <channel> :You have joined too many channels``
+    ``405 <target> <#channel> :You have joined too many channels``
     """
 
     __slots__ = ['target', 'channel']
@@ -6081,14 +9333,21 @@ class TooManyChannels(Message):
         return 'TooManyChannels(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 405:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -6096,7 +9355,8 @@ class TooManyChannels(Message):
         i += 1
         # line.arguments[i]: 'You have joined too many channels'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6109,6 +9369,22 @@ class TooManyChannels(Message):
         arguments.append(b'You have joined too many channels')
         return Line(source, b"405", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"405")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :You have joined too many channels')
+        return finish_raw(pieces)
+
 
 class WasNoSuchNick(Message):
     """
@@ -6126,14 +9402,21 @@ class WasNoSuchNick(Message):
         return 'WasNoSuchNick(source={}, target={}, nickname={})'.format(repr(self.source), repr(self.target), repr(self.nickname))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 406:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -6141,7 +9424,8 @@ class WasNoSuchNick(Message):
         i += 1
         # line.arguments[i]: 'There was no such nickname'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, nickname=nickname)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6154,6 +9438,22 @@ class WasNoSuchNick(Message):
         arguments.append(b'There was no such nickname')
         return Line(source, b"406", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"406")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :There was no such nickname')
+        return finish_raw(pieces)
+
 
 class TooManyTargets(Message):
     """
@@ -6172,14 +9472,21 @@ class TooManyTargets(Message):
         return 'TooManyTargets(source={}, target={}, orig_target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.orig_target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 407:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -6187,7 +9494,8 @@ class TooManyTargets(Message):
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, orig_target=orig_target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6200,6 +9508,23 @@ class TooManyTargets(Message):
         arguments.append(encode(self.message))
         return Line(source, b"407", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"407")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.orig_target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class NoSuchService(Message):
     """
@@ -6217,14 +9542,21 @@ class NoSuchService(Message):
         return 'NoSuchService(source={}, target={}, name={})'.format(repr(self.source), repr(self.target), repr(self.name))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 408:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -6232,7 +9564,8 @@ class NoSuchService(Message):
         i += 1
         # line.arguments[i]: 'No such service'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, name=name)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6245,6 +9578,22 @@ class NoSuchService(Message):
         arguments.append(b'No such service')
         return Line(source, b"408", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"408")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.name)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :No such service')
+        return finish_raw(pieces)
+
 
 class NoOrigin(Message):
     """
@@ -6261,20 +9610,28 @@ class NoOrigin(Message):
         return 'NoOrigin(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 409:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'No origin specified'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6286,6 +9643,19 @@ class NoOrigin(Message):
         arguments.append(b'No origin specified')
         return Line(source, b"409", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"409")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :No origin specified')
+        return finish_raw(pieces)
+
 
 class NoRecipient(Message):
     """
@@ -6302,20 +9672,28 @@ class NoRecipient(Message):
         return 'NoRecipient(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 411:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'No recipient given'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6327,6 +9705,19 @@ class NoRecipient(Message):
         arguments.append(b'No recipient given')
         return Line(source, b"411", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"411")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :No recipient given')
+        return finish_raw(pieces)
+
 
 class NoTextToSend(Message):
     """
@@ -6343,20 +9734,28 @@ class NoTextToSend(Message):
         return 'NoTextToSend(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 412:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'No text to send'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6368,6 +9767,19 @@ class NoTextToSend(Message):
         arguments.append(b'No text to send')
         return Line(source, b"412", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"412")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :No text to send')
+        return finish_raw(pieces)
+
 
 class NoTopLevel(Message):
     """
@@ -6385,14 +9797,21 @@ class NoTopLevel(Message):
         return 'NoTopLevel(source={}, target={}, mask={})'.format(repr(self.source), repr(self.target), repr(self.mask))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 413:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -6400,7 +9819,8 @@ class NoTopLevel(Message):
         i += 1
         # line.arguments[i]: 'No toplevel domain specified'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, mask=mask)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6413,6 +9833,22 @@ class NoTopLevel(Message):
         arguments.append(b'No toplevel domain specified')
         return Line(source, b"413", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"413")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.mask)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :No toplevel domain specified')
+        return finish_raw(pieces)
+
 
 class WildTopLevel(Message):
     """
@@ -6430,14 +9866,21 @@ class WildTopLevel(Message):
         return 'WildTopLevel(source={}, target={}, mask={})'.format(repr(self.source), repr(self.target), repr(self.mask))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 414:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -6445,7 +9888,8 @@ class WildTopLevel(Message):
         i += 1
         # line.arguments[i]: 'Wildcard in toplevel domain'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, mask=mask)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6458,6 +9902,22 @@ class WildTopLevel(Message):
         arguments.append(b'Wildcard in toplevel domain')
         return Line(source, b"414", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"414")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.mask)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Wildcard in toplevel domain')
+        return finish_raw(pieces)
+
 
 class BadMask(Message):
     """
@@ -6475,14 +9935,21 @@ class BadMask(Message):
         return 'BadMask(source={}, target={}, mask={})'.format(repr(self.source), repr(self.target), repr(self.mask))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 415:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -6490,7 +9957,8 @@ class BadMask(Message):
         i += 1
         # line.arguments[i]: 'Bad Server/host mask'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, mask=mask)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6503,6 +9971,22 @@ class BadMask(Message):
         arguments.append(b'Bad Server/host mask')
         return Line(source, b"415", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"415")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.mask)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Bad Server/host mask')
+        return finish_raw(pieces)
+
 
 class UnknownCommand(Message):
     """
@@ -6520,14 +10004,21 @@ class UnknownCommand(Message):
         return 'UnknownCommand(source={}, target={}, command={})'.format(repr(self.source), repr(self.target), repr(self.command))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 421:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -6535,7 +10026,8 @@ class UnknownCommand(Message):
         i += 1
         # line.arguments[i]: 'Unknown command'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, command=command)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6548,6 +10040,22 @@ class UnknownCommand(Message):
         arguments.append(b'Unknown command')
         return Line(source, b"421", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"421")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.command)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Unknown command')
+        return finish_raw(pieces)
+
 
 class NoMotd(Message):
     """
@@ -6564,20 +10072,28 @@ class NoMotd(Message):
         return 'NoMotd(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 422:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'MOTD File is missing'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6589,6 +10105,19 @@ class NoMotd(Message):
         arguments.append(b'MOTD File is missing')
         return Line(source, b"422", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"422")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :MOTD File is missing')
+        return finish_raw(pieces)
+
 
 class NoAdminInfo(Message):
     """
@@ -6606,14 +10135,21 @@ class NoAdminInfo(Message):
         return 'NoAdminInfo(source={}, target={}, server={})'.format(repr(self.source), repr(self.target), repr(self.server))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 423:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -6621,7 +10157,8 @@ class NoAdminInfo(Message):
         i += 1
         # line.arguments[i]: 'No administrative info available'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, server=server)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6634,6 +10171,22 @@ class NoAdminInfo(Message):
         arguments.append(b'No administrative info available')
         return Line(source, b"423", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"423")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.server)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :No administrative info available')
+        return finish_raw(pieces)
+
 
 class FileError(Message):
     """
@@ -6651,20 +10204,28 @@ class FileError(Message):
         return 'FileError(source={}, target={}, message={})'.format(repr(self.source), repr(self.target), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 424:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6676,6 +10237,20 @@ class FileError(Message):
         arguments.append(encode(self.message))
         return Line(source, b"424", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"424")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class NoNicknameGiven(Message):
     """
@@ -6692,20 +10267,28 @@ class NoNicknameGiven(Message):
         return 'NoNicknameGiven(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 431:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'No nickname given'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6717,6 +10300,19 @@ class NoNicknameGiven(Message):
         arguments.append(b'No nickname given')
         return Line(source, b"431", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"431")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :No nickname given')
+        return finish_raw(pieces)
+
 
 class ErroneusNickname(Message):
     """
@@ -6734,14 +10330,21 @@ class ErroneusNickname(Message):
         return 'ErroneusNickname(source={}, target={}, nickname={})'.format(repr(self.source), repr(self.target), repr(self.nickname))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 432:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -6749,7 +10352,8 @@ class ErroneusNickname(Message):
         i += 1
         # line.arguments[i]: 'Erroneous nickname'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, nickname=nickname)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6762,6 +10366,22 @@ class ErroneusNickname(Message):
         arguments.append(b'Erroneous nickname')
         return Line(source, b"432", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"432")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Erroneous nickname')
+        return finish_raw(pieces)
+
 
 class NicknameInUse(Message):
     """
@@ -6779,14 +10399,21 @@ class NicknameInUse(Message):
         return 'NicknameInUse(source={}, target={}, nickname={})'.format(repr(self.source), repr(self.target), repr(self.nickname))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 433:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -6794,7 +10421,8 @@ class NicknameInUse(Message):
         i += 1
         # line.arguments[i]: 'Nickname is already in use'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, nickname=nickname)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6807,6 +10435,22 @@ class NicknameInUse(Message):
         arguments.append(b'Nickname is already in use')
         return Line(source, b"433", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"433")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Nickname is already in use')
+        return finish_raw(pieces)
+
 
 class NickCollision(Message):
     """
@@ -6825,14 +10469,21 @@ class NickCollision(Message):
         return 'NickCollision(source={}, target={}, nickname={}, message={})'.format(repr(self.source), repr(self.target), repr(self.nickname), repr(self.message))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 436:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -6840,7 +10491,8 @@ class NickCollision(Message):
         i += 1
         message = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, nickname=nickname, message=message)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6853,6 +10505,23 @@ class NickCollision(Message):
         arguments.append(encode(self.message))
         return Line(source, b"436", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"436")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.message)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class UnavailResource(Message):
     """
@@ -6870,14 +10539,21 @@ class UnavailResource(Message):
         return 'UnavailResource(source={}, target={}, name={})'.format(repr(self.source), repr(self.target), repr(self.name))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 437:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -6885,7 +10561,8 @@ class UnavailResource(Message):
         i += 1
         # line.arguments[i]: 'Nick/channel is temporarily unavailable'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, name=name)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6898,10 +10575,26 @@ class UnavailResource(Message):
         arguments.append(b'Nick/channel is temporarily unavailable')
         return Line(source, b"437", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"437")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.name)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Nick/channel is temporarily unavailable')
+        return finish_raw(pieces)
+
 
 class UserNotInChannel(Message):
     """
-    ``441 <target> <nickname> <channel> :They aren't on that channel``
+    ``441 <target> <nickname> <#channel> :They aren't on that channel``
     """
 
     __slots__ = ['target', 'nickname', 'channel']
@@ -6916,14 +10609,21 @@ class UserNotInChannel(Message):
         return 'UserNotInChannel(source={}, target={}, nickname={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.nickname), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 441:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -6933,7 +10633,8 @@ class UserNotInChannel(Message):
         i += 1
         # line.arguments[i]: "They aren't on that channel"
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, nickname=nickname, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6947,10 +10648,29 @@ class UserNotInChannel(Message):
         arguments.append(b"They aren't on that channel")
         return Line(source, b"441", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"441")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.nickname)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b" :They aren't on that channel")
+        return finish_raw(pieces)
+
 
 class NotOnChannel(Message):
     """
-    ``442 <target> <channel> :You're not on that channel``
+    ``442 <target> <#channel> :You're not on that channel``
     """
 
     __slots__ = ['target', 'channel']
@@ -6964,14 +10684,21 @@ class NotOnChannel(Message):
         return 'NotOnChannel(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 442:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -6979,7 +10706,8 @@ class NotOnChannel(Message):
         i += 1
         # line.arguments[i]: "You're not on that channel"
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -6992,10 +10720,26 @@ class NotOnChannel(Message):
         arguments.append(b"You're not on that channel")
         return Line(source, b"442", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"442")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b" :You're not on that channel")
+        return finish_raw(pieces)
+
 
 class UserOnChannel(Message):
     """
-    ``443 <target> <user> <channel> :is already on channel``
+    ``443 <target> <user> <#channel> :is already on channel``
     """
 
     __slots__ = ['target', 'user', 'channel']
@@ -7010,14 +10754,21 @@ class UserOnChannel(Message):
         return 'UserOnChannel(source={}, target={}, user={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.user), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 443:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -7027,7 +10778,8 @@ class UserOnChannel(Message):
         i += 1
         # line.arguments[i]: 'is already on channel'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, user=user, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -7041,6 +10793,25 @@ class UserOnChannel(Message):
         arguments.append(b'is already on channel')
         return Line(source, b"443", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"443")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.user)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :is already on channel')
+        return finish_raw(pieces)
+
 
 class NoLogin(Message):
     """
@@ -7058,14 +10829,21 @@ class NoLogin(Message):
         return 'NoLogin(source={}, target={}, user={})'.format(repr(self.source), repr(self.target), repr(self.user))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 444:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -7073,7 +10851,8 @@ class NoLogin(Message):
         i += 1
         # line.arguments[i]: 'User not logged in'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, user=user)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -7086,6 +10865,22 @@ class NoLogin(Message):
         arguments.append(b'User not logged in')
         return Line(source, b"444", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"444")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.user)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :User not logged in')
+        return finish_raw(pieces)
+
 
 class SummonDisabled(Message):
     """
@@ -7102,20 +10897,28 @@ class SummonDisabled(Message):
         return 'SummonDisabled(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 445:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'SUMMON has been disabled'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -7127,6 +10930,19 @@ class SummonDisabled(Message):
         arguments.append(b'SUMMON has been disabled')
         return Line(source, b"445", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"445")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :SUMMON has been disabled')
+        return finish_raw(pieces)
+
 
 class UsersDisabled(Message):
     """
@@ -7143,20 +10959,28 @@ class UsersDisabled(Message):
         return 'UsersDisabled(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 446:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'USERS has been disabled'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -7168,6 +10992,19 @@ class UsersDisabled(Message):
         arguments.append(b'USERS has been disabled')
         return Line(source, b"446", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"446")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :USERS has been disabled')
+        return finish_raw(pieces)
+
 
 class NotRegistered(Message):
     """
@@ -7184,20 +11021,28 @@ class NotRegistered(Message):
         return 'NotRegistered(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 451:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'You have not registered'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -7209,6 +11054,19 @@ class NotRegistered(Message):
         arguments.append(b'You have not registered')
         return Line(source, b"451", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"451")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :You have not registered')
+        return finish_raw(pieces)
+
 
 class NeedMoreParams(Message):
     """
@@ -7226,14 +11084,21 @@ class NeedMoreParams(Message):
         return 'NeedMoreParams(source={}, target={}, command={})'.format(repr(self.source), repr(self.target), repr(self.command))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 461:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -7241,7 +11106,8 @@ class NeedMoreParams(Message):
         i += 1
         # line.arguments[i]: 'Not enough parameters'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, command=command)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -7254,6 +11120,22 @@ class NeedMoreParams(Message):
         arguments.append(b'Not enough parameters')
         return Line(source, b"461", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"461")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.command)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Not enough parameters')
+        return finish_raw(pieces)
+
 
 class AlreadyRegistered(Message):
     """
@@ -7270,20 +11152,28 @@ class AlreadyRegistered(Message):
         return 'AlreadyRegistered(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 462:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'Unauthorized command (already registered)'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -7295,6 +11185,19 @@ class AlreadyRegistered(Message):
         arguments.append(b'Unauthorized command (already registered)')
         return Line(source, b"462", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"462")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Unauthorized command (already registered)')
+        return finish_raw(pieces)
+
 
 class NoPermForHost(Message):
     """
@@ -7311,20 +11214,28 @@ class NoPermForHost(Message):
         return 'NoPermForHost(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 463:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: "Your host isn't among the privileged"
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -7336,6 +11247,19 @@ class NoPermForHost(Message):
         arguments.append(b"Your host isn't among the privileged")
         return Line(source, b"463", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"463")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b" :Your host isn't among the privileged")
+        return finish_raw(pieces)
+
 
 class PasswordMismatch(Message):
     """
@@ -7352,20 +11276,28 @@ class PasswordMismatch(Message):
         return 'PasswordMismatch(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 464:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'Password incorrect'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -7377,6 +11309,19 @@ class PasswordMismatch(Message):
         arguments.append(b'Password incorrect')
         return Line(source, b"464", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"464")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Password incorrect')
+        return finish_raw(pieces)
+
 
 class YoureBannedCreep(Message):
     """
@@ -7393,20 +11338,28 @@ class YoureBannedCreep(Message):
         return 'YoureBannedCreep(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 465:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
         # line.arguments[i]: 'You are banned from this server'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -7418,6 +11371,19 @@ class YoureBannedCreep(Message):
         arguments.append(b'You are banned from this server')
         return Line(source, b"465", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"465")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :You are banned from this server')
+        return finish_raw(pieces)
+
 
 class YouWillBeBanned(Message):
     """
@@ -7434,18 +11400,26 @@ class YouWillBeBanned(Message):
         return 'YouWillBeBanned(source={}, target={})'.format(repr(self.source), repr(self.target))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 466:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 1):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -7456,10 +11430,21 @@ class YouWillBeBanned(Message):
         arguments.append(encode(self.target))
         return Line(source, b"466", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"466")
+        arg = encode(self.target)
+        pieces += (b' :' if not arg or 32 in arg or 9 in arg else b' ', arg)
+        return finish_raw(pieces)
+
 
 class KeySet(Message):
     """
-    ``467 <target> <channel> :Channel key already set``
+    ``467 <target> <#channel> :Channel key already set``
     """
 
     __slots__ = ['target', 'channel']
@@ -7473,14 +11458,21 @@ class KeySet(Message):
         return 'KeySet(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 467:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -7488,7 +11480,8 @@ class KeySet(Message):
         i += 1
         # line.arguments[i]: 'Channel key already set'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -7501,10 +11494,26 @@ class KeySet(Message):
         arguments.append(b'Channel key already set')
         return Line(source, b"467", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"467")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Channel key already set')
+        return finish_raw(pieces)
+
 
 class ChannelIsFull(Message):
     """
-    ``471 <target> <channel> :Cannot join channel (+l)``
+    ``471 <target> <#channel> :Cannot join channel (+l)``
     """
 
     __slots__ = ['target', 'channel']
@@ -7518,14 +11527,21 @@ class ChannelIsFull(Message):
         return 'ChannelIsFull(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 471:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -7533,7 +11549,8 @@ class ChannelIsFull(Message):
         i += 1
         # line.arguments[i]: 'Cannot join channel (+l)'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -7546,6 +11563,22 @@ class ChannelIsFull(Message):
         arguments.append(b'Cannot join channel (+l)')
         return Line(source, b"471", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"471")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Cannot join channel (+l)')
+        return finish_raw(pieces)
+
 
 class UnknownMode(Message):
     """
@@ -7563,14 +11596,21 @@ class UnknownMode(Message):
         return 'UnknownMode(source={}, target={}, char={})'.format(repr(self.source), repr(self.target), repr(self.char))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 472:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -7578,7 +11618,8 @@ class UnknownMode(Message):
         i += 1
         # line.arguments[i]: 'is unknown mode char to me'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, char=char)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -7591,10 +11632,26 @@ class UnknownMode(Message):
         arguments.append(b'is unknown mode char to me')
         return Line(source, b"472", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"472")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.char)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :is unknown mode char to me')
+        return finish_raw(pieces)
+
 
 class InviteOnlyChan(Message):
     """
-    ``473 <target> <channel> :Cannot join channel (+i)``
+    ``473 <target> <#channel> :Cannot join channel (+i)``
     """
 
     __slots__ = ['target', 'channel']
@@ -7608,14 +11665,21 @@ class InviteOnlyChan(Message):
         return 'InviteOnlyChan(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 473:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -7623,7 +11687,8 @@ class InviteOnlyChan(Message):
         i += 1
         # line.arguments[i]: 'Cannot join channel (+i)'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -7636,10 +11701,26 @@ class InviteOnlyChan(Message):
         arguments.append(b'Cannot join channel (+i)')
         return Line(source, b"473", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"473")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Cannot join channel (+i)')
+        return finish_raw(pieces)
+
 
 class BannedFromChan(Message):
     """
-    ``474 <target> <channel> :Cannot join channel (+b)``
+    ``474 <target> <#channel> :Cannot join channel (+b)``
     """
 
     __slots__ = ['target', 'channel']
@@ -7653,14 +11734,21 @@ class BannedFromChan(Message):
         return 'BannedFromChan(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 474:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -7668,7 +11756,8 @@ class BannedFromChan(Message):
         i += 1
         # line.arguments[i]: 'Cannot join channel (+b)'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -7681,10 +11770,26 @@ class BannedFromChan(Message):
         arguments.append(b'Cannot join channel (+b)')
         return Line(source, b"474", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"474")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Cannot join channel (+b)')
+        return finish_raw(pieces)
+
 
 class BadChannelKey(Message):
     """
-    ``475 <target> <channel> :Cannot join channel (+k)``
+    ``475 <target> <#channel> :Cannot join channel (+k)``
     """
 
     __slots__ = ['target', 'channel']
@@ -7698,14 +11803,21 @@ class BadChannelKey(Message):
         return 'BadChannelKey(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 475:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
         i = 0
         target = decode(line.arguments[i])
         i += 1
@@ -7713,7 +11825,8 @@ class BadChannelKey(Message):
         i += 1
         # line.arguments[i]: 'Cannot join channel (+k)'
         i += 1
-        assert i == len(line.arguments)
+        if i != len(line.arguments):
+            return None
         return cls(source=source, target=target, channel=channel)
 
     def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
@@ -7726,661 +11839,7246 @@ class BadChannelKey(Message):
         arguments.append(b'Cannot join channel (+k)')
         return Line(source, b"475", arguments)
 
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"475")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Cannot join channel (+k)')
+        return finish_raw(pieces)
+
+
+class BadChanMask(Message):
+    """
+    ``476 <target> <#channel> :Bad Channel Mask``
+    """
+
+    __slots__ = ['target', 'channel']
+
+    def __init__(self, source: str, target: str, channel: str) -> None:
+        self.source = source
+        self.target = target
+        self.channel = channel
+
+    def __repr__(self) -> str:
+        return 'BadChanMask(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
+
+    @classmethod
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 476:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
+        i = 0
+        target = decode(line.arguments[i])
+        i += 1
+        channel = decode(line.arguments[i])
+        i += 1
+        # line.arguments[i]: 'Bad Channel Mask'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        return cls(source=source, target=target, channel=channel)
+
+    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
+        source = None
+        if self.source is not None:
+            source = encode(self.source)
+        arguments = []
+        arguments.append(encode(self.target))
+        arguments.append(encode(self.channel))
+        arguments.append(b'Bad Channel Mask')
+        return Line(source, b"476", arguments)
+
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"476")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Bad Channel Mask')
+        return finish_raw(pieces)
+
+
+class NoChanModes(Message):
+    """
+    ``477 <target> <#channel> :Channel doesn't support modes``
+    """
+
+    __slots__ = ['target', 'channel']
+
+    def __init__(self, source: str, target: str, channel: str) -> None:
+        self.source = source
+        self.target = target
+        self.channel = channel
+
+    def __repr__(self) -> str:
+        return 'NoChanModes(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
+
+    @classmethod
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 477:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
+        i = 0
+        target = decode(line.arguments[i])
+        i += 1
+        channel = decode(line.arguments[i])
+        i += 1
+        # line.arguments[i]: "Channel doesn't support modes"
+        i += 1
+        if i != len(line.arguments):
+            return None
+        return cls(source=source, target=target, channel=channel)
+
+    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
+        source = None
+        if self.source is not None:
+            source = encode(self.source)
+        arguments = []
+        arguments.append(encode(self.target))
+        arguments.append(encode(self.channel))
+        arguments.append(b"Channel doesn't support modes")
+        return Line(source, b"477", arguments)
+
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"477")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b" :Channel doesn't support modes")
+        return finish_raw(pieces)
+
+
+class BanListFull(Message):
+    """
+    ``478 <target> <#channel> <char> :Channel list is full``
+    """
+
+    __slots__ = ['target', 'channel', 'char']
+
+    def __init__(self, source: str, target: str, channel: str, char: str) -> None:
+        self.source = source
+        self.target = target
+        self.channel = channel
+        self.char = char
+
+    def __repr__(self) -> str:
+        return 'BanListFull(source={}, target={}, channel={}, char={})'.format(repr(self.source), repr(self.target), repr(self.channel), repr(self.char))
+
+    @classmethod
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 478:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
+        i = 0
+        target = decode(line.arguments[i])
+        i += 1
+        channel = decode(line.arguments[i])
+        i += 1
+        char = decode(line.arguments[i])
+        i += 1
+        # line.arguments[i]: 'Channel list is full'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        return cls(source=source, target=target, channel=channel, char=char)
+
+    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
+        source = None
+        if self.source is not None:
+            source = encode(self.source)
+        arguments = []
+        arguments.append(encode(self.target))
+        arguments.append(encode(self.channel))
+        arguments.append(encode(self.char))
+        arguments.append(b'Channel list is full')
+        return Line(source, b"478", arguments)
+
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"478")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.char)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Channel list is full')
+        return finish_raw(pieces)
+
+
+class NoPrivileges(Message):
+    """
+    ``481 <target> :Permission Denied- You're not an IRC operator``
+    """
+
+    __slots__ = ['target']
+
+    def __init__(self, source: str, target: str) -> None:
+        self.source = source
+        self.target = target
+
+    def __repr__(self) -> str:
+        return 'NoPrivileges(source={}, target={})'.format(repr(self.source), repr(self.target))
+
+    @classmethod
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 481:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
+        i = 0
+        target = decode(line.arguments[i])
+        i += 1
+        # line.arguments[i]: "Permission Denied- You're not an IRC operator"
+        i += 1
+        if i != len(line.arguments):
+            return None
+        return cls(source=source, target=target)
+
+    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
+        source = None
+        if self.source is not None:
+            source = encode(self.source)
+        arguments = []
+        arguments.append(encode(self.target))
+        arguments.append(b"Permission Denied- You're not an IRC operator")
+        return Line(source, b"481", arguments)
+
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"481")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b" :Permission Denied- You're not an IRC operator")
+        return finish_raw(pieces)
+
+
+class ChanOpPrivsNeeded(Message):
+    """
+    ``482 <target> <#channel> :You're not channel operator``
+    """
+
+    __slots__ = ['target', 'channel']
+
+    def __init__(self, source: str, target: str, channel: str) -> None:
+        self.source = source
+        self.target = target
+        self.channel = channel
+
+    def __repr__(self) -> str:
+        return 'ChanOpPrivsNeeded(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
+
+    @classmethod
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 482:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
+        i = 0
+        target = decode(line.arguments[i])
+        i += 1
+        channel = decode(line.arguments[i])
+        i += 1
+        # line.arguments[i]: "You're not channel operator"
+        i += 1
+        if i != len(line.arguments):
+            return None
+        return cls(source=source, target=target, channel=channel)
+
+    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
+        source = None
+        if self.source is not None:
+            source = encode(self.source)
+        arguments = []
+        arguments.append(encode(self.target))
+        arguments.append(encode(self.channel))
+        arguments.append(b"You're not channel operator")
+        return Line(source, b"482", arguments)
+
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"482")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        arg = encode(self.channel)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b" :You're not channel operator")
+        return finish_raw(pieces)
+
+
+class CantKillServer(Message):
+    """
+    ``483 <target> :You can't kill a server!``
+    """
+
+    __slots__ = ['target']
+
+    def __init__(self, source: str, target: str) -> None:
+        self.source = source
+        self.target = target
+
+    def __repr__(self) -> str:
+        return 'CantKillServer(source={}, target={})'.format(repr(self.source), repr(self.target))
+
+    @classmethod
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 483:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
+        i = 0
+        target = decode(line.arguments[i])
+        i += 1
+        # line.arguments[i]: "You can't kill a server!"
+        i += 1
+        if i != len(line.arguments):
+            return None
+        return cls(source=source, target=target)
+
+    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
+        source = None
+        if self.source is not None:
+            source = encode(self.source)
+        arguments = []
+        arguments.append(encode(self.target))
+        arguments.append(b"You can't kill a server!")
+        return Line(source, b"483", arguments)
+
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"483")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b" :You can't kill a server!")
+        return finish_raw(pieces)
+
+
+class Restricted(Message):
+    """
+    ``484 <target> :Your connection is restricted!``
+    """
+
+    __slots__ = ['target']
+
+    def __init__(self, source: str, target: str) -> None:
+        self.source = source
+        self.target = target
+
+    def __repr__(self) -> str:
+        return 'Restricted(source={}, target={})'.format(repr(self.source), repr(self.target))
+
+    @classmethod
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 484:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
+        i = 0
+        target = decode(line.arguments[i])
+        i += 1
+        # line.arguments[i]: 'Your connection is restricted!'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        return cls(source=source, target=target)
+
+    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
+        source = None
+        if self.source is not None:
+            source = encode(self.source)
+        arguments = []
+        arguments.append(encode(self.target))
+        arguments.append(b'Your connection is restricted!')
+        return Line(source, b"484", arguments)
+
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"484")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Your connection is restricted!')
+        return finish_raw(pieces)
+
+
+class UniqOpPrivsNeeded(Message):
+    """
+    ``485 <target> :You're not the original channel operator``
+    """
+
+    __slots__ = ['target']
+
+    def __init__(self, source: str, target: str) -> None:
+        self.source = source
+        self.target = target
+
+    def __repr__(self) -> str:
+        return 'UniqOpPrivsNeeded(source={}, target={})'.format(repr(self.source), repr(self.target))
+
+    @classmethod
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 485:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
+        i = 0
+        target = decode(line.arguments[i])
+        i += 1
+        # line.arguments[i]: "You're not the original channel operator"
+        i += 1
+        if i != len(line.arguments):
+            return None
+        return cls(source=source, target=target)
+
+    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
+        source = None
+        if self.source is not None:
+            source = encode(self.source)
+        arguments = []
+        arguments.append(encode(self.target))
+        arguments.append(b"You're not the original channel operator")
+        return Line(source, b"485", arguments)
+
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"485")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b" :You're not the original channel operator")
+        return finish_raw(pieces)
+
+
+class NoOperHost(Message):
+    """
+    ``491 <target> :No O-lines for your host``
+    """
+
+    __slots__ = ['target']
+
+    def __init__(self, source: str, target: str) -> None:
+        self.source = source
+        self.target = target
+
+    def __repr__(self) -> str:
+        return 'NoOperHost(source={}, target={})'.format(repr(self.source), repr(self.target))
+
+    @classmethod
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 491:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
+        i = 0
+        target = decode(line.arguments[i])
+        i += 1
+        # line.arguments[i]: 'No O-lines for your host'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        return cls(source=source, target=target)
+
+    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
+        source = None
+        if self.source is not None:
+            source = encode(self.source)
+        arguments = []
+        arguments.append(encode(self.target))
+        arguments.append(b'No O-lines for your host')
+        return Line(source, b"491", arguments)
+
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"491")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :No O-lines for your host')
+        return finish_raw(pieces)
+
+
+class UserModeUnknownFlag(Message):
+    """
+    ``501 <target> :Unknown MODE flag``
+    """
+
+    __slots__ = ['target']
+
+    def __init__(self, source: str, target: str) -> None:
+        self.source = source
+        self.target = target
+
+    def __repr__(self) -> str:
+        return 'UserModeUnknownFlag(source={}, target={})'.format(repr(self.source), repr(self.target))
+
+    @classmethod
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 501:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
+        i = 0
+        target = decode(line.arguments[i])
+        i += 1
+        # line.arguments[i]: 'Unknown MODE flag'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        return cls(source=source, target=target)
+
+    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
+        source = None
+        if self.source is not None:
+            source = encode(self.source)
+        arguments = []
+        arguments.append(encode(self.target))
+        arguments.append(b'Unknown MODE flag')
+        return Line(source, b"501", arguments)
+
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"501")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Unknown MODE flag')
+        return finish_raw(pieces)
+
+
+class UsersDontMatch(Message):
+    """
+    ``502 <target> :Cannot change mode for other users``
+    """
+
+    __slots__ = ['target']
+
+    def __init__(self, source: str, target: str) -> None:
+        self.source = source
+        self.target = target
+
+    def __repr__(self) -> str:
+        return 'UsersDontMatch(source={}, target={})'.format(repr(self.source), repr(self.target))
+
+    @classmethod
+    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> Message:
+        msg = cls._from_line(line, decode)
+        if msg is None:
+            raise ValueError("incorrect verb or number of arguments")
+        return msg
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 502:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = None
+        if line.source is not None:
+            source = decode_source(line.source, decode)
+        i = 0
+        target = decode(line.arguments[i])
+        i += 1
+        # line.arguments[i]: 'Cannot change mode for other users'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        return cls(source=source, target=target)
+
+    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
+        source = None
+        if self.source is not None:
+            source = encode(self.source)
+        arguments = []
+        arguments.append(encode(self.target))
+        arguments.append(b'Cannot change mode for other users')
+        return Line(source, b"502", arguments)
+
+    def to_raw(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> bytes:
+        pieces = []
+        if self.source is not None:
+            source = encode(self.source)
+            if source:
+                pieces += (b':', source, b' ')
+        pieces.append(b"502")
+        arg = encode(self.target)
+        check_middle(arg)
+        pieces += (b' ', arg)
+        pieces.append(b' :Cannot change mode for other users')
+        return finish_raw(pieces)
+
+
+class LazyPasswd(Passwd):
+    """
+    ``Passwd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    password = LazyField(Passwd.password, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Passwd(source={}, password={})'.format(repr(lazy_source.peek(self)), repr(LazyPasswd.password.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'PASS':
+            return None
+        if not (len(line.arguments) == 1):
+            return None
+        source = line.source
+        i = 0
+        password = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, password=password)
+        msg._decode = decode
+        return msg
+
+
+class LazyNick(Nick):
+    """
+    ``Nick``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    nickname = LazyField(Nick.nickname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Nick(source={}, nickname={})'.format(repr(lazy_source.peek(self)), repr(LazyNick.nickname.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'NICK':
+            return None
+        if not (len(line.arguments) == 1):
+            return None
+        source = line.source
+        i = 0
+        nickname = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, nickname=nickname)
+        msg._decode = decode
+        return msg
+
+
+class LazyUser(User):
+    """
+    ``User``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    user = LazyField(User.user, lambda decode, b: decode(b))
+    realname = LazyField(User.realname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'User(source={}, user={}, mode={}, realname={})'.format(repr(lazy_source.peek(self)), repr(LazyUser.user.peek(self)), repr(self.mode), repr(LazyUser.realname.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'USER':
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        user = line.arguments[i]
+        i += 1
+        mode = int(line.arguments[i])
+        i += 1
+        # line.arguments[i]: '*'
+        i += 1
+        realname = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, user=user, mode=mode, realname=realname)
+        msg._decode = decode
+        return msg
+
+
+class LazyOper(Oper):
+    """
+    ``Oper``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    name = LazyField(Oper.name, lambda decode, b: decode(b))
+    password = LazyField(Oper.password, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Oper(source={}, name={}, password={})'.format(repr(lazy_source.peek(self)), repr(LazyOper.name.peek(self)), repr(LazyOper.password.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'OPER':
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        name = line.arguments[i]
+        i += 1
+        password = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, name=name, password=password)
+        msg._decode = decode
+        return msg
+
+
+class LazyMode(Mode):
+    """
+    ``Mode``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    name = LazyField(Mode.name, lambda decode, b: decode(b))
+    mode = LazyField(Mode.mode, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Mode(source={}, name={}, mode={})'.format(repr(lazy_source.peek(self)), repr(LazyMode.name.peek(self)), repr(LazyMode.mode.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'MODE':
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        name = line.arguments[i]
+        i += 1
+        mode = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, name=name, mode=mode)
+        msg._decode = decode
+        return msg
+
+
+class LazyService(Service):
+    """
+    ``Service``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    nickname = LazyField(Service.nickname, lambda decode, b: decode(b))
+    distribution = LazyField(Service.distribution, lambda decode, b: decode(b))
+    info = LazyField(Service.info, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Service(source={}, nickname={}, distribution={}, type={}, info={})'.format(repr(lazy_source.peek(self)), repr(LazyService.nickname.peek(self)), repr(LazyService.distribution.peek(self)), repr(self.type), repr(LazyService.info.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'SERVICE':
+            return None
+        if not (len(line.arguments) == 6):
+            return None
+        source = line.source
+        i = 0
+        nickname = line.arguments[i]
+        i += 1
+        # line.arguments[i]: '*'
+        i += 1
+        distribution = line.arguments[i]
+        i += 1
+        type = int(line.arguments[i])
+        i += 1
+        # line.arguments[i]: '0'
+        i += 1
+        info = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, nickname=nickname, distribution=distribution, type=type, info=info)
+        msg._decode = decode
+        return msg
+
+
+class LazyQuit(Quit):
+    """
+    ``Quit``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    message = LazyField(Quit.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Quit(source={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyQuit.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'QUIT':
+            return None
+        if not (len(line.arguments) <= 1):
+            return None
+        source = line.source
+        i = 0
+        if len(line.arguments) > 0:
+            message = line.arguments[i]
+            i += 1
+        else:
+            message = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazySQuit(SQuit):
+    """
+    ``SQuit``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    server = LazyField(SQuit.server, lambda decode, b: decode(b))
+    comment = LazyField(SQuit.comment, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'SQuit(source={}, server={}, comment={})'.format(repr(lazy_source.peek(self)), repr(LazySQuit.server.peek(self)), repr(LazySQuit.comment.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'SQUIT':
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        server = line.arguments[i]
+        i += 1
+        comment = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, server=server, comment=comment)
+        msg._decode = decode
+        return msg
+
+
+class LazyChannelJoin(ChannelJoin):
+    """
+    ``ChannelJoin``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    channels = LazyField(ChannelJoin.channels, lambda decode, b: [decode(x) for x in b.split(b",")])
+    keys = LazyField(ChannelJoin.keys, lambda decode, b: [decode(x) for x in b.split(b",")])
+
+    def __repr__(self) -> str:
+        return 'ChannelJoin(source={}, channels={}, keys={})'.format(repr(lazy_source.peek(self)), repr(LazyChannelJoin.channels.peek(self)), repr(LazyChannelJoin.keys.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'JOIN':
+            return None
+        if not (1 <= len(line.arguments) <= 2):
+            return None
+        source = line.source
+        i = 0
+        channels = line.arguments[i]
+        i += 1
+        if len(line.arguments) > 1:
+            keys = line.arguments[i]
+            i += 1
+        else:
+            keys = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, channels=channels, keys=keys)
+        msg._decode = decode
+        return msg
+
+
+class LazyChannelPart(ChannelPart):
+    """
+    ``ChannelPart``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    channels = LazyField(ChannelPart.channels, lambda decode, b: [decode(x) for x in b.split(b",")])
+    message = LazyField(ChannelPart.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'ChannelPart(source={}, channels={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyChannelPart.channels.peek(self)), repr(LazyChannelPart.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'PART':
+            return None
+        if not (1 <= len(line.arguments) <= 2):
+            return None
+        source = line.source
+        i = 0
+        channels = line.arguments[i]
+        i += 1
+        if len(line.arguments) > 1:
+            message = line.arguments[i]
+            i += 1
+        else:
+            message = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, channels=channels, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyTopic(Topic):
+    """
+    ``Topic``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    channel = LazyField(Topic.channel, lambda decode, b: decode(b))
+    topic = LazyField(Topic.topic, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Topic(source={}, channel={}, topic={})'.format(repr(lazy_source.peek(self)), repr(LazyTopic.channel.peek(self)), repr(LazyTopic.topic.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'TOPIC':
+            return None
+        if not (1 <= len(line.arguments) <= 2):
+            return None
+        source = line.source
+        i = 0
+        channel = line.arguments[i]
+        i += 1
+        if len(line.arguments) > 1:
+            topic = line.arguments[i]
+            i += 1
+        else:
+            topic = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, channel=channel, topic=topic)
+        msg._decode = decode
+        return msg
+
+
+class LazyNames(Names):
+    """
+    ``Names``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    channels = LazyField(Names.channels, lambda decode, b: [decode(x) for x in b.split(b",")])
+    target = LazyField(Names.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Names(source={}, channels={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyNames.channels.peek(self)), repr(LazyNames.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'NAMES':
+            return None
+        if not (len(line.arguments) <= 2):
+            return None
+        source = line.source
+        i = 0
+        if len(line.arguments) > 0:
+            channels = line.arguments[i]
+            i += 1
+        else:
+            channels = None
+        if len(line.arguments) > 1:
+            target = line.arguments[i]
+            i += 1
+        else:
+            target = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, channels=channels, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyList(List):
+    """
+    ``List``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    channels = LazyField(List.channels, lambda decode, b: [decode(x) for x in b.split(b",")])
+    target = LazyField(List.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'List(source={}, channels={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyList.channels.peek(self)), repr(LazyList.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'LIST':
+            return None
+        if not (len(line.arguments) <= 2):
+            return None
+        source = line.source
+        i = 0
+        if len(line.arguments) > 0:
+            channels = line.arguments[i]
+            i += 1
+        else:
+            channels = None
+        if len(line.arguments) > 1:
+            target = line.arguments[i]
+            i += 1
+        else:
+            target = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, channels=channels, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyInvite(Invite):
+    """
+    ``Invite``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    nickname = LazyField(Invite.nickname, lambda decode, b: decode(b))
+    channel = LazyField(Invite.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Invite(source={}, nickname={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyInvite.nickname.peek(self)), repr(LazyInvite.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'INVITE':
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        nickname = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, nickname=nickname, channel=channel)
+        msg._decode = decode
+        return msg
+
+
+class LazyKick(Kick):
+    """
+    ``Kick``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    channels = LazyField(Kick.channels, lambda decode, b: [decode(x) for x in b.split(b",")])
+    users = LazyField(Kick.users, lambda decode, b: [decode(x) for x in b.split(b",")])
+    comment = LazyField(Kick.comment, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Kick(source={}, channels={}, users={}, comment={})'.format(repr(lazy_source.peek(self)), repr(LazyKick.channels.peek(self)), repr(LazyKick.users.peek(self)), repr(LazyKick.comment.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'KICK':
+            return None
+        if not (2 <= len(line.arguments) <= 3):
+            return None
+        source = line.source
+        i = 0
+        channels = line.arguments[i]
+        i += 1
+        users = line.arguments[i]
+        i += 1
+        if len(line.arguments) > 2:
+            comment = line.arguments[i]
+            i += 1
+        else:
+            comment = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, channels=channels, users=users, comment=comment)
+        msg._decode = decode
+        return msg
+
+
+class LazyPrivmsg(Privmsg):
+    """
+    ``Privmsg``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(Privmsg.target, lambda decode, b: decode(b))
+    message = LazyField(Privmsg.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Privmsg(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyPrivmsg.target.peek(self)), repr(LazyPrivmsg.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'PRIVMSG':
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyNotice(Notice):
+    """
+    ``Notice``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(Notice.target, lambda decode, b: decode(b))
+    message = LazyField(Notice.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Notice(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyNotice.target.peek(self)), repr(LazyNotice.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'NOTICE':
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyMotd(Motd):
+    """
+    ``Motd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(Motd.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Motd(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyMotd.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'MOTD':
+            return None
+        if not (len(line.arguments) <= 1):
+            return None
+        source = line.source
+        i = 0
+        if len(line.arguments) > 0:
+            target = line.arguments[i]
+            i += 1
+        else:
+            target = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyLusers(Lusers):
+    """
+    ``Lusers``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    mask = LazyField(Lusers.mask, lambda decode, b: decode(b))
+    target = LazyField(Lusers.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Lusers(source={}, mask={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyLusers.mask.peek(self)), repr(LazyLusers.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'LUSERS':
+            return None
+        if not (len(line.arguments) <= 2):
+            return None
+        source = line.source
+        i = 0
+        if len(line.arguments) > 0:
+            mask = line.arguments[i]
+            i += 1
+        else:
+            mask = None
+        if len(line.arguments) > 1:
+            target = line.arguments[i]
+            i += 1
+        else:
+            target = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, mask=mask, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyVersion(Version):
+    """
+    ``Version``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(Version.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Version(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyVersion.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'VERSION':
+            return None
+        if not (len(line.arguments) <= 1):
+            return None
+        source = line.source
+        i = 0
+        if len(line.arguments) > 0:
+            target = line.arguments[i]
+            i += 1
+        else:
+            target = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyStats(Stats):
+    """
+    ``Stats``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    query = LazyField(Stats.query, lambda decode, b: decode(b))
+    target = LazyField(Stats.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Stats(source={}, query={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyStats.query.peek(self)), repr(LazyStats.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'STATS':
+            return None
+        if not (len(line.arguments) <= 2):
+            return None
+        source = line.source
+        i = 0
+        if len(line.arguments) > 0:
+            query = line.arguments[i]
+            i += 1
+        else:
+            query = None
+        if len(line.arguments) > 1:
+            target = line.arguments[i]
+            i += 1
+        else:
+            target = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, query=query, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyLinks(Links):
+    """
+    ``Links``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    server = LazyField(Links.server, lambda decode, b: decode(b))
+    mask = LazyField(Links.mask, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Links(source={}, server={}, mask={})'.format(repr(lazy_source.peek(self)), repr(LazyLinks.server.peek(self)), repr(LazyLinks.mask.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'LINKS':
+            return None
+        if not (len(line.arguments) <= 2):
+            return None
+        source = line.source
+        i = len(line.arguments) - 1
+        if len(line.arguments) > 0:
+            server = line.arguments[i]
+            i -= 1
+        else:
+            server = None
+        if len(line.arguments) > 1:
+            mask = line.arguments[i]
+            i -= 1
+        else:
+            mask = None
+        if i != -1:
+            return None
+        msg = cls(source=source, server=server, mask=mask)
+        msg._decode = decode
+        return msg
+
+
+class LazyTime(Time):
+    """
+    ``Time``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(Time.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Time(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyTime.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'TIME':
+            return None
+        if not (len(line.arguments) <= 1):
+            return None
+        source = line.source
+        i = 0
+        if len(line.arguments) > 0:
+            target = line.arguments[i]
+            i += 1
+        else:
+            target = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyServerConnect(ServerConnect):
+    """
+    ``ServerConnect``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(ServerConnect.target, lambda decode, b: decode(b))
+    remote = LazyField(ServerConnect.remote, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'ServerConnect(source={}, target={}, port={}, remote={})'.format(repr(lazy_source.peek(self)), repr(LazyServerConnect.target.peek(self)), repr(self.port), repr(LazyServerConnect.remote.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'CONNECT':
+            return None
+        if not (2 <= len(line.arguments) <= 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        port = int(line.arguments[i])
+        i += 1
+        if len(line.arguments) > 2:
+            remote = line.arguments[i]
+            i += 1
+        else:
+            remote = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, port=port, remote=remote)
+        msg._decode = decode
+        return msg
+
+
+class LazyTrace(Trace):
+    """
+    ``Trace``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(Trace.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Trace(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyTrace.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'TRACE':
+            return None
+        if not (len(line.arguments) <= 1):
+            return None
+        source = line.source
+        i = 0
+        if len(line.arguments) > 0:
+            target = line.arguments[i]
+            i += 1
+        else:
+            target = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyAdmin(Admin):
+    """
+    ``Admin``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(Admin.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Admin(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyAdmin.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'ADMIN':
+            return None
+        if not (len(line.arguments) <= 1):
+            return None
+        source = line.source
+        i = 0
+        if len(line.arguments) > 0:
+            target = line.arguments[i]
+            i += 1
+        else:
+            target = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyInfo(Info):
+    """
+    ``Info``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(Info.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Info(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyInfo.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'INFO':
+            return None
+        if not (len(line.arguments) <= 1):
+            return None
+        source = line.source
+        i = 0
+        if len(line.arguments) > 0:
+            target = line.arguments[i]
+            i += 1
+        else:
+            target = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyServList(ServList):
+    """
+    ``ServList``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    mask = LazyField(ServList.mask, lambda decode, b: decode(b))
+    type = LazyField(ServList.type, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'ServList(source={}, mask={}, type={})'.format(repr(lazy_source.peek(self)), repr(LazyServList.mask.peek(self)), repr(LazyServList.type.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'SERVLIST':
+            return None
+        if not (len(line.arguments) <= 2):
+            return None
+        source = line.source
+        i = 0
+        if len(line.arguments) > 0:
+            mask = line.arguments[i]
+            i += 1
+        else:
+            mask = None
+        if len(line.arguments) > 1:
+            type = line.arguments[i]
+            i += 1
+        else:
+            type = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, mask=mask, type=type)
+        msg._decode = decode
+        return msg
+
+
+class LazySQuery(SQuery):
+    """
+    ``SQuery``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    servicename = LazyField(SQuery.servicename, lambda decode, b: decode(b))
+    text = LazyField(SQuery.text, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'SQuery(source={}, servicename={}, text={})'.format(repr(lazy_source.peek(self)), repr(LazySQuery.servicename.peek(self)), repr(LazySQuery.text.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'SQUERY':
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        servicename = line.arguments[i]
+        i += 1
+        text = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, servicename=servicename, text=text)
+        msg._decode = decode
+        return msg
+
+
+class LazyWho(Who):
+    """
+    ``Who``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    mask = LazyField(Who.mask, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Who(source={}, mask={}, operators={})'.format(repr(lazy_source.peek(self)), repr(LazyWho.mask.peek(self)), repr(self.operators))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'WHO':
+            return None
+        if not (len(line.arguments) <= 2):
+            return None
+        source = line.source
+        i = 0
+        if len(line.arguments) > 0:
+            mask = line.arguments[i]
+            i += 1
+        else:
+            mask = None
+        if len(line.arguments) > 1:
+            operators = True
+            i += 1
+        else:
+            operators = False
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, mask=mask, operators=operators)
+        msg._decode = decode
+        return msg
+
+
+class LazyWhoIs(WhoIs):
+    """
+    ``WhoIs``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(WhoIs.target, lambda decode, b: decode(b))
+    masks = LazyField(WhoIs.masks, lambda decode, b: [decode(x) for x in b.split(b",")])
+
+    def __repr__(self) -> str:
+        return 'WhoIs(source={}, target={}, masks={})'.format(repr(lazy_source.peek(self)), repr(LazyWhoIs.target.peek(self)), repr(LazyWhoIs.masks.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'WHOIS':
+            return None
+        if not (1 <= len(line.arguments) <= 2):
+            return None
+        source = line.source
+        i = 0
+        if len(line.arguments) > 1:
+            target = line.arguments[i]
+            i += 1
+        else:
+            target = None
+        masks = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, masks=masks)
+        msg._decode = decode
+        return msg
+
+
+class LazyWhoWas(WhoWas):
+    """
+    ``WhoWas``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    nicknames = LazyField(WhoWas.nicknames, lambda decode, b: [decode(x) for x in b.split(b",")])
+    target = LazyField(WhoWas.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'WhoWas(source={}, nicknames={}, count={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyWhoWas.nicknames.peek(self)), repr(self.count), repr(LazyWhoWas.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'WHOWAS':
+            return None
+        if not (1 <= len(line.arguments) <= 3):
+            return None
+        source = line.source
+        i = 0
+        nicknames = line.arguments[i]
+        i += 1
+        if len(line.arguments) > 1:
+            count = int(line.arguments[i])
+            i += 1
+        else:
+            count = None
+        if len(line.arguments) > 2:
+            target = line.arguments[i]
+            i += 1
+        else:
+            target = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, nicknames=nicknames, count=count, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyKill(Kill):
+    """
+    ``Kill``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    nickname = LazyField(Kill.nickname, lambda decode, b: decode(b))
+    comment = LazyField(Kill.comment, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Kill(source={}, nickname={}, comment={})'.format(repr(lazy_source.peek(self)), repr(LazyKill.nickname.peek(self)), repr(LazyKill.comment.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'KILL':
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        nickname = line.arguments[i]
+        i += 1
+        comment = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, nickname=nickname, comment=comment)
+        msg._decode = decode
+        return msg
+
+
+class LazyPing(Ping):
+    """
+    ``Ping``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    server1 = LazyField(Ping.server1, lambda decode, b: decode(b))
+    server2 = LazyField(Ping.server2, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Ping(source={}, server1={}, server2={})'.format(repr(lazy_source.peek(self)), repr(LazyPing.server1.peek(self)), repr(LazyPing.server2.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'PING':
+            return None
+        if not (1 <= len(line.arguments) <= 2):
+            return None
+        source = line.source
+        i = 0
+        server1 = line.arguments[i]
+        i += 1
+        if len(line.arguments) > 1:
+            server2 = line.arguments[i]
+            i += 1
+        else:
+            server2 = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, server1=server1, server2=server2)
+        msg._decode = decode
+        return msg
+
+
+class LazyPong(Pong):
+    """
+    ``Pong``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    server = LazyField(Pong.server, lambda decode, b: decode(b))
+    server2 = LazyField(Pong.server2, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Pong(source={}, server={}, server2={})'.format(repr(lazy_source.peek(self)), repr(LazyPong.server.peek(self)), repr(LazyPong.server2.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'PONG':
+            return None
+        if not (1 <= len(line.arguments) <= 2):
+            return None
+        source = line.source
+        i = 0
+        server = line.arguments[i]
+        i += 1
+        if len(line.arguments) > 1:
+            server2 = line.arguments[i]
+            i += 1
+        else:
+            server2 = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, server=server, server2=server2)
+        msg._decode = decode
+        return msg
+
+
+class LazyError(Error):
+    """
+    ``Error``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    message = LazyField(Error.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Error(source={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyError.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'ERROR':
+            return None
+        if not (len(line.arguments) == 1):
+            return None
+        source = line.source
+        i = 0
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyAway(Away):
+    """
+    ``Away``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    text = LazyField(Away.text, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Away(source={}, text={})'.format(repr(lazy_source.peek(self)), repr(LazyAway.text.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'AWAY':
+            return None
+        if not (len(line.arguments) <= 1):
+            return None
+        source = line.source
+        i = 0
+        if len(line.arguments) > 0:
+            text = line.arguments[i]
+            i += 1
+        else:
+            text = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, text=text)
+        msg._decode = decode
+        return msg
+
+
+class LazyRehash(Rehash):
+    """
+    ``Rehash``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+
+    def __repr__(self) -> str:
+        return 'Rehash(source={})'.format(repr(lazy_source.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'REHASH':
+            return None
+        if not (len(line.arguments) == 0):
+            return None
+        source = line.source
+        msg = cls(source=source)
+        msg._decode = decode
+        return msg
+
+
+class LazyDie(Die):
+    """
+    ``Die``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+
+    def __repr__(self) -> str:
+        return 'Die(source={})'.format(repr(lazy_source.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'DIE':
+            return None
+        if not (len(line.arguments) == 0):
+            return None
+        source = line.source
+        msg = cls(source=source)
+        msg._decode = decode
+        return msg
+
+
+class LazyRestart(Restart):
+    """
+    ``Restart``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+
+    def __repr__(self) -> str:
+        return 'Restart(source={})'.format(repr(lazy_source.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'RESTART':
+            return None
+        if not (len(line.arguments) == 0):
+            return None
+        source = line.source
+        msg = cls(source=source)
+        msg._decode = decode
+        return msg
+
+
+class LazySummon(Summon):
+    """
+    ``Summon``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    user = LazyField(Summon.user, lambda decode, b: decode(b))
+    target = LazyField(Summon.target, lambda decode, b: decode(b))
+    channel = LazyField(Summon.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Summon(source={}, user={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazySummon.user.peek(self)), repr(LazySummon.target.peek(self)), repr(LazySummon.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'SUMMON':
+            return None
+        if not (1 <= len(line.arguments) <= 3):
+            return None
+        source = line.source
+        i = 0
+        user = line.arguments[i]
+        i += 1
+        if len(line.arguments) > 1:
+            target = line.arguments[i]
+            i += 1
+        else:
+            target = None
+        if len(line.arguments) > 2:
+            channel = line.arguments[i]
+            i += 1
+        else:
+            channel = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, user=user, target=target, channel=channel)
+        msg._decode = decode
+        return msg
+
+
+class LazyUsers(Users):
+    """
+    ``Users``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(Users.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Users(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyUsers.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'USERS':
+            return None
+        if not (len(line.arguments) <= 1):
+            return None
+        source = line.source
+        i = 0
+        if len(line.arguments) > 0:
+            target = line.arguments[i]
+            i += 1
+        else:
+            target = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyWallOps(WallOps):
+    """
+    ``WallOps``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    message = LazyField(WallOps.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'WallOps(source={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyWallOps.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'WALLOPS':
+            return None
+        if not (len(line.arguments) == 1):
+            return None
+        source = line.source
+        i = 0
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyUserHost(UserHost):
+    """
+    ``UserHost``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    nickname = LazyField(UserHost.nickname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'UserHost(source={}, nickname={})'.format(repr(lazy_source.peek(self)), repr(LazyUserHost.nickname.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'USERHOST':
+            return None
+        if not (len(line.arguments) == 1):
+            return None
+        source = line.source
+        i = 0
+        nickname = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, nickname=nickname)
+        msg._decode = decode
+        return msg
+
+
+class LazyIsOn(IsOn):
+    """
+    ``IsOn``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    nickname = LazyField(IsOn.nickname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'IsOn(source={}, nickname={})'.format(repr(lazy_source.peek(self)), repr(LazyIsOn.nickname.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != b'ISON':
+            return None
+        if not (len(line.arguments) == 1):
+            return None
+        source = line.source
+        i = 0
+        nickname = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, nickname=nickname)
+        msg._decode = decode
+        return msg
+
+
+class LazyWelcome(Welcome):
+    """
+    ``Welcome``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(Welcome.target, lambda decode, b: decode(b))
+    message = LazyField(Welcome.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Welcome(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyWelcome.target.peek(self)), repr(LazyWelcome.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 1:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyYourHost(YourHost):
+    """
+    ``YourHost``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(YourHost.target, lambda decode, b: decode(b))
+    message = LazyField(YourHost.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'YourHost(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyYourHost.target.peek(self)), repr(LazyYourHost.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 2:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyCreated(Created):
+    """
+    ``Created``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(Created.target, lambda decode, b: decode(b))
+    message = LazyField(Created.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Created(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyCreated.target.peek(self)), repr(LazyCreated.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 3:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyMyInfo(MyInfo):
+    """
+    ``MyInfo``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(MyInfo.target, lambda decode, b: decode(b))
+    message = LazyField(MyInfo.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'MyInfo(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyMyInfo.target.peek(self)), repr(LazyMyInfo.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 4:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyBounce(Bounce):
+    """
+    ``Bounce``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(Bounce.target, lambda decode, b: decode(b))
+    message = LazyField(Bounce.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Bounce(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyBounce.target.peek(self)), repr(LazyBounce.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 5:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyTraceLinkReply(TraceLinkReply):
+    """
+    ``TraceLinkReply``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(TraceLinkReply.target, lambda decode, b: decode(b))
+    version = LazyField(TraceLinkReply.version, lambda decode, b: decode(b))
+    destination = LazyField(TraceLinkReply.destination, lambda decode, b: decode(b))
+    next = LazyField(TraceLinkReply.next, lambda decode, b: decode(b))
+    protocol_version = LazyField(TraceLinkReply.protocol_version, lambda decode, b: decode(b))
+    link_uptime = LazyField(TraceLinkReply.link_uptime, lambda decode, b: decode(b))
+    back_send_q = LazyField(TraceLinkReply.back_send_q, lambda decode, b: decode(b))
+    up_send_q = LazyField(TraceLinkReply.up_send_q, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'TraceLinkReply(source={}, target={}, version={}, destination={}, next={}, protocol_version={}, link_uptime={}, back_send_q={}, up_send_q={})'.format(repr(lazy_source.peek(self)), repr(LazyTraceLinkReply.target.peek(self)), repr(LazyTraceLinkReply.version.peek(self)), repr(LazyTraceLinkReply.destination.peek(self)), repr(LazyTraceLinkReply.next.peek(self)), repr(LazyTraceLinkReply.protocol_version.peek(self)), repr(LazyTraceLinkReply.link_uptime.peek(self)), repr(LazyTraceLinkReply.back_send_q.peek(self)), repr(LazyTraceLinkReply.up_send_q.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 200:
+            return None
+        if not (len(line.arguments) == 9):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Link'
+        i += 1
+        version = line.arguments[i]
+        i += 1
+        destination = line.arguments[i]
+        i += 1
+        next = line.arguments[i]
+        i += 1
+        protocol_version = line.arguments[i]
+        i += 1
+        link_uptime = line.arguments[i]
+        i += 1
+        back_send_q = line.arguments[i]
+        i += 1
+        up_send_q = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, version=version, destination=destination, next=next, protocol_version=protocol_version, link_uptime=link_uptime, back_send_q=back_send_q, up_send_q=up_send_q)
+        msg._decode = decode
+        return msg
+
+
+class LazyTraceConnecting(TraceConnecting):
+    """
+    ``TraceConnecting``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(TraceConnecting.target, lambda decode, b: decode(b))
+    klass = LazyField(TraceConnecting.klass, lambda decode, b: decode(b))
+    server = LazyField(TraceConnecting.server, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'TraceConnecting(source={}, target={}, klass={}, server={})'.format(repr(lazy_source.peek(self)), repr(LazyTraceConnecting.target.peek(self)), repr(LazyTraceConnecting.klass.peek(self)), repr(LazyTraceConnecting.server.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 201:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Try.'
+        i += 1
+        klass = line.arguments[i]
+        i += 1
+        server = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, klass=klass, server=server)
+        msg._decode = decode
+        return msg
+
+
+class LazyTraceHandshake(TraceHandshake):
+    """
+    ``TraceHandshake``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(TraceHandshake.target, lambda decode, b: decode(b))
+    klass = LazyField(TraceHandshake.klass, lambda decode, b: decode(b))
+    server = LazyField(TraceHandshake.server, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'TraceHandshake(source={}, target={}, klass={}, server={})'.format(repr(lazy_source.peek(self)), repr(LazyTraceHandshake.target.peek(self)), repr(LazyTraceHandshake.klass.peek(self)), repr(LazyTraceHandshake.server.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 202:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'H.S.'
+        i += 1
+        klass = line.arguments[i]
+        i += 1
+        server = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, klass=klass, server=server)
+        msg._decode = decode
+        return msg
+
+
+class LazyTraceUnknown(TraceUnknown):
+    """
+    ``TraceUnknown``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(TraceUnknown.target, lambda decode, b: decode(b))
+    klass = LazyField(TraceUnknown.klass, lambda decode, b: decode(b))
+    ip = LazyField(TraceUnknown.ip, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'TraceUnknown(source={}, target={}, klass={}, ip={})'.format(repr(lazy_source.peek(self)), repr(LazyTraceUnknown.target.peek(self)), repr(LazyTraceUnknown.klass.peek(self)), repr(LazyTraceUnknown.ip.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 203:
+            return None
+        if not (3 <= len(line.arguments) <= 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: '????'
+        i += 1
+        klass = line.arguments[i]
+        i += 1
+        if len(line.arguments) > 3:
+            ip = line.arguments[i]
+            i += 1
+        else:
+            ip = None
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, klass=klass, ip=ip)
+        msg._decode = decode
+        return msg
+
+
+class LazyTraceOperator(TraceOperator):
+    """
+    ``TraceOperator``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(TraceOperator.target, lambda decode, b: decode(b))
+    klass = LazyField(TraceOperator.klass, lambda decode, b: decode(b))
+    nickname = LazyField(TraceOperator.nickname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'TraceOperator(source={}, target={}, klass={}, nickname={})'.format(repr(lazy_source.peek(self)), repr(LazyTraceOperator.target.peek(self)), repr(LazyTraceOperator.klass.peek(self)), repr(LazyTraceOperator.nickname.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 204:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Oper'
+        i += 1
+        klass = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, klass=klass, nickname=nickname)
+        msg._decode = decode
+        return msg
+
+
+class LazyTraceUser(TraceUser):
+    """
+    ``TraceUser``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(TraceUser.target, lambda decode, b: decode(b))
+    klass = LazyField(TraceUser.klass, lambda decode, b: decode(b))
+    nickname = LazyField(TraceUser.nickname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'TraceUser(source={}, target={}, klass={}, nickname={})'.format(repr(lazy_source.peek(self)), repr(LazyTraceUser.target.peek(self)), repr(LazyTraceUser.klass.peek(self)), repr(LazyTraceUser.nickname.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 205:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'User'
+        i += 1
+        klass = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, klass=klass, nickname=nickname)
+        msg._decode = decode
+        return msg
+
+
+class LazyTraceServer(TraceServer):
+    """
+    ``TraceServer``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(TraceServer.target, lambda decode, b: decode(b))
+    klass = LazyField(TraceServer.klass, lambda decode, b: decode(b))
+    s = LazyField(TraceServer.s, lambda decode, b: decode(b))
+    c = LazyField(TraceServer.c, lambda decode, b: decode(b))
+    server = LazyField(TraceServer.server, lambda decode, b: decode(b))
+    hostmask = LazyField(TraceServer.hostmask, lambda decode, b: decode(b))
+    protocol_version = LazyField(TraceServer.protocol_version, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'TraceServer(source={}, target={}, klass={}, s={}, c={}, server={}, hostmask={}, protocol_version={})'.format(repr(lazy_source.peek(self)), repr(LazyTraceServer.target.peek(self)), repr(LazyTraceServer.klass.peek(self)), repr(LazyTraceServer.s.peek(self)), repr(LazyTraceServer.c.peek(self)), repr(LazyTraceServer.server.peek(self)), repr(LazyTraceServer.hostmask.peek(self)), repr(LazyTraceServer.protocol_version.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 206:
+            return None
+        if not (len(line.arguments) == 8):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Serv'
+        i += 1
+        klass = line.arguments[i]
+        i += 1
+        s = line.arguments[i]
+        i += 1
+        c = line.arguments[i]
+        i += 1
+        server = line.arguments[i]
+        i += 1
+        hostmask = line.arguments[i]
+        i += 1
+        protocol_version = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, klass=klass, s=s, c=c, server=server, hostmask=hostmask, protocol_version=protocol_version)
+        msg._decode = decode
+        return msg
+
+
+class LazyTraceService(TraceService):
+    """
+    ``TraceService``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(TraceService.target, lambda decode, b: decode(b))
+    klass = LazyField(TraceService.klass, lambda decode, b: decode(b))
+    name = LazyField(TraceService.name, lambda decode, b: decode(b))
+    type = LazyField(TraceService.type, lambda decode, b: decode(b))
+    active_type = LazyField(TraceService.active_type, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'TraceService(source={}, target={}, klass={}, name={}, type={}, active_type={})'.format(repr(lazy_source.peek(self)), repr(LazyTraceService.target.peek(self)), repr(LazyTraceService.klass.peek(self)), repr(LazyTraceService.name.peek(self)), repr(LazyTraceService.type.peek(self)), repr(LazyTraceService.active_type.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 207:
+            return None
+        if not (len(line.arguments) == 6):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Service'
+        i += 1
+        klass = line.arguments[i]
+        i += 1
+        name = line.arguments[i]
+        i += 1
+        type = line.arguments[i]
+        i += 1
+        active_type = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, klass=klass, name=name, type=type, active_type=active_type)
+        msg._decode = decode
+        return msg
+
+
+class LazyTraceNewtype(TraceNewtype):
+    """
+    ``TraceNewtype``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(TraceNewtype.target, lambda decode, b: decode(b))
+    newtype = LazyField(TraceNewtype.newtype, lambda decode, b: decode(b))
+    name = LazyField(TraceNewtype.name, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'TraceNewtype(source={}, target={}, newtype={}, name={})'.format(repr(lazy_source.peek(self)), repr(LazyTraceNewtype.target.peek(self)), repr(LazyTraceNewtype.newtype.peek(self)), repr(LazyTraceNewtype.name.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 208:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        newtype = line.arguments[i]
+        i += 1
+        # line.arguments[i]: '0'
+        i += 1
+        name = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, newtype=newtype, name=name)
+        msg._decode = decode
+        return msg
+
+
+class LazyTraceClass(TraceClass):
+    """
+    ``TraceClass``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(TraceClass.target, lambda decode, b: decode(b))
+    klass = LazyField(TraceClass.klass, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'TraceClass(source={}, target={}, klass={}, count={})'.format(repr(lazy_source.peek(self)), repr(LazyTraceClass.target.peek(self)), repr(LazyTraceClass.klass.peek(self)), repr(self.count))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 209:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Class'
+        i += 1
+        klass = line.arguments[i]
+        i += 1
+        count = int(line.arguments[i])
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, klass=klass, count=count)
+        msg._decode = decode
+        return msg
+
+
+class LazyStatsLinkInfo(StatsLinkInfo):
+    """
+    ``StatsLinkInfo``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(StatsLinkInfo.target, lambda decode, b: decode(b))
+    name = LazyField(StatsLinkInfo.name, lambda decode, b: decode(b))
+    sendq = LazyField(StatsLinkInfo.sendq, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'StatsLinkInfo(source={}, target={}, name={}, sendq={}, sent_messages={}, sent_kbytes={}, recv_messages={}, recv_kbytes={}, uptime={})'.format(repr(lazy_source.peek(self)), repr(LazyStatsLinkInfo.target.peek(self)), repr(LazyStatsLinkInfo.name.peek(self)), repr(LazyStatsLinkInfo.sendq.peek(self)), repr(self.sent_messages), repr(self.sent_kbytes), repr(self.recv_messages), repr(self.recv_kbytes), repr(self.uptime))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 211:
+            return None
+        if not (len(line.arguments) == 8):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        name = line.arguments[i]
+        i += 1
+        sendq = line.arguments[i]
+        i += 1
+        sent_messages = int(line.arguments[i])
+        i += 1
+        sent_kbytes = int(line.arguments[i])
+        i += 1
+        recv_messages = int(line.arguments[i])
+        i += 1
+        recv_kbytes = int(line.arguments[i])
+        i += 1
+        uptime = int(line.arguments[i])
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, name=name, sendq=sendq, sent_messages=sent_messages, sent_kbytes=sent_kbytes, recv_messages=recv_messages, recv_kbytes=recv_kbytes, uptime=uptime)
+        msg._decode = decode
+        return msg
+
+
+class LazyStatsCommands(StatsCommands):
+    """
+    ``StatsCommands``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(StatsCommands.target, lambda decode, b: decode(b))
+    command = LazyField(StatsCommands.command, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'StatsCommands(source={}, target={}, command={}, count={}, bytecount={}, remote_count={})'.format(repr(lazy_source.peek(self)), repr(LazyStatsCommands.target.peek(self)), repr(LazyStatsCommands.command.peek(self)), repr(self.count), repr(self.bytecount), repr(self.remote_count))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 212:
+            return None
+        if not (len(line.arguments) == 5):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        command = line.arguments[i]
+        i += 1
+        count = int(line.arguments[i])
+        i += 1
+        bytecount = int(line.arguments[i])
+        i += 1
+        remote_count = int(line.arguments[i])
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, command=command, count=count, bytecount=bytecount, remote_count=remote_count)
+        msg._decode = decode
+        return msg
+
+
+class LazyStatsEnd(StatsEnd):
+    """
+    ``StatsEnd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(StatsEnd.target, lambda decode, b: decode(b))
+    letter = LazyField(StatsEnd.letter, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'StatsEnd(source={}, target={}, letter={})'.format(repr(lazy_source.peek(self)), repr(LazyStatsEnd.target.peek(self)), repr(LazyStatsEnd.letter.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 219:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        letter = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'End of STATS report'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, letter=letter)
+        msg._decode = decode
+        return msg
+
+
+class LazyUserModeIs(UserModeIs):
+    """
+    ``UserModeIs``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(UserModeIs.target, lambda decode, b: decode(b))
+    mode = LazyField(UserModeIs.mode, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'UserModeIs(source={}, target={}, mode={})'.format(repr(lazy_source.peek(self)), repr(LazyUserModeIs.target.peek(self)), repr(LazyUserModeIs.mode.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 221:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        mode = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, mode=mode)
+        msg._decode = decode
+        return msg
+
+
+class LazyServListReply(ServListReply):
+    """
+    ``ServListReply``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(ServListReply.target, lambda decode, b: decode(b))
+    name = LazyField(ServListReply.name, lambda decode, b: decode(b))
+    server = LazyField(ServListReply.server, lambda decode, b: decode(b))
+    mask = LazyField(ServListReply.mask, lambda decode, b: decode(b))
+    type = LazyField(ServListReply.type, lambda decode, b: decode(b))
+    info = LazyField(ServListReply.info, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'ServListReply(source={}, target={}, name={}, server={}, mask={}, type={}, hopcount={}, info={})'.format(repr(lazy_source.peek(self)), repr(LazyServListReply.target.peek(self)), repr(LazyServListReply.name.peek(self)), repr(LazyServListReply.server.peek(self)), repr(LazyServListReply.mask.peek(self)), repr(LazyServListReply.type.peek(self)), repr(self.hopcount), repr(LazyServListReply.info.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 234:
+            return None
+        if not (len(line.arguments) == 7):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        name = line.arguments[i]
+        i += 1
+        server = line.arguments[i]
+        i += 1
+        mask = line.arguments[i]
+        i += 1
+        type = line.arguments[i]
+        i += 1
+        hopcount = int(line.arguments[i])
+        i += 1
+        info = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, name=name, server=server, mask=mask, type=type, hopcount=hopcount, info=info)
+        msg._decode = decode
+        return msg
+
+
+class LazyServListEnd(ServListEnd):
+    """
+    ``ServListEnd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(ServListEnd.target, lambda decode, b: decode(b))
+    mask = LazyField(ServListEnd.mask, lambda decode, b: decode(b))
+    type = LazyField(ServListEnd.type, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'ServListEnd(source={}, target={}, mask={}, type={})'.format(repr(lazy_source.peek(self)), repr(LazyServListEnd.target.peek(self)), repr(LazyServListEnd.mask.peek(self)), repr(LazyServListEnd.type.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 235:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        mask = line.arguments[i]
+        i += 1
+        type = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'End of service listing'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, mask=mask, type=type)
+        msg._decode = decode
+        return msg
+
+
+class LazyStatsUptime(StatsUptime):
+    """
+    ``StatsUptime``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(StatsUptime.target, lambda decode, b: decode(b))
+    message = LazyField(StatsUptime.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'StatsUptime(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyStatsUptime.target.peek(self)), repr(LazyStatsUptime.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 242:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyStatsOline(StatsOline):
+    """
+    ``StatsOline``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(StatsOline.target, lambda decode, b: decode(b))
+    hostmask = LazyField(StatsOline.hostmask, lambda decode, b: decode(b))
+    name = LazyField(StatsOline.name, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'StatsOline(source={}, target={}, hostmask={}, name={})'.format(repr(lazy_source.peek(self)), repr(LazyStatsOline.target.peek(self)), repr(LazyStatsOline.hostmask.peek(self)), repr(LazyStatsOline.name.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 243:
+            return None
+        if not (len(line.arguments) == 5):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'O'
+        i += 1
+        hostmask = line.arguments[i]
+        i += 1
+        # line.arguments[i]: '*'
+        i += 1
+        name = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, hostmask=hostmask, name=name)
+        msg._decode = decode
+        return msg
+
+
+class LazyLuserClient(LuserClient):
+    """
+    ``LuserClient``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(LuserClient.target, lambda decode, b: decode(b))
+    message = LazyField(LuserClient.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'LuserClient(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyLuserClient.target.peek(self)), repr(LazyLuserClient.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 251:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyLuserOp(LuserOp):
+    """
+    ``LuserOp``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(LuserOp.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'LuserOp(source={}, target={}, count={})'.format(repr(lazy_source.peek(self)), repr(LazyLuserOp.target.peek(self)), repr(self.count))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 252:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        count = int(line.arguments[i])
+        i += 1
+        # line.arguments[i]: 'operator(s) online'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, count=count)
+        msg._decode = decode
+        return msg
+
+
+class LazyLuserUnknown(LuserUnknown):
+    """
+    ``LuserUnknown``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(LuserUnknown.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'LuserUnknown(source={}, target={}, count={})'.format(repr(lazy_source.peek(self)), repr(LazyLuserUnknown.target.peek(self)), repr(self.count))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 253:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        count = int(line.arguments[i])
+        i += 1
+        # line.arguments[i]: 'unknown connection(s)'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, count=count)
+        msg._decode = decode
+        return msg
+
+
+class LazyLuserChannels(LuserChannels):
+    """
+    ``LuserChannels``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(LuserChannels.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'LuserChannels(source={}, target={}, count={})'.format(repr(lazy_source.peek(self)), repr(LazyLuserChannels.target.peek(self)), repr(self.count))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 254:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        count = int(line.arguments[i])
+        i += 1
+        # line.arguments[i]: 'channels formed'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, count=count)
+        msg._decode = decode
+        return msg
+
+
+class LazyLuserMe(LuserMe):
+    """
+    ``LuserMe``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(LuserMe.target, lambda decode, b: decode(b))
+    message = LazyField(LuserMe.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'LuserMe(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyLuserMe.target.peek(self)), repr(LazyLuserMe.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 255:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyAdminMe(AdminMe):
+    """
+    ``AdminMe``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(AdminMe.target, lambda decode, b: decode(b))
+    server = LazyField(AdminMe.server, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'AdminMe(source={}, target={}, server={})'.format(repr(lazy_source.peek(self)), repr(LazyAdminMe.target.peek(self)), repr(LazyAdminMe.server.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 256:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        server = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Administrative info'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, server=server)
+        msg._decode = decode
+        return msg
+
+
+class LazyAdminLoc1(AdminLoc1):
+    """
+    ``AdminLoc1``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(AdminLoc1.target, lambda decode, b: decode(b))
+    message = LazyField(AdminLoc1.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'AdminLoc1(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyAdminLoc1.target.peek(self)), repr(LazyAdminLoc1.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 257:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyAdminLoc2(AdminLoc2):
+    """
+    ``AdminLoc2``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(AdminLoc2.target, lambda decode, b: decode(b))
+    message = LazyField(AdminLoc2.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'AdminLoc2(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyAdminLoc2.target.peek(self)), repr(LazyAdminLoc2.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 258:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyAdminEmail(AdminEmail):
+    """
+    ``AdminEmail``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(AdminEmail.target, lambda decode, b: decode(b))
+    email = LazyField(AdminEmail.email, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'AdminEmail(source={}, target={}, email={})'.format(repr(lazy_source.peek(self)), repr(LazyAdminEmail.target.peek(self)), repr(LazyAdminEmail.email.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 259:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        email = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, email=email)
+        msg._decode = decode
+        return msg
+
+
+class LazyTraceLog(TraceLog):
+    """
+    ``TraceLog``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(TraceLog.target, lambda decode, b: decode(b))
+    logfile = LazyField(TraceLog.logfile, lambda decode, b: decode(b))
+    debug_level = LazyField(TraceLog.debug_level, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'TraceLog(source={}, target={}, logfile={}, debug_level={})'.format(repr(lazy_source.peek(self)), repr(LazyTraceLog.target.peek(self)), repr(LazyTraceLog.logfile.peek(self)), repr(LazyTraceLog.debug_level.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 261:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'File'
+        i += 1
+        logfile = line.arguments[i]
+        i += 1
+        debug_level = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, logfile=logfile, debug_level=debug_level)
+        msg._decode = decode
+        return msg
+
+
+class LazyTraceEnd(TraceEnd):
+    """
+    ``TraceEnd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(TraceEnd.target, lambda decode, b: decode(b))
+    server = LazyField(TraceEnd.server, lambda decode, b: decode(b))
+    version = LazyField(TraceEnd.version, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'TraceEnd(source={}, target={}, server={}, version={})'.format(repr(lazy_source.peek(self)), repr(LazyTraceEnd.target.peek(self)), repr(LazyTraceEnd.server.peek(self)), repr(LazyTraceEnd.version.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 262:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        server = line.arguments[i]
+        i += 1
+        version = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'End of TRACE'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, server=server, version=version)
+        msg._decode = decode
+        return msg
+
+
+class LazyTryAgain(TryAgain):
+    """
+    ``TryAgain``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(TryAgain.target, lambda decode, b: decode(b))
+    command = LazyField(TryAgain.command, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'TryAgain(source={}, target={}, command={})'.format(repr(lazy_source.peek(self)), repr(LazyTryAgain.target.peek(self)), repr(LazyTryAgain.command.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 263:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        command = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Please wait a while and try again.'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, command=command)
+        msg._decode = decode
+        return msg
+
+
+class LazyAwayReply(AwayReply):
+    """
+    ``AwayReply``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(AwayReply.target, lambda decode, b: decode(b))
+    nickname = LazyField(AwayReply.nickname, lambda decode, b: decode(b))
+    message = LazyField(AwayReply.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'AwayReply(source={}, target={}, nickname={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyAwayReply.target.peek(self)), repr(LazyAwayReply.nickname.peek(self)), repr(LazyAwayReply.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 301:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, nickname=nickname, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyUserHostReply(UserHostReply):
+    """
+    ``UserHostReply``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(UserHostReply.target, lambda decode, b: decode(b))
+    message = LazyField(UserHostReply.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'UserHostReply(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyUserHostReply.target.peek(self)), repr(LazyUserHostReply.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 302:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyIsOnReply(IsOnReply):
+    """
+    ``IsOnReply``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(IsOnReply.target, lambda decode, b: decode(b))
+    message = LazyField(IsOnReply.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'IsOnReply(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyIsOnReply.target.peek(self)), repr(LazyIsOnReply.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 303:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyUnawayReply(UnawayReply):
+    """
+    ``UnawayReply``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(UnawayReply.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'UnawayReply(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyUnawayReply.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 305:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'You are no longer marked as being away'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyNowAwayReply(NowAwayReply):
+    """
+    ``NowAwayReply``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NowAwayReply.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NowAwayReply(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyNowAwayReply.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 306:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'You have been marked as being away'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyWhoIsUser(WhoIsUser):
+    """
+    ``WhoIsUser``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(WhoIsUser.target, lambda decode, b: decode(b))
+    nickname = LazyField(WhoIsUser.nickname, lambda decode, b: decode(b))
+    user = LazyField(WhoIsUser.user, lambda decode, b: decode(b))
+    host = LazyField(WhoIsUser.host, lambda decode, b: decode(b))
+    realname = LazyField(WhoIsUser.realname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'WhoIsUser(source={}, target={}, nickname={}, user={}, host={}, realname={})'.format(repr(lazy_source.peek(self)), repr(LazyWhoIsUser.target.peek(self)), repr(LazyWhoIsUser.nickname.peek(self)), repr(LazyWhoIsUser.user.peek(self)), repr(LazyWhoIsUser.host.peek(self)), repr(LazyWhoIsUser.realname.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 311:
+            return None
+        if not (len(line.arguments) == 6):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        user = line.arguments[i]
+        i += 1
+        host = line.arguments[i]
+        i += 1
+        # line.arguments[i]: '*'
+        i += 1
+        realname = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, nickname=nickname, user=user, host=host, realname=realname)
+        msg._decode = decode
+        return msg
+
+
+class LazyWhoIsServer(WhoIsServer):
+    """
+    ``WhoIsServer``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(WhoIsServer.target, lambda decode, b: decode(b))
+    nickname = LazyField(WhoIsServer.nickname, lambda decode, b: decode(b))
+    server = LazyField(WhoIsServer.server, lambda decode, b: decode(b))
+    info = LazyField(WhoIsServer.info, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'WhoIsServer(source={}, target={}, nickname={}, server={}, info={})'.format(repr(lazy_source.peek(self)), repr(LazyWhoIsServer.target.peek(self)), repr(LazyWhoIsServer.nickname.peek(self)), repr(LazyWhoIsServer.server.peek(self)), repr(LazyWhoIsServer.info.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 312:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        server = line.arguments[i]
+        i += 1
+        info = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, nickname=nickname, server=server, info=info)
+        msg._decode = decode
+        return msg
+
+
+class LazyWhoIsOperator(WhoIsOperator):
+    """
+    ``WhoIsOperator``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(WhoIsOperator.target, lambda decode, b: decode(b))
+    nickname = LazyField(WhoIsOperator.nickname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'WhoIsOperator(source={}, target={}, nickname={})'.format(repr(lazy_source.peek(self)), repr(LazyWhoIsOperator.target.peek(self)), repr(LazyWhoIsOperator.nickname.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 313:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'is an IRC operator'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, nickname=nickname)
+        msg._decode = decode
+        return msg
+
+
+class LazyWhoWasUser(WhoWasUser):
+    """
+    ``WhoWasUser``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(WhoWasUser.target, lambda decode, b: decode(b))
+    nickname = LazyField(WhoWasUser.nickname, lambda decode, b: decode(b))
+    user = LazyField(WhoWasUser.user, lambda decode, b: decode(b))
+    host = LazyField(WhoWasUser.host, lambda decode, b: decode(b))
+    realname = LazyField(WhoWasUser.realname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'WhoWasUser(source={}, target={}, nickname={}, user={}, host={}, realname={})'.format(repr(lazy_source.peek(self)), repr(LazyWhoWasUser.target.peek(self)), repr(LazyWhoWasUser.nickname.peek(self)), repr(LazyWhoWasUser.user.peek(self)), repr(LazyWhoWasUser.host.peek(self)), repr(LazyWhoWasUser.realname.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 314:
+            return None
+        if not (len(line.arguments) == 6):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        user = line.arguments[i]
+        i += 1
+        host = line.arguments[i]
+        i += 1
+        # line.arguments[i]: '*'
+        i += 1
+        realname = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, nickname=nickname, user=user, host=host, realname=realname)
+        msg._decode = decode
+        return msg
+
+
+class LazyWhoEnd(WhoEnd):
+    """
+    ``WhoEnd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(WhoEnd.target, lambda decode, b: decode(b))
+    name = LazyField(WhoEnd.name, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'WhoEnd(source={}, target={}, name={})'.format(repr(lazy_source.peek(self)), repr(LazyWhoEnd.target.peek(self)), repr(LazyWhoEnd.name.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 315:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        name = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'End of WHO list'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, name=name)
+        msg._decode = decode
+        return msg
+
+
+class LazyWhoIsIdle(WhoIsIdle):
+    """
+    ``WhoIsIdle``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(WhoIsIdle.target, lambda decode, b: decode(b))
+    nickname = LazyField(WhoIsIdle.nickname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'WhoIsIdle(source={}, target={}, nickname={}, time={})'.format(repr(lazy_source.peek(self)), repr(LazyWhoIsIdle.target.peek(self)), repr(LazyWhoIsIdle.nickname.peek(self)), repr(self.time))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 317:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        time = int(line.arguments[i])
+        i += 1
+        # line.arguments[i]: 'seconds idle'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, nickname=nickname, time=time)
+        msg._decode = decode
+        return msg
+
+
+class LazyWhoIsEnd(WhoIsEnd):
+    """
+    ``WhoIsEnd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(WhoIsEnd.target, lambda decode, b: decode(b))
+    nickname = LazyField(WhoIsEnd.nickname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'WhoIsEnd(source={}, target={}, nickname={})'.format(repr(lazy_source.peek(self)), repr(LazyWhoIsEnd.target.peek(self)), repr(LazyWhoIsEnd.nickname.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 318:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'End of WHOIS list'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, nickname=nickname)
+        msg._decode = decode
+        return msg
+
+
+class LazyWhoIsChannels(WhoIsChannels):
+    """
+    ``WhoIsChannels``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(WhoIsChannels.target, lambda decode, b: decode(b))
+    nickname = LazyField(WhoIsChannels.nickname, lambda decode, b: decode(b))
+    channels = LazyField(WhoIsChannels.channels, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'WhoIsChannels(source={}, target={}, nickname={}, channels={})'.format(repr(lazy_source.peek(self)), repr(LazyWhoIsChannels.target.peek(self)), repr(LazyWhoIsChannels.nickname.peek(self)), repr(LazyWhoIsChannels.channels.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 319:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        channels = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, nickname=nickname, channels=channels)
+        msg._decode = decode
+        return msg
+
+
+class LazyListReply(ListReply):
+    """
+    ``ListReply``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(ListReply.target, lambda decode, b: decode(b))
+    channel = LazyField(ListReply.channel, lambda decode, b: decode(b))
+    topic = LazyField(ListReply.topic, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'ListReply(source={}, target={}, channel={}, visible={}, topic={})'.format(repr(lazy_source.peek(self)), repr(LazyListReply.target.peek(self)), repr(LazyListReply.channel.peek(self)), repr(self.visible), repr(LazyListReply.topic.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 322:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        visible = int(line.arguments[i])
+        i += 1
+        topic = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel, visible=visible, topic=topic)
+        msg._decode = decode
+        return msg
+
+
+class LazyListEnd(ListEnd):
+    """
+    ``ListEnd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(ListEnd.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'ListEnd(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyListEnd.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 323:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'End of LIST'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyChannelModeIs(ChannelModeIs):
+    """
+    ``ChannelModeIs``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(ChannelModeIs.target, lambda decode, b: decode(b))
+    channel = LazyField(ChannelModeIs.channel, lambda decode, b: decode(b))
+    mode = LazyField(ChannelModeIs.mode, lambda decode, b: decode(b))
+    params = LazyField(ChannelModeIs.params, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'ChannelModeIs(source={}, target={}, channel={}, mode={}, params={})'.format(repr(lazy_source.peek(self)), repr(LazyChannelModeIs.target.peek(self)), repr(LazyChannelModeIs.channel.peek(self)), repr(LazyChannelModeIs.mode.peek(self)), repr(LazyChannelModeIs.params.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 324:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        mode = line.arguments[i]
+        i += 1
+        params = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel, mode=mode, params=params)
+        msg._decode = decode
+        return msg
+
+
+class LazyUniqOpIs(UniqOpIs):
+    """
+    ``UniqOpIs``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(UniqOpIs.target, lambda decode, b: decode(b))
+    channel = LazyField(UniqOpIs.channel, lambda decode, b: decode(b))
+    nickname = LazyField(UniqOpIs.nickname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'UniqOpIs(source={}, target={}, channel={}, nickname={})'.format(repr(lazy_source.peek(self)), repr(LazyUniqOpIs.target.peek(self)), repr(LazyUniqOpIs.channel.peek(self)), repr(LazyUniqOpIs.nickname.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 325:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel, nickname=nickname)
+        msg._decode = decode
+        return msg
+
+
+class LazyNoTopicReply(NoTopicReply):
+    """
+    ``NoTopicReply``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoTopicReply.target, lambda decode, b: decode(b))
+    channel = LazyField(NoTopicReply.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NoTopicReply(source={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyNoTopicReply.target.peek(self)), repr(LazyNoTopicReply.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 331:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'No topic is set'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel)
+        msg._decode = decode
+        return msg
+
+
+class LazyTopicReply(TopicReply):
+    """
+    ``TopicReply``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(TopicReply.target, lambda decode, b: decode(b))
+    channel = LazyField(TopicReply.channel, lambda decode, b: decode(b))
+    topic = LazyField(TopicReply.topic, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'TopicReply(source={}, target={}, channel={}, topic={})'.format(repr(lazy_source.peek(self)), repr(LazyTopicReply.target.peek(self)), repr(LazyTopicReply.channel.peek(self)), repr(LazyTopicReply.topic.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 332:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        topic = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel, topic=topic)
+        msg._decode = decode
+        return msg
+
+
+class LazyInviting(Inviting):
+    """
+    ``Inviting``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(Inviting.target, lambda decode, b: decode(b))
+    channel = LazyField(Inviting.channel, lambda decode, b: decode(b))
+    nick = LazyField(Inviting.nick, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Inviting(source={}, target={}, channel={}, nick={})'.format(repr(lazy_source.peek(self)), repr(LazyInviting.target.peek(self)), repr(LazyInviting.channel.peek(self)), repr(LazyInviting.nick.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 341:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        nick = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel, nick=nick)
+        msg._decode = decode
+        return msg
+
+
+class LazySummoning(Summoning):
+    """
+    ``Summoning``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(Summoning.target, lambda decode, b: decode(b))
+    user = LazyField(Summoning.user, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Summoning(source={}, target={}, user={})'.format(repr(lazy_source.peek(self)), repr(LazySummoning.target.peek(self)), repr(LazySummoning.user.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 342:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        user = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Summoning user to IRC'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, user=user)
+        msg._decode = decode
+        return msg
+
+
+class LazyInviteList(InviteList):
+    """
+    ``InviteList``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(InviteList.target, lambda decode, b: decode(b))
+    channel = LazyField(InviteList.channel, lambda decode, b: decode(b))
+    mask = LazyField(InviteList.mask, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'InviteList(source={}, target={}, channel={}, mask={})'.format(repr(lazy_source.peek(self)), repr(LazyInviteList.target.peek(self)), repr(LazyInviteList.channel.peek(self)), repr(LazyInviteList.mask.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 346:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        mask = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel, mask=mask)
+        msg._decode = decode
+        return msg
+
+
+class LazyInviteListEnd(InviteListEnd):
+    """
+    ``InviteListEnd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(InviteListEnd.target, lambda decode, b: decode(b))
+    channel = LazyField(InviteListEnd.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'InviteListEnd(source={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyInviteListEnd.target.peek(self)), repr(LazyInviteListEnd.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 347:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'End of channel invite list'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel)
+        msg._decode = decode
+        return msg
+
+
+class LazyExceptList(ExceptList):
+    """
+    ``ExceptList``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(ExceptList.target, lambda decode, b: decode(b))
+    channel = LazyField(ExceptList.channel, lambda decode, b: decode(b))
+    mask = LazyField(ExceptList.mask, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'ExceptList(source={}, target={}, channel={}, mask={})'.format(repr(lazy_source.peek(self)), repr(LazyExceptList.target.peek(self)), repr(LazyExceptList.channel.peek(self)), repr(LazyExceptList.mask.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 348:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        mask = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel, mask=mask)
+        msg._decode = decode
+        return msg
+
+
+class LazyExceptListEnd(ExceptListEnd):
+    """
+    ``ExceptListEnd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(ExceptListEnd.target, lambda decode, b: decode(b))
+    channel = LazyField(ExceptListEnd.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'ExceptListEnd(source={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyExceptListEnd.target.peek(self)), repr(LazyExceptListEnd.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 349:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'End of channel exception list'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel)
+        msg._decode = decode
+        return msg
+
+
+class LazyVersionReply(VersionReply):
+    """
+    ``VersionReply``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(VersionReply.target, lambda decode, b: decode(b))
+    version = LazyField(VersionReply.version, lambda decode, b: decode(b))
+    server = LazyField(VersionReply.server, lambda decode, b: decode(b))
+    comments = LazyField(VersionReply.comments, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'VersionReply(source={}, target={}, version={}, server={}, comments={})'.format(repr(lazy_source.peek(self)), repr(LazyVersionReply.target.peek(self)), repr(LazyVersionReply.version.peek(self)), repr(LazyVersionReply.server.peek(self)), repr(LazyVersionReply.comments.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 351:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        version = line.arguments[i]
+        i += 1
+        server = line.arguments[i]
+        i += 1
+        comments = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, version=version, server=server, comments=comments)
+        msg._decode = decode
+        return msg
+
+
+class LazyWhoReply(WhoReply):
+    """
+    ``WhoReply``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(WhoReply.target, lambda decode, b: decode(b))
+    channel = LazyField(WhoReply.channel, lambda decode, b: decode(b))
+    user = LazyField(WhoReply.user, lambda decode, b: decode(b))
+    host = LazyField(WhoReply.host, lambda decode, b: decode(b))
+    server = LazyField(WhoReply.server, lambda decode, b: decode(b))
+    nickname = LazyField(WhoReply.nickname, lambda decode, b: decode(b))
+    props = LazyField(WhoReply.props, lambda decode, b: decode(b))
+    realname = LazyField(WhoReply.realname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'WhoReply(source={}, target={}, channel={}, user={}, host={}, server={}, nickname={}, props={}, realname={})'.format(repr(lazy_source.peek(self)), repr(LazyWhoReply.target.peek(self)), repr(LazyWhoReply.channel.peek(self)), repr(LazyWhoReply.user.peek(self)), repr(LazyWhoReply.host.peek(self)), repr(LazyWhoReply.server.peek(self)), repr(LazyWhoReply.nickname.peek(self)), repr(LazyWhoReply.props.peek(self)), repr(LazyWhoReply.realname.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 352:
+            return None
+        if not (len(line.arguments) == 8):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        user = line.arguments[i]
+        i += 1
+        host = line.arguments[i]
+        i += 1
+        server = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        props = line.arguments[i]
+        i += 1
+        realname = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel, user=user, host=host, server=server, nickname=nickname, props=props, realname=realname)
+        msg._decode = decode
+        return msg
+
+
+class LazyNamesReply(NamesReply):
+    """
+    ``NamesReply``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NamesReply.target, lambda decode, b: decode(b))
+    mode = LazyField(NamesReply.mode, lambda decode, b: decode(b))
+    channel = LazyField(NamesReply.channel, lambda decode, b: decode(b))
+    nicknames = LazyField(NamesReply.nicknames, lambda decode, b: [decode(x) for x in b.split()])
+
+    def __repr__(self) -> str:
+        return 'NamesReply(source={}, target={}, mode={}, channel={}, nicknames={})'.format(repr(lazy_source.peek(self)), repr(LazyNamesReply.target.peek(self)), repr(LazyNamesReply.mode.peek(self)), repr(LazyNamesReply.channel.peek(self)), repr(LazyNamesReply.nicknames.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 353:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        mode = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        nicknames = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, mode=mode, channel=channel, nicknames=nicknames)
+        msg._decode = decode
+        return msg
+
+
+class LazyLinksReply(LinksReply):
+    """
+    ``LinksReply``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(LinksReply.target, lambda decode, b: decode(b))
+    mask = LazyField(LinksReply.mask, lambda decode, b: decode(b))
+    server = LazyField(LinksReply.server, lambda decode, b: decode(b))
+    info = LazyField(LinksReply.info, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'LinksReply(source={}, target={}, mask={}, server={}, info={})'.format(repr(lazy_source.peek(self)), repr(LazyLinksReply.target.peek(self)), repr(LazyLinksReply.mask.peek(self)), repr(LazyLinksReply.server.peek(self)), repr(LazyLinksReply.info.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 364:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        mask = line.arguments[i]
+        i += 1
+        server = line.arguments[i]
+        i += 1
+        info = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, mask=mask, server=server, info=info)
+        msg._decode = decode
+        return msg
+
+
+class LazyLinksEnd(LinksEnd):
+    """
+    ``LinksEnd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(LinksEnd.target, lambda decode, b: decode(b))
+    mask = LazyField(LinksEnd.mask, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'LinksEnd(source={}, target={}, mask={})'.format(repr(lazy_source.peek(self)), repr(LazyLinksEnd.target.peek(self)), repr(LazyLinksEnd.mask.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 365:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        mask = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'End of LINKS list'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, mask=mask)
+        msg._decode = decode
+        return msg
+
+
+class LazyNamesEnd(NamesEnd):
+    """
+    ``NamesEnd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NamesEnd.target, lambda decode, b: decode(b))
+    channel = LazyField(NamesEnd.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NamesEnd(source={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyNamesEnd.target.peek(self)), repr(LazyNamesEnd.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 366:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'End of NAMES list'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel)
+        msg._decode = decode
+        return msg
+
+
+class LazyBanList(BanList):
+    """
+    ``BanList``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(BanList.target, lambda decode, b: decode(b))
+    channel = LazyField(BanList.channel, lambda decode, b: decode(b))
+    mask = LazyField(BanList.mask, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'BanList(source={}, target={}, channel={}, mask={})'.format(repr(lazy_source.peek(self)), repr(LazyBanList.target.peek(self)), repr(LazyBanList.channel.peek(self)), repr(LazyBanList.mask.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 367:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        mask = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel, mask=mask)
+        msg._decode = decode
+        return msg
+
+
+class LazyBanListEnd(BanListEnd):
+    """
+    ``BanListEnd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(BanListEnd.target, lambda decode, b: decode(b))
+    channel = LazyField(BanListEnd.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'BanListEnd(source={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyBanListEnd.target.peek(self)), repr(LazyBanListEnd.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 368:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'End of channel ban list'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel)
+        msg._decode = decode
+        return msg
+
+
+class LazyWhoWasEnd(WhoWasEnd):
+    """
+    ``WhoWasEnd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(WhoWasEnd.target, lambda decode, b: decode(b))
+    nickname = LazyField(WhoWasEnd.nickname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'WhoWasEnd(source={}, target={}, nickname={})'.format(repr(lazy_source.peek(self)), repr(LazyWhoWasEnd.target.peek(self)), repr(LazyWhoWasEnd.nickname.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 369:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'End of WHOWAS'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, nickname=nickname)
+        msg._decode = decode
+        return msg
+
+
+class LazyInfoReply(InfoReply):
+    """
+    ``InfoReply``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(InfoReply.target, lambda decode, b: decode(b))
+    info = LazyField(InfoReply.info, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'InfoReply(source={}, target={}, info={})'.format(repr(lazy_source.peek(self)), repr(LazyInfoReply.target.peek(self)), repr(LazyInfoReply.info.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 371:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        info = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, info=info)
+        msg._decode = decode
+        return msg
+
+
+class LazyMotdText(MotdText):
+    """
+    ``MotdText``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(MotdText.target, lambda decode, b: decode(b))
+    message = LazyField(MotdText.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'MotdText(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyMotdText.target.peek(self)), repr(LazyMotdText.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 372:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyInfoEnd(InfoEnd):
+    """
+    ``InfoEnd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(InfoEnd.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'InfoEnd(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyInfoEnd.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 374:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'End of INFO list'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyMotdStart(MotdStart):
+    """
+    ``MotdStart``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(MotdStart.target, lambda decode, b: decode(b))
+    message = LazyField(MotdStart.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'MotdStart(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyMotdStart.target.peek(self)), repr(LazyMotdStart.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 375:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyMotdEnd(MotdEnd):
+    """
+    ``MotdEnd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(MotdEnd.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'MotdEnd(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyMotdEnd.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 376:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'End of MOTD command'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyYoureOper(YoureOper):
+    """
+    ``YoureOper``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(YoureOper.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'YoureOper(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyYoureOper.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 381:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'You are now an IRC operator'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyRehashing(Rehashing):
+    """
+    ``Rehashing``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(Rehashing.target, lambda decode, b: decode(b))
+    file = LazyField(Rehashing.file, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'Rehashing(source={}, target={}, file={})'.format(repr(lazy_source.peek(self)), repr(LazyRehashing.target.peek(self)), repr(LazyRehashing.file.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 382:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        file = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Rehashing'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, file=file)
+        msg._decode = decode
+        return msg
+
+
+class LazyYoureService(YoureService):
+    """
+    ``YoureService``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(YoureService.target, lambda decode, b: decode(b))
+    message = LazyField(YoureService.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'YoureService(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyYoureService.target.peek(self)), repr(LazyYoureService.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 383:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyTimeReply(TimeReply):
+    """
+    ``TimeReply``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(TimeReply.target, lambda decode, b: decode(b))
+    server = LazyField(TimeReply.server, lambda decode, b: decode(b))
+    time = LazyField(TimeReply.time, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'TimeReply(source={}, target={}, server={}, time={})'.format(repr(lazy_source.peek(self)), repr(LazyTimeReply.target.peek(self)), repr(LazyTimeReply.server.peek(self)), repr(LazyTimeReply.time.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 391:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        server = line.arguments[i]
+        i += 1
+        time = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, server=server, time=time)
+        msg._decode = decode
+        return msg
+
+
+class LazyUsersStart(UsersStart):
+    """
+    ``UsersStart``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(UsersStart.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'UsersStart(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyUsersStart.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 392:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'UserID   Terminal  Host'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyUsersReply(UsersReply):
+    """
+    ``UsersReply``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(UsersReply.target, lambda decode, b: decode(b))
+    message = LazyField(UsersReply.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'UsersReply(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyUsersReply.target.peek(self)), repr(LazyUsersReply.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 393:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyUsersEnd(UsersEnd):
+    """
+    ``UsersEnd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(UsersEnd.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'UsersEnd(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyUsersEnd.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 394:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'End of users'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyNoUsers(NoUsers):
+    """
+    ``NoUsers``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoUsers.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NoUsers(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyNoUsers.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 395:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Nobody logged in'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyNoSuchNick(NoSuchNick):
+    """
+    ``NoSuchNick``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoSuchNick.target, lambda decode, b: decode(b))
+    nickname = LazyField(NoSuchNick.nickname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NoSuchNick(source={}, target={}, nickname={})'.format(repr(lazy_source.peek(self)), repr(LazyNoSuchNick.target.peek(self)), repr(LazyNoSuchNick.nickname.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 401:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'No such nick/channel'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, nickname=nickname)
+        msg._decode = decode
+        return msg
+
+
+class LazyNoSuchServer(NoSuchServer):
+    """
+    ``NoSuchServer``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoSuchServer.target, lambda decode, b: decode(b))
+    server = LazyField(NoSuchServer.server, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NoSuchServer(source={}, target={}, server={})'.format(repr(lazy_source.peek(self)), repr(LazyNoSuchServer.target.peek(self)), repr(LazyNoSuchServer.server.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 402:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        server = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'No such server'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, server=server)
+        msg._decode = decode
+        return msg
+
+
+class LazyNoSuchChannel(NoSuchChannel):
+    """
+    ``NoSuchChannel``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoSuchChannel.target, lambda decode, b: decode(b))
+    channel = LazyField(NoSuchChannel.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NoSuchChannel(source={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyNoSuchChannel.target.peek(self)), repr(LazyNoSuchChannel.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 403:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'No such channel'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel)
+        msg._decode = decode
+        return msg
+
+
+class LazyCantSendToChan(CantSendToChan):
+    """
+    ``CantSendToChan``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(CantSendToChan.target, lambda decode, b: decode(b))
+    channel = LazyField(CantSendToChan.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'CantSendToChan(source={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyCantSendToChan.target.peek(self)), repr(LazyCantSendToChan.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 404:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Cannot send to channel'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel)
+        msg._decode = decode
+        return msg
+
+
+class LazyTooManyChannels(TooManyChannels):
+    """
+    ``TooManyChannels``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(TooManyChannels.target, lambda decode, b: decode(b))
+    channel = LazyField(TooManyChannels.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'TooManyChannels(source={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyTooManyChannels.target.peek(self)), repr(LazyTooManyChannels.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 405:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'You have joined too many channels'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel)
+        msg._decode = decode
+        return msg
+
+
+class LazyWasNoSuchNick(WasNoSuchNick):
+    """
+    ``WasNoSuchNick``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(WasNoSuchNick.target, lambda decode, b: decode(b))
+    nickname = LazyField(WasNoSuchNick.nickname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'WasNoSuchNick(source={}, target={}, nickname={})'.format(repr(lazy_source.peek(self)), repr(LazyWasNoSuchNick.target.peek(self)), repr(LazyWasNoSuchNick.nickname.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 406:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'There was no such nickname'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, nickname=nickname)
+        msg._decode = decode
+        return msg
+
+
+class LazyTooManyTargets(TooManyTargets):
+    """
+    ``TooManyTargets``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(TooManyTargets.target, lambda decode, b: decode(b))
+    orig_target = LazyField(TooManyTargets.orig_target, lambda decode, b: decode(b))
+    message = LazyField(TooManyTargets.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'TooManyTargets(source={}, target={}, orig_target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyTooManyTargets.target.peek(self)), repr(LazyTooManyTargets.orig_target.peek(self)), repr(LazyTooManyTargets.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 407:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        orig_target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, orig_target=orig_target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyNoSuchService(NoSuchService):
+    """
+    ``NoSuchService``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoSuchService.target, lambda decode, b: decode(b))
+    name = LazyField(NoSuchService.name, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NoSuchService(source={}, target={}, name={})'.format(repr(lazy_source.peek(self)), repr(LazyNoSuchService.target.peek(self)), repr(LazyNoSuchService.name.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 408:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        name = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'No such service'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, name=name)
+        msg._decode = decode
+        return msg
+
+
+class LazyNoOrigin(NoOrigin):
+    """
+    ``NoOrigin``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoOrigin.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NoOrigin(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyNoOrigin.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 409:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'No origin specified'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyNoRecipient(NoRecipient):
+    """
+    ``NoRecipient``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoRecipient.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NoRecipient(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyNoRecipient.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 411:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'No recipient given'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyNoTextToSend(NoTextToSend):
+    """
+    ``NoTextToSend``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoTextToSend.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NoTextToSend(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyNoTextToSend.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 412:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'No text to send'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyNoTopLevel(NoTopLevel):
+    """
+    ``NoTopLevel``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoTopLevel.target, lambda decode, b: decode(b))
+    mask = LazyField(NoTopLevel.mask, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NoTopLevel(source={}, target={}, mask={})'.format(repr(lazy_source.peek(self)), repr(LazyNoTopLevel.target.peek(self)), repr(LazyNoTopLevel.mask.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 413:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        mask = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'No toplevel domain specified'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, mask=mask)
+        msg._decode = decode
+        return msg
+
+
+class LazyWildTopLevel(WildTopLevel):
+    """
+    ``WildTopLevel``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(WildTopLevel.target, lambda decode, b: decode(b))
+    mask = LazyField(WildTopLevel.mask, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'WildTopLevel(source={}, target={}, mask={})'.format(repr(lazy_source.peek(self)), repr(LazyWildTopLevel.target.peek(self)), repr(LazyWildTopLevel.mask.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 414:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        mask = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Wildcard in toplevel domain'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, mask=mask)
+        msg._decode = decode
+        return msg
+
+
+class LazyBadMask(BadMask):
+    """
+    ``BadMask``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(BadMask.target, lambda decode, b: decode(b))
+    mask = LazyField(BadMask.mask, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'BadMask(source={}, target={}, mask={})'.format(repr(lazy_source.peek(self)), repr(LazyBadMask.target.peek(self)), repr(LazyBadMask.mask.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 415:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        mask = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Bad Server/host mask'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, mask=mask)
+        msg._decode = decode
+        return msg
+
+
+class LazyUnknownCommand(UnknownCommand):
+    """
+    ``UnknownCommand``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(UnknownCommand.target, lambda decode, b: decode(b))
+    command = LazyField(UnknownCommand.command, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'UnknownCommand(source={}, target={}, command={})'.format(repr(lazy_source.peek(self)), repr(LazyUnknownCommand.target.peek(self)), repr(LazyUnknownCommand.command.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 421:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        command = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Unknown command'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, command=command)
+        msg._decode = decode
+        return msg
+
+
+class LazyNoMotd(NoMotd):
+    """
+    ``NoMotd``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoMotd.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NoMotd(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyNoMotd.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 422:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'MOTD File is missing'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyNoAdminInfo(NoAdminInfo):
+    """
+    ``NoAdminInfo``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoAdminInfo.target, lambda decode, b: decode(b))
+    server = LazyField(NoAdminInfo.server, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NoAdminInfo(source={}, target={}, server={})'.format(repr(lazy_source.peek(self)), repr(LazyNoAdminInfo.target.peek(self)), repr(LazyNoAdminInfo.server.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 423:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        server = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'No administrative info available'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, server=server)
+        msg._decode = decode
+        return msg
+
+
+class LazyFileError(FileError):
+    """
+    ``FileError``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(FileError.target, lambda decode, b: decode(b))
+    message = LazyField(FileError.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'FileError(source={}, target={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyFileError.target.peek(self)), repr(LazyFileError.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 424:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyNoNicknameGiven(NoNicknameGiven):
+    """
+    ``NoNicknameGiven``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoNicknameGiven.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NoNicknameGiven(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyNoNicknameGiven.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 431:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'No nickname given'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyErroneusNickname(ErroneusNickname):
+    """
+    ``ErroneusNickname``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(ErroneusNickname.target, lambda decode, b: decode(b))
+    nickname = LazyField(ErroneusNickname.nickname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'ErroneusNickname(source={}, target={}, nickname={})'.format(repr(lazy_source.peek(self)), repr(LazyErroneusNickname.target.peek(self)), repr(LazyErroneusNickname.nickname.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 432:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Erroneous nickname'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, nickname=nickname)
+        msg._decode = decode
+        return msg
+
+
+class LazyNicknameInUse(NicknameInUse):
+    """
+    ``NicknameInUse``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NicknameInUse.target, lambda decode, b: decode(b))
+    nickname = LazyField(NicknameInUse.nickname, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NicknameInUse(source={}, target={}, nickname={})'.format(repr(lazy_source.peek(self)), repr(LazyNicknameInUse.target.peek(self)), repr(LazyNicknameInUse.nickname.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 433:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Nickname is already in use'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, nickname=nickname)
+        msg._decode = decode
+        return msg
+
+
+class LazyNickCollision(NickCollision):
+    """
+    ``NickCollision``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NickCollision.target, lambda decode, b: decode(b))
+    nickname = LazyField(NickCollision.nickname, lambda decode, b: decode(b))
+    message = LazyField(NickCollision.message, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NickCollision(source={}, target={}, nickname={}, message={})'.format(repr(lazy_source.peek(self)), repr(LazyNickCollision.target.peek(self)), repr(LazyNickCollision.nickname.peek(self)), repr(LazyNickCollision.message.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 436:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        message = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, nickname=nickname, message=message)
+        msg._decode = decode
+        return msg
+
+
+class LazyUnavailResource(UnavailResource):
+    """
+    ``UnavailResource``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(UnavailResource.target, lambda decode, b: decode(b))
+    name = LazyField(UnavailResource.name, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'UnavailResource(source={}, target={}, name={})'.format(repr(lazy_source.peek(self)), repr(LazyUnavailResource.target.peek(self)), repr(LazyUnavailResource.name.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 437:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        name = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Nick/channel is temporarily unavailable'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, name=name)
+        msg._decode = decode
+        return msg
+
+
+class LazyUserNotInChannel(UserNotInChannel):
+    """
+    ``UserNotInChannel``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(UserNotInChannel.target, lambda decode, b: decode(b))
+    nickname = LazyField(UserNotInChannel.nickname, lambda decode, b: decode(b))
+    channel = LazyField(UserNotInChannel.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'UserNotInChannel(source={}, target={}, nickname={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyUserNotInChannel.target.peek(self)), repr(LazyUserNotInChannel.nickname.peek(self)), repr(LazyUserNotInChannel.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 441:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        nickname = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        # line.arguments[i]: "They aren't on that channel"
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, nickname=nickname, channel=channel)
+        msg._decode = decode
+        return msg
+
+
+class LazyNotOnChannel(NotOnChannel):
+    """
+    ``NotOnChannel``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NotOnChannel.target, lambda decode, b: decode(b))
+    channel = LazyField(NotOnChannel.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NotOnChannel(source={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyNotOnChannel.target.peek(self)), repr(LazyNotOnChannel.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 442:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        # line.arguments[i]: "You're not on that channel"
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel)
+        msg._decode = decode
+        return msg
+
+
+class LazyUserOnChannel(UserOnChannel):
+    """
+    ``UserOnChannel``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(UserOnChannel.target, lambda decode, b: decode(b))
+    user = LazyField(UserOnChannel.user, lambda decode, b: decode(b))
+    channel = LazyField(UserOnChannel.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'UserOnChannel(source={}, target={}, user={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyUserOnChannel.target.peek(self)), repr(LazyUserOnChannel.user.peek(self)), repr(LazyUserOnChannel.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 443:
+            return None
+        if not (len(line.arguments) == 4):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        user = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'is already on channel'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, user=user, channel=channel)
+        msg._decode = decode
+        return msg
+
+
+class LazyNoLogin(NoLogin):
+    """
+    ``NoLogin``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoLogin.target, lambda decode, b: decode(b))
+    user = LazyField(NoLogin.user, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NoLogin(source={}, target={}, user={})'.format(repr(lazy_source.peek(self)), repr(LazyNoLogin.target.peek(self)), repr(LazyNoLogin.user.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 444:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        user = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'User not logged in'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, user=user)
+        msg._decode = decode
+        return msg
+
+
+class LazySummonDisabled(SummonDisabled):
+    """
+    ``SummonDisabled``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(SummonDisabled.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'SummonDisabled(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazySummonDisabled.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 445:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'SUMMON has been disabled'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyUsersDisabled(UsersDisabled):
+    """
+    ``UsersDisabled``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(UsersDisabled.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'UsersDisabled(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyUsersDisabled.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 446:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'USERS has been disabled'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyNotRegistered(NotRegistered):
+    """
+    ``NotRegistered``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NotRegistered.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NotRegistered(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyNotRegistered.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 451:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'You have not registered'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyNeedMoreParams(NeedMoreParams):
+    """
+    ``NeedMoreParams``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NeedMoreParams.target, lambda decode, b: decode(b))
+    command = LazyField(NeedMoreParams.command, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NeedMoreParams(source={}, target={}, command={})'.format(repr(lazy_source.peek(self)), repr(LazyNeedMoreParams.target.peek(self)), repr(LazyNeedMoreParams.command.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 461:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        command = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Not enough parameters'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, command=command)
+        msg._decode = decode
+        return msg
+
+
+class LazyAlreadyRegistered(AlreadyRegistered):
+    """
+    ``AlreadyRegistered``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(AlreadyRegistered.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'AlreadyRegistered(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyAlreadyRegistered.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 462:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Unauthorized command (already registered)'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyNoPermForHost(NoPermForHost):
+    """
+    ``NoPermForHost``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoPermForHost.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'NoPermForHost(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyNoPermForHost.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 463:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: "Your host isn't among the privileged"
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyPasswordMismatch(PasswordMismatch):
+    """
+    ``PasswordMismatch``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(PasswordMismatch.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'PasswordMismatch(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyPasswordMismatch.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 464:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Password incorrect'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyYoureBannedCreep(YoureBannedCreep):
+    """
+    ``YoureBannedCreep``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(YoureBannedCreep.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'YoureBannedCreep(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyYoureBannedCreep.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 465:
+            return None
+        if not (len(line.arguments) == 2):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'You are banned from this server'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyYouWillBeBanned(YouWillBeBanned):
+    """
+    ``YouWillBeBanned``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(YouWillBeBanned.target, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'YouWillBeBanned(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyYouWillBeBanned.target.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 466:
+            return None
+        if not (len(line.arguments) == 1):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
+
+
+class LazyKeySet(KeySet):
+    """
+    ``KeySet``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(KeySet.target, lambda decode, b: decode(b))
+    channel = LazyField(KeySet.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'KeySet(source={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyKeySet.target.peek(self)), repr(LazyKeySet.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 467:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Channel key already set'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel)
+        msg._decode = decode
+        return msg
+
+
+class LazyChannelIsFull(ChannelIsFull):
+    """
+    ``ChannelIsFull``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(ChannelIsFull.target, lambda decode, b: decode(b))
+    channel = LazyField(ChannelIsFull.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'ChannelIsFull(source={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyChannelIsFull.target.peek(self)), repr(LazyChannelIsFull.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 471:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Cannot join channel (+l)'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel)
+        msg._decode = decode
+        return msg
+
+
+class LazyUnknownMode(UnknownMode):
+    """
+    ``UnknownMode``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(UnknownMode.target, lambda decode, b: decode(b))
+    char = LazyField(UnknownMode.char, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'UnknownMode(source={}, target={}, char={})'.format(repr(lazy_source.peek(self)), repr(LazyUnknownMode.target.peek(self)), repr(LazyUnknownMode.char.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 472:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        char = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'is unknown mode char to me'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, char=char)
+        msg._decode = decode
+        return msg
+
+
+class LazyInviteOnlyChan(InviteOnlyChan):
+    """
+    ``InviteOnlyChan``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(InviteOnlyChan.target, lambda decode, b: decode(b))
+    channel = LazyField(InviteOnlyChan.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'InviteOnlyChan(source={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyInviteOnlyChan.target.peek(self)), repr(LazyInviteOnlyChan.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 473:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Cannot join channel (+i)'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel)
+        msg._decode = decode
+        return msg
+
+
+class LazyBannedFromChan(BannedFromChan):
+    """
+    ``BannedFromChan``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(BannedFromChan.target, lambda decode, b: decode(b))
+    channel = LazyField(BannedFromChan.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'BannedFromChan(source={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyBannedFromChan.target.peek(self)), repr(LazyBannedFromChan.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 474:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Cannot join channel (+b)'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel)
+        msg._decode = decode
+        return msg
+
+
+class LazyBadChannelKey(BadChannelKey):
+    """
+    ``BadChannelKey``, with each field decoded the first time it is read
+    """
+
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(BadChannelKey.target, lambda decode, b: decode(b))
+    channel = LazyField(BadChannelKey.channel, lambda decode, b: decode(b))
+
+    def __repr__(self) -> str:
+        return 'BadChannelKey(source={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyBadChannelKey.target.peek(self)), repr(LazyBadChannelKey.channel.peek(self)))
+
+    @classmethod
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
+        if line.command != 475:
+            return None
+        if not (len(line.arguments) == 3):
+            return None
+        source = line.source
+        i = 0
+        target = line.arguments[i]
+        i += 1
+        channel = line.arguments[i]
+        i += 1
+        # line.arguments[i]: 'Cannot join channel (+k)'
+        i += 1
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel)
+        msg._decode = decode
+        return msg
+
 
-class BadChanMask(Message):
+class LazyBadChanMask(BadChanMask):
     """
-    ``476 <target> <channel> :Bad Channel Mask``
+    ``BadChanMask``, with each field decoded the first time it is read
     """
 
-    __slots__ = ['target', 'channel']
-
-    def __init__(self, source: str, target: str, channel: str) -> None:
-        self.source = source
-        self.target = target
-        self.channel = channel
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(BadChanMask.target, lambda decode, b: decode(b))
+    channel = LazyField(BadChanMask.channel, lambda decode, b: decode(b))
 
     def __repr__(self) -> str:
-        return 'BadChanMask(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
+        return 'BadChanMask(source={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyBadChanMask.target.peek(self)), repr(LazyBadChanMask.channel.peek(self)))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 476:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = line.source
         i = 0
-        target = decode(line.arguments[i])
+        target = line.arguments[i]
         i += 1
-        channel = decode(line.arguments[i])
+        channel = line.arguments[i]
         i += 1
         # line.arguments[i]: 'Bad Channel Mask'
         i += 1
-        assert i == len(line.arguments)
-        return cls(source=source, target=target, channel=channel)
-
-    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
-        source = None
-        if self.source is not None:
-            source = encode(self.source)
-        arguments = []
-        arguments.append(encode(self.target))
-        arguments.append(encode(self.channel))
-        arguments.append(b'Bad Channel Mask')
-        return Line(source, b"476", arguments)
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel)
+        msg._decode = decode
+        return msg
 
 
-class NoChanModes(Message):
+class LazyNoChanModes(NoChanModes):
     """
-    ``477 <target> <channel> :Channel doesn't support modes``
+    ``NoChanModes``, with each field decoded the first time it is read
     """
 
-    __slots__ = ['target', 'channel']
-
-    def __init__(self, source: str, target: str, channel: str) -> None:
-        self.source = source
-        self.target = target
-        self.channel = channel
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoChanModes.target, lambda decode, b: decode(b))
+    channel = LazyField(NoChanModes.channel, lambda decode, b: decode(b))
 
     def __repr__(self) -> str:
-        return 'NoChanModes(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
+        return 'NoChanModes(source={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyNoChanModes.target.peek(self)), repr(LazyNoChanModes.channel.peek(self)))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 477:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = line.source
         i = 0
-        target = decode(line.arguments[i])
+        target = line.arguments[i]
         i += 1
-        channel = decode(line.arguments[i])
+        channel = line.arguments[i]
         i += 1
         # line.arguments[i]: "Channel doesn't support modes"
         i += 1
-        assert i == len(line.arguments)
-        return cls(source=source, target=target, channel=channel)
-
-    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
-        source = None
-        if self.source is not None:
-            source = encode(self.source)
-        arguments = []
-        arguments.append(encode(self.target))
-        arguments.append(encode(self.channel))
-        arguments.append(b"Channel doesn't support modes")
-        return Line(source, b"477", arguments)
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel)
+        msg._decode = decode
+        return msg
 
 
-class BanListFull(Message):
+class LazyBanListFull(BanListFull):
     """
-    ``478 <target> <channel> <char> :Channel list is full``
+    ``BanListFull``, with each field decoded the first time it is read
     """
 
-    __slots__ = ['target', 'channel', 'char']
-
-    def __init__(self, source: str, target: str, channel: str, char: str) -> None:
-        self.source = source
-        self.target = target
-        self.channel = channel
-        self.char = char
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(BanListFull.target, lambda decode, b: decode(b))
+    channel = LazyField(BanListFull.channel, lambda decode, b: decode(b))
+    char = LazyField(BanListFull.char, lambda decode, b: decode(b))
 
     def __repr__(self) -> str:
-        return 'BanListFull(source={}, target={}, channel={}, char={})'.format(repr(self.source), repr(self.target), repr(self.channel), repr(self.char))
+        return 'BanListFull(source={}, target={}, channel={}, char={})'.format(repr(lazy_source.peek(self)), repr(LazyBanListFull.target.peek(self)), repr(LazyBanListFull.channel.peek(self)), repr(LazyBanListFull.char.peek(self)))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 478:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 4):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = line.source
         i = 0
-        target = decode(line.arguments[i])
+        target = line.arguments[i]
         i += 1
-        channel = decode(line.arguments[i])
+        channel = line.arguments[i]
         i += 1
-        char = decode(line.arguments[i])
+        char = line.arguments[i]
         i += 1
         # line.arguments[i]: 'Channel list is full'
         i += 1
-        assert i == len(line.arguments)
-        return cls(source=source, target=target, channel=channel, char=char)
-
-    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
-        source = None
-        if self.source is not None:
-            source = encode(self.source)
-        arguments = []
-        arguments.append(encode(self.target))
-        arguments.append(encode(self.channel))
-        arguments.append(encode(self.char))
-        arguments.append(b'Channel list is full')
-        return Line(source, b"478", arguments)
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel, char=char)
+        msg._decode = decode
+        return msg
 
 
-class NoPrivileges(Message):
+class LazyNoPrivileges(NoPrivileges):
     """
-    ``481 <target> :Permission Denied- You're not an IRC operator``
+    ``NoPrivileges``, with each field decoded the first time it is read
     """
 
-    __slots__ = ['target']
-
-    def __init__(self, source: str, target: str) -> None:
-        self.source = source
-        self.target = target
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoPrivileges.target, lambda decode, b: decode(b))
 
     def __repr__(self) -> str:
-        return 'NoPrivileges(source={}, target={})'.format(repr(self.source), repr(self.target))
+        return 'NoPrivileges(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyNoPrivileges.target.peek(self)))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 481:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = line.source
         i = 0
-        target = decode(line.arguments[i])
+        target = line.arguments[i]
         i += 1
         # line.arguments[i]: "Permission Denied- You're not an IRC operator"
         i += 1
-        assert i == len(line.arguments)
-        return cls(source=source, target=target)
-
-    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
-        source = None
-        if self.source is not None:
-            source = encode(self.source)
-        arguments = []
-        arguments.append(encode(self.target))
-        arguments.append(b"Permission Denied- You're not an IRC operator")
-        return Line(source, b"481", arguments)
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
 
 
-class ChanOpPrivsNeeded(Message):
+class LazyChanOpPrivsNeeded(ChanOpPrivsNeeded):
     """
-    ``482 <target> <channel> :You're not channel operator``
+    ``ChanOpPrivsNeeded``, with each field decoded the first time it is read
     """
 
-    __slots__ = ['target', 'channel']
-
-    def __init__(self, source: str, target: str, channel: str) -> None:
-        self.source = source
-        self.target = target
-        self.channel = channel
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(ChanOpPrivsNeeded.target, lambda decode, b: decode(b))
+    channel = LazyField(ChanOpPrivsNeeded.channel, lambda decode, b: decode(b))
 
     def __repr__(self) -> str:
-        return 'ChanOpPrivsNeeded(source={}, target={}, channel={})'.format(repr(self.source), repr(self.target), repr(self.channel))
+        return 'ChanOpPrivsNeeded(source={}, target={}, channel={})'.format(repr(lazy_source.peek(self)), repr(LazyChanOpPrivsNeeded.target.peek(self)), repr(LazyChanOpPrivsNeeded.channel.peek(self)))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 482:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 3):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = line.source
         i = 0
-        target = decode(line.arguments[i])
+        target = line.arguments[i]
         i += 1
-        channel = decode(line.arguments[i])
+        channel = line.arguments[i]
         i += 1
         # line.arguments[i]: "You're not channel operator"
         i += 1
-        assert i == len(line.arguments)
-        return cls(source=source, target=target, channel=channel)
-
-    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
-        source = None
-        if self.source is not None:
-            source = encode(self.source)
-        arguments = []
-        arguments.append(encode(self.target))
-        arguments.append(encode(self.channel))
-        arguments.append(b"You're not channel operator")
-        return Line(source, b"482", arguments)
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target, channel=channel)
+        msg._decode = decode
+        return msg
 
 
-class CantKillServer(Message):
+class LazyCantKillServer(CantKillServer):
     """
-    ``483 <target> :You can't kill a server!``
+    ``CantKillServer``, with each field decoded the first time it is read
     """
 
-    __slots__ = ['target']
-
-    def __init__(self, source: str, target: str) -> None:
-        self.source = source
-        self.target = target
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(CantKillServer.target, lambda decode, b: decode(b))
 
     def __repr__(self) -> str:
-        return 'CantKillServer(source={}, target={})'.format(repr(self.source), repr(self.target))
+        return 'CantKillServer(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyCantKillServer.target.peek(self)))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 483:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = line.source
         i = 0
-        target = decode(line.arguments[i])
+        target = line.arguments[i]
         i += 1
         # line.arguments[i]: "You can't kill a server!"
         i += 1
-        assert i == len(line.arguments)
-        return cls(source=source, target=target)
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
 
-    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
-        source = None
-        if self.source is not None:
-            source = encode(self.source)
-        arguments = []
-        arguments.append(encode(self.target))
-        arguments.append(b"You can't kill a server!")
-        return Line(source, b"483", arguments)
 
-
-class Restricted(Message):
+class LazyRestricted(Restricted):
     """
-    ``484 <target> :Your connection is restricted!``
+    ``Restricted``, with each field decoded the first time it is read
     """
 
-    __slots__ = ['target']
-
-    def __init__(self, source: str, target: str) -> None:
-        self.source = source
-        self.target = target
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(Restricted.target, lambda decode, b: decode(b))
 
     def __repr__(self) -> str:
-        return 'Restricted(source={}, target={})'.format(repr(self.source), repr(self.target))
+        return 'Restricted(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyRestricted.target.peek(self)))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 484:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = line.source
         i = 0
-        target = decode(line.arguments[i])
+        target = line.arguments[i]
         i += 1
         # line.arguments[i]: 'Your connection is restricted!'
         i += 1
-        assert i == len(line.arguments)
-        return cls(source=source, target=target)
-
-    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
-        source = None
-        if self.source is not None:
-            source = encode(self.source)
-        arguments = []
-        arguments.append(encode(self.target))
-        arguments.append(b'Your connection is restricted!')
-        return Line(source, b"484", arguments)
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
 
 
-class UniqOpPrivsNeeded(Message):
+class LazyUniqOpPrivsNeeded(UniqOpPrivsNeeded):
     """
-    ``485 <target> :You're not the original channel operator``
+    ``UniqOpPrivsNeeded``, with each field decoded the first time it is read
     """
 
-    __slots__ = ['target']
-
-    def __init__(self, source: str, target: str) -> None:
-        self.source = source
-        self.target = target
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(UniqOpPrivsNeeded.target, lambda decode, b: decode(b))
 
     def __repr__(self) -> str:
-        return 'UniqOpPrivsNeeded(source={}, target={})'.format(repr(self.source), repr(self.target))
+        return 'UniqOpPrivsNeeded(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyUniqOpPrivsNeeded.target.peek(self)))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 485:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = line.source
         i = 0
-        target = decode(line.arguments[i])
+        target = line.arguments[i]
         i += 1
         # line.arguments[i]: "You're not the original channel operator"
         i += 1
-        assert i == len(line.arguments)
-        return cls(source=source, target=target)
-
-    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
-        source = None
-        if self.source is not None:
-            source = encode(self.source)
-        arguments = []
-        arguments.append(encode(self.target))
-        arguments.append(b"You're not the original channel operator")
-        return Line(source, b"485", arguments)
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
 
 
-class NoOperHost(Message):
+class LazyNoOperHost(NoOperHost):
     """
-    ``491 <target> :No O-lines for your host``
+    ``NoOperHost``, with each field decoded the first time it is read
     """
 
-    __slots__ = ['target']
-
-    def __init__(self, source: str, target: str) -> None:
-        self.source = source
-        self.target = target
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(NoOperHost.target, lambda decode, b: decode(b))
 
     def __repr__(self) -> str:
-        return 'NoOperHost(source={}, target={})'.format(repr(self.source), repr(self.target))
+        return 'NoOperHost(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyNoOperHost.target.peek(self)))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 491:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = line.source
         i = 0
-        target = decode(line.arguments[i])
+        target = line.arguments[i]
         i += 1
         # line.arguments[i]: 'No O-lines for your host'
         i += 1
-        assert i == len(line.arguments)
-        return cls(source=source, target=target)
-
-    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
-        source = None
-        if self.source is not None:
-            source = encode(self.source)
-        arguments = []
-        arguments.append(encode(self.target))
-        arguments.append(b'No O-lines for your host')
-        return Line(source, b"491", arguments)
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
 
 
-class UserModeUnknownFlag(Message):
+class LazyUserModeUnknownFlag(UserModeUnknownFlag):
     """
-    ``501 <target> :Unknown MODE flag``
+    ``UserModeUnknownFlag``, with each field decoded the first time it is read
     """
 
-    __slots__ = ['target']
-
-    def __init__(self, source: str, target: str) -> None:
-        self.source = source
-        self.target = target
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(UserModeUnknownFlag.target, lambda decode, b: decode(b))
 
     def __repr__(self) -> str:
-        return 'UserModeUnknownFlag(source={}, target={})'.format(repr(self.source), repr(self.target))
+        return 'UserModeUnknownFlag(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyUserModeUnknownFlag.target.peek(self)))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 501:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = line.source
         i = 0
-        target = decode(line.arguments[i])
+        target = line.arguments[i]
         i += 1
         # line.arguments[i]: 'Unknown MODE flag'
         i += 1
-        assert i == len(line.arguments)
-        return cls(source=source, target=target)
-
-    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
-        source = None
-        if self.source is not None:
-            source = encode(self.source)
-        arguments = []
-        arguments.append(encode(self.target))
-        arguments.append(b'Unknown MODE flag')
-        return Line(source, b"501", arguments)
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
 
 
-class UsersDontMatch(Message):
+class LazyUsersDontMatch(UsersDontMatch):
     """
-    ``502 <target> :Cannot change mode for other users``
+    ``UsersDontMatch``, with each field decoded the first time it is read
     """
 
-    __slots__ = ['target']
-
-    def __init__(self, source: str, target: str) -> None:
-        self.source = source
-        self.target = target
+    __slots__ = ['_decode']
+    source = lazy_source
+    target = LazyField(UsersDontMatch.target, lambda decode, b: decode(b))
 
     def __repr__(self) -> str:
-        return 'UsersDontMatch(source={}, target={})'.format(repr(self.source), repr(self.target))
+        return 'UsersDontMatch(source={}, target={})'.format(repr(lazy_source.peek(self)), repr(LazyUsersDontMatch.target.peek(self)))
 
     @classmethod
-    def from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = lambda b: b.decode("utf-8")) -> Message:
-        source = None
-        if line.source is not None:
-            source = decode(line.source)
+    def _from_line(cls, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> typing.Optional[Message]:
         if line.command != 502:
-            raise ValueError("incorrect verb")
+            return None
         if not (len(line.arguments) == 2):
-            raise ValueError("wrong number of arguments")
+            return None
+        source = line.source
         i = 0
-        target = decode(line.arguments[i])
+        target = line.arguments[i]
         i += 1
         # line.arguments[i]: 'Cannot change mode for other users'
         i += 1
-        assert i == len(line.arguments)
-        return cls(source=source, target=target)
-
-    def to_line(self, encode: typing.Callable[[str], bytes] = lambda s: s.encode("utf-8")) -> Line:
-        source = None
-        if self.source is not None:
-            source = encode(self.source)
-        arguments = []
-        arguments.append(encode(self.target))
-        arguments.append(b'Cannot change mode for other users')
-        return Line(source, b"502", arguments)
+        if i != len(line.arguments):
+            return None
+        msg = cls(source=source, target=target)
+        msg._decode = decode
+        return msg
 
 
 from_lines_by_verb = {
-    b'PASS': Passwd.from_line,
-    b'NICK': Nick.from_line,
-    b'USER': User.from_line,
-    b'OPER': Oper.from_line,
-    b'MODE': Mode.from_line,
-    b'SERVICE': Service.from_line,
-    b'QUIT': Quit.from_line,
-    b'SQUIT': SQuit.from_line,
-    b'JOIN': ChannelJoin.from_line,
-    b'PART': ChannelPart.from_line,
-    b'TOPIC': Topic.from_line,
-    b'NAMES': Names.from_line,
-    b'LIST': List.from_line,
-    b'INVITE': Invite.from_line,
-    b'KICK': Kick.from_line,
-    b'PRIVMSG': Privmsg.from_line,
-    b'NOTICE': Notice.from_line,
-    b'MOTD': Motd.from_line,
-    b'LUSERS': Lusers.from_line,
-    b'VERSION': Version.from_line,
-    b'STATS': Stats.from_line,
-    b'LINKS': Links.from_line,
-    b'TIME': Time.from_line,
-    b'CONNECT': ServerConnect.from_line,
-    b'TRACE': Trace.from_line,
-    b'ADMIN': Admin.from_line,
-    b'INFO': Info.from_line,
-    b'SERVLIST': ServList.from_line,
-    b'SQUERY': SQuery.from_line,
-    b'WHO': Who.from_line,
-    b'WHOIS': WhoIs.from_line,
-    b'WHOWAS': WhoWas.from_line,
-    b'KILL': Kill.from_line,
-    b'PING': Ping.from_line,
-    b'PONG': Pong.from_line,
-    b'ERROR': Error.from_line,
-    b'AWAY': Away.from_line,
-    b'REHASH': Rehash.from_line,
-    b'DIE': Die.from_line,
-    b'RESTART': Restart.from_line,
-    b'SUMMON': Summon.from_line,
-    b'USERS': Users.from_line,
-    b'WALLOPS': WallOps.from_line,
-    b'USERHOST': UserHost.from_line,
-    b'ISON': IsOn.from_line,
-    1: Welcome.from_line,
-    2: YourHost.from_line,
-    3: Created.from_line,
-    4: MyInfo.from_line,
-    5: Bounce.from_line,
-    200: TraceLinkReply.from_line,
-    201: TraceConnecting.from_line,
-    202: TraceHandshake.from_line,
-    203: TraceUnknown.from_line,
-    204: TraceOperator.from_line,
-    205: TraceUser.from_line,
-    206: TraceServer.from_line,
-    207: TraceService.from_line,
-    208: TraceNewtype.from_line,
-    209: TraceClass.from_line,
-    211: StatsLinkInfo.from_line,
-    212: StatsCommands.from_line,
-    219: StatsEnd.from_line,
-    221: UserModeIs.from_line,
-    234: ServListReply.from_line,
-    235: ServListEnd.from_line,
-    242: StatsUptime.from_line,
-    243: StatsOline.from_line,
-    251: LuserClient.from_line,
-    252: LuserOp.from_line,
-    253: LuserUnknown.from_line,
-    254: LuserChannels.from_line,
-    255: LuserMe.from_line,
-    256: AdminMe.from_line,
-    257: AdminLoc1.from_line,
-    258: AdminLoc2.from_line,
-    259: AdminEmail.from_line,
-    261: TraceLog.from_line,
-    262: TraceEnd.from_line,
-    263: TryAgain.from_line,
-    301: AwayReply.from_line,
-    302: UserHostReply.from_line,
-    303: IsOnReply.from_line,
-    305: UnawayReply.from_line,
-    306: NowAwayReply.from_line,
-    311: WhoIsUser.from_line,
-    312: WhoIsServer.from_line,
-    313: WhoIsOperator.from_line,
-    314: WhoWasUser.from_line,
-    315: WhoEnd.from_line,
-    317: WhoIsIdle.from_line,
-    318: WhoIsEnd.from_line,
-    319: WhoIsChannels.from_line,
-    322: ListReply.from_line,
-    323: ListEnd.from_line,
-    324: ChannelModeIs.from_line,
-    325: UniqOpIs.from_line,
-    331: NoTopicReply.from_line,
-    332: TopicReply.from_line,
-    341: Inviting.from_line,
-    342: Summoning.from_line,
-    346: InviteList.from_line,
-    347: InviteListEnd.from_line,
-    348: ExceptList.from_line,
-    349: ExceptListEnd.from_line,
-    351: VersionReply.from_line,
-    352: WhoReply.from_line,
-    353: NamesReply.from_line,
-    364: LinksReply.from_line,
-    365: LinksEnd.from_line,
-    366: NamesEnd.from_line,
-    367: BanList.from_line,
-    368: BanListEnd.from_line,
-    369: WhoWasEnd.from_line,
-    371: InfoReply.from_line,
-    372: MotdText.from_line,
-    374: InfoEnd.from_line,
-    375: MotdStart.from_line,
-    376: MotdEnd.from_line,
-    381: YoureOper.from_line,
-    382: Rehashing.from_line,
-    383: YoureService.from_line,
-    391: TimeReply.from_line,
-    392: UsersStart.from_line,
-    393: UsersReply.from_line,
-    394: UsersEnd.from_line,
-    395: NoUsers.from_line,
-    401: NoSuchNick.from_line,
-    402: NoSuchServer.from_line,
-    403: NoSuchChannel.from_line,
-    404: CantSendToChan.from_line,
-    405: TooManyChannels.from_line,
-    406: WasNoSuchNick.from_line,
-    407: TooManyTargets.from_line,
-    408: NoSuchService.from_line,
-    409: NoOrigin.from_line,
-    411: NoRecipient.from_line,
-    412: NoTextToSend.from_line,
-    413: NoTopLevel.from_line,
-    414: WildTopLevel.from_line,
-    415: BadMask.from_line,
-    421: UnknownCommand.from_line,
-    422: NoMotd.from_line,
-    423: NoAdminInfo.from_line,
-    424: FileError.from_line,
-    431: NoNicknameGiven.from_line,
-    432: ErroneusNickname.from_line,
-    433: NicknameInUse.from_line,
-    436: NickCollision.from_line,
-    437: UnavailResource.from_line,
-    441: UserNotInChannel.from_line,
-    442: NotOnChannel.from_line,
-    443: UserOnChannel.from_line,
-    444: NoLogin.from_line,
-    445: SummonDisabled.from_line,
-    446: UsersDisabled.from_line,
-    451: NotRegistered.from_line,
-    461: NeedMoreParams.from_line,
-    462: AlreadyRegistered.from_line,
-    463: NoPermForHost.from_line,
-    464: PasswordMismatch.from_line,
-    465: YoureBannedCreep.from_line,
-    466: YouWillBeBanned.from_line,
-    467: KeySet.from_line,
-    471: ChannelIsFull.from_line,
-    472: UnknownMode.from_line,
-    473: InviteOnlyChan.from_line,
-    474: BannedFromChan.from_line,
-    475: BadChannelKey.from_line,
-    476: BadChanMask.from_line,
-    477: NoChanModes.from_line,
-    478: BanListFull.from_line,
-    481: NoPrivileges.from_line,
-    482: ChanOpPrivsNeeded.from_line,
-    483: CantKillServer.from_line,
-    484: Restricted.from_line,
-    485: UniqOpPrivsNeeded.from_line,
-    491: NoOperHost.from_line,
-    501: UserModeUnknownFlag.from_line,
-    502: UsersDontMatch.from_line,
+    b'PASS': Passwd._from_line,
+    b'NICK': Nick._from_line,
+    b'USER': User._from_line,
+    b'OPER': Oper._from_line,
+    b'MODE': Mode._from_line,
+    b'SERVICE': Service._from_line,
+    b'QUIT': Quit._from_line,
+    b'SQUIT': SQuit._from_line,
+    b'JOIN': ChannelJoin._from_line,
+    b'PART': ChannelPart._from_line,
+    b'TOPIC': Topic._from_line,
+    b'NAMES': Names._from_line,
+    b'LIST': List._from_line,
+    b'INVITE': Invite._from_line,
+    b'KICK': Kick._from_line,
+    b'PRIVMSG': Privmsg._from_line,
+    b'NOTICE': Notice._from_line,
+    b'MOTD': Motd._from_line,
+    b'LUSERS': Lusers._from_line,
+    b'VERSION': Version._from_line,
+    b'STATS': Stats._from_line,
+    b'LINKS': Links._from_line,
+    b'TIME': Time._from_line,
+    b'CONNECT': ServerConnect._from_line,
+    b'TRACE': Trace._from_line,
+    b'ADMIN': Admin._from_line,
+    b'INFO': Info._from_line,
+    b'SERVLIST': ServList._from_line,
+    b'SQUERY': SQuery._from_line,
+    b'WHO': Who._from_line,
+    b'WHOIS': WhoIs._from_line,
+    b'WHOWAS': WhoWas._from_line,
+    b'KILL': Kill._from_line,
+    b'PING': Ping._from_line,
+    b'PONG': Pong._from_line,
+    b'ERROR': Error._from_line,
+    b'AWAY': Away._from_line,
+    b'REHASH': Rehash._from_line,
+    b'DIE': Die._from_line,
+    b'RESTART': Restart._from_line,
+    b'SUMMON': Summon._from_line,
+    b'USERS': Users._from_line,
+    b'WALLOPS': WallOps._from_line,
+    b'USERHOST': UserHost._from_line,
+    b'ISON': IsOn._from_line,
+    1: Welcome._from_line,
+    2: YourHost._from_line,
+    3: Created._from_line,
+    4: MyInfo._from_line,
+    5: Bounce._from_line,
+    200: TraceLinkReply._from_line,
+    201: TraceConnecting._from_line,
+    202: TraceHandshake._from_line,
+    203: TraceUnknown._from_line,
+    204: TraceOperator._from_line,
+    205: TraceUser._from_line,
+    206: TraceServer._from_line,
+    207: TraceService._from_line,
+    208: TraceNewtype._from_line,
+    209: TraceClass._from_line,
+    211: StatsLinkInfo._from_line,
+    212: StatsCommands._from_line,
+    219: StatsEnd._from_line,
+    221: UserModeIs._from_line,
+    234: ServListReply._from_line,
+    235: ServListEnd._from_line,
+    242: StatsUptime._from_line,
+    243: StatsOline._from_line,
+    251: LuserClient._from_line,
+    252: LuserOp._from_line,
+    253: LuserUnknown._from_line,
+    254: LuserChannels._from_line,
+    255: LuserMe._from_line,
+    256: AdminMe._from_line,
+    257: AdminLoc1._from_line,
+    258: AdminLoc2._from_line,
+    259: AdminEmail._from_line,
+    261: TraceLog._from_line,
+    262: TraceEnd._from_line,
+    263: TryAgain._from_line,
+    301: AwayReply._from_line,
+    302: UserHostReply._from_line,
+    303: IsOnReply._from_line,
+    305: UnawayReply._from_line,
+    306: NowAwayReply._from_line,
+    311: WhoIsUser._from_line,
+    312: WhoIsServer._from_line,
+    313: WhoIsOperator._from_line,
+    314: WhoWasUser._from_line,
+    315: WhoEnd._from_line,
+    317: WhoIsIdle._from_line,
+    318: WhoIsEnd._from_line,
+    319: WhoIsChannels._from_line,
+    322: ListReply._from_line,
+    323: ListEnd._from_line,
+    324: ChannelModeIs._from_line,
+    325: UniqOpIs._from_line,
+    331: NoTopicReply._from_line,
+    332: TopicReply._from_line,
+    341: Inviting._from_line,
+    342: Summoning._from_line,
+    346: InviteList._from_line,
+    347: InviteListEnd._from_line,
+    348: ExceptList._from_line,
+    349: ExceptListEnd._from_line,
+    351: VersionReply._from_line,
+    352: WhoReply._from_line,
+    353: NamesReply._from_line,
+    364: LinksReply._from_line,
+    365: LinksEnd._from_line,
+    366: NamesEnd._from_line,
+    367: BanList._from_line,
+    368: BanListEnd._from_line,
+    369: WhoWasEnd._from_line,
+    371: InfoReply._from_line,
+    372: MotdText._from_line,
+    374: InfoEnd._from_line,
+    375: MotdStart._from_line,
+    376: MotdEnd._from_line,
+    381: YoureOper._from_line,
+    382: Rehashing._from_line,
+    383: YoureService._from_line,
+    391: TimeReply._from_line,
+    392: UsersStart._from_line,
+    393: UsersReply._from_line,
+    394: UsersEnd._from_line,
+    395: NoUsers._from_line,
+    401: NoSuchNick._from_line,
+    402: NoSuchServer._from_line,
+    403: NoSuchChannel._from_line,
+    404: CantSendToChan._from_line,
+    405: TooManyChannels._from_line,
+    406: WasNoSuchNick._from_line,
+    407: TooManyTargets._from_line,
+    408: NoSuchService._from_line,
+    409: NoOrigin._from_line,
+    411: NoRecipient._from_line,
+    412: NoTextToSend._from_line,
+    413: NoTopLevel._from_line,
+    414: WildTopLevel._from_line,
+    415: BadMask._from_line,
+    421: UnknownCommand._from_line,
+    422: NoMotd._from_line,
+    423: NoAdminInfo._from_line,
+    424: FileError._from_line,
+    431: NoNicknameGiven._from_line,
+    432: ErroneusNickname._from_line,
+    433: NicknameInUse._from_line,
+    436: NickCollision._from_line,
+    437: UnavailResource._from_line,
+    441: UserNotInChannel._from_line,
+    442: NotOnChannel._from_line,
+    443: UserOnChannel._from_line,
+    444: NoLogin._from_line,
+    445: SummonDisabled._from_line,
+    446: UsersDisabled._from_line,
+    451: NotRegistered._from_line,
+    461: NeedMoreParams._from_line,
+    462: AlreadyRegistered._from_line,
+    463: NoPermForHost._from_line,
+    464: PasswordMismatch._from_line,
+    465: YoureBannedCreep._from_line,
+    466: YouWillBeBanned._from_line,
+    467: KeySet._from_line,
+    471: ChannelIsFull._from_line,
+    472: UnknownMode._from_line,
+    473: InviteOnlyChan._from_line,
+    474: BannedFromChan._from_line,
+    475: BadChannelKey._from_line,
+    476: BadChanMask._from_line,
+    477: NoChanModes._from_line,
+    478: BanListFull._from_line,
+    481: NoPrivileges._from_line,
+    482: ChanOpPrivsNeeded._from_line,
+    483: CantKillServer._from_line,
+    484: Restricted._from_line,
+    485: UniqOpPrivsNeeded._from_line,
+    491: NoOperHost._from_line,
+    501: UserModeUnknownFlag._from_line,
+    502: UsersDontMatch._from_line,
+
+}
+lazy_from_lines_by_verb = {
+    b'PASS': LazyPasswd._from_line,
+    b'NICK': LazyNick._from_line,
+    b'USER': LazyUser._from_line,
+    b'OPER': LazyOper._from_line,
+    b'MODE': LazyMode._from_line,
+    b'SERVICE': LazyService._from_line,
+    b'QUIT': LazyQuit._from_line,
+    b'SQUIT': LazySQuit._from_line,
+    b'JOIN': LazyChannelJoin._from_line,
+    b'PART': LazyChannelPart._from_line,
+    b'TOPIC': LazyTopic._from_line,
+    b'NAMES': LazyNames._from_line,
+    b'LIST': LazyList._from_line,
+    b'INVITE': LazyInvite._from_line,
+    b'KICK': LazyKick._from_line,
+    b'PRIVMSG': LazyPrivmsg._from_line,
+    b'NOTICE': LazyNotice._from_line,
+    b'MOTD': LazyMotd._from_line,
+    b'LUSERS': LazyLusers._from_line,
+    b'VERSION': LazyVersion._from_line,
+    b'STATS': LazyStats._from_line,
+    b'LINKS': LazyLinks._from_line,
+    b'TIME': LazyTime._from_line,
+    b'CONNECT': LazyServerConnect._from_line,
+    b'TRACE': LazyTrace._from_line,
+    b'ADMIN': LazyAdmin._from_line,
+    b'INFO': LazyInfo._from_line,
+    b'SERVLIST': LazyServList._from_line,
+    b'SQUERY': LazySQuery._from_line,
+    b'WHO': LazyWho._from_line,
+    b'WHOIS': LazyWhoIs._from_line,
+    b'WHOWAS': LazyWhoWas._from_line,
+    b'KILL': LazyKill._from_line,
+    b'PING': LazyPing._from_line,
+    b'PONG': LazyPong._from_line,
+    b'ERROR': LazyError._from_line,
+    b'AWAY': LazyAway._from_line,
+    b'REHASH': LazyRehash._from_line,
+    b'DIE': LazyDie._from_line,
+    b'RESTART': LazyRestart._from_line,
+    b'SUMMON': LazySummon._from_line,
+    b'USERS': LazyUsers._from_line,
+    b'WALLOPS': LazyWallOps._from_line,
+    b'USERHOST': LazyUserHost._from_line,
+    b'ISON': LazyIsOn._from_line,
+    1: LazyWelcome._from_line,
+    2: LazyYourHost._from_line,
+    3: LazyCreated._from_line,
+    4: LazyMyInfo._from_line,
+    5: LazyBounce._from_line,
+    200: LazyTraceLinkReply._from_line,
+    201: LazyTraceConnecting._from_line,
+    202: LazyTraceHandshake._from_line,
+    203: LazyTraceUnknown._from_line,
+    204: LazyTraceOperator._from_line,
+    205: LazyTraceUser._from_line,
+    206: LazyTraceServer._from_line,
+    207: LazyTraceService._from_line,
+    208: LazyTraceNewtype._from_line,
+    209: LazyTraceClass._from_line,
+    211: LazyStatsLinkInfo._from_line,
+    212: LazyStatsCommands._from_line,
+    219: LazyStatsEnd._from_line,
+    221: LazyUserModeIs._from_line,
+    234: LazyServListReply._from_line,
+    235: LazyServListEnd._from_line,
+    242: LazyStatsUptime._from_line,
+    243: LazyStatsOline._from_line,
+    251: LazyLuserClient._from_line,
+    252: LazyLuserOp._from_line,
+    253: LazyLuserUnknown._from_line,
+    254: LazyLuserChannels._from_line,
+    255: LazyLuserMe._from_line,
+    256: LazyAdminMe._from_line,
+    257: LazyAdminLoc1._from_line,
+    258: LazyAdminLoc2._from_line,
+    259: LazyAdminEmail._from_line,
+    261: LazyTraceLog._from_line,
+    262: LazyTraceEnd._from_line,
+    263: LazyTryAgain._from_line,
+    301: LazyAwayReply._from_line,
+    302: LazyUserHostReply._from_line,
+    303: LazyIsOnReply._from_line,
+    305: LazyUnawayReply._from_line,
+    306: LazyNowAwayReply._from_line,
+    311: LazyWhoIsUser._from_line,
+    312: LazyWhoIsServer._from_line,
+    313: LazyWhoIsOperator._from_line,
+    314: LazyWhoWasUser._from_line,
+    315: LazyWhoEnd._from_line,
+    317: LazyWhoIsIdle._from_line,
+    318: LazyWhoIsEnd._from_line,
+    319: LazyWhoIsChannels._from_line,
+    322: LazyListReply._from_line,
+    323: LazyListEnd._from_line,
+    324: LazyChannelModeIs._from_line,
+    325: LazyUniqOpIs._from_line,
+    331: LazyNoTopicReply._from_line,
+    332: LazyTopicReply._from_line,
+    341: LazyInviting._from_line,
+    342: LazySummoning._from_line,
+    346: LazyInviteList._from_line,
+    347: LazyInviteListEnd._from_line,
+    348: LazyExceptList._from_line,
+    349: LazyExceptListEnd._from_line,
+    351: LazyVersionReply._from_line,
+    352: LazyWhoReply._from_line,
+    353: LazyNamesReply._from_line,
+    364: LazyLinksReply._from_line,
+    365: LazyLinksEnd._from_line,
+    366: LazyNamesEnd._from_line,
+    367: LazyBanList._from_line,
+    368: LazyBanListEnd._from_line,
+    369: LazyWhoWasEnd._from_line,
+    371: LazyInfoReply._from_line,
+    372: LazyMotdText._from_line,
+    374: LazyInfoEnd._from_line,
+    375: LazyMotdStart._from_line,
+    376: LazyMotdEnd._from_line,
+    381: LazyYoureOper._from_line,
+    382: LazyRehashing._from_line,
+    383: LazyYoureService._from_line,
+    391: LazyTimeReply._from_line,
+    392: LazyUsersStart._from_line,
+    393: LazyUsersReply._from_line,
+    394: LazyUsersEnd._from_line,
+    395: LazyNoUsers._from_line,
+    401: LazyNoSuchNick._from_line,
+    402: LazyNoSuchServer._from_line,
+    403: LazyNoSuchChannel._from_line,
+    404: LazyCantSendToChan._from_line,
+    405: LazyTooManyChannels._from_line,
+    406: LazyWasNoSuchNick._from_line,
+    407: LazyTooManyTargets._from_line,
+    408: LazyNoSuchService._from_line,
+    409: LazyNoOrigin._from_line,
+    411: LazyNoRecipient._from_line,
+    412: LazyNoTextToSend._from_line,
+    413: LazyNoTopLevel._from_line,
+    414: LazyWildTopLevel._from_line,
+    415: LazyBadMask._from_line,
+    421: LazyUnknownCommand._from_line,
+    422: LazyNoMotd._from_line,
+    423: LazyNoAdminInfo._from_line,
+    424: LazyFileError._from_line,
+    431: LazyNoNicknameGiven._from_line,
+    432: LazyErroneusNickname._from_line,
+    433: LazyNicknameInUse._from_line,
+    436: LazyNickCollision._from_line,
+    437: LazyUnavailResource._from_line,
+    441: LazyUserNotInChannel._from_line,
+    442: LazyNotOnChannel._from_line,
+    443: LazyUserOnChannel._from_line,
+    444: LazyNoLogin._from_line,
+    445: LazySummonDisabled._from_line,
+    446: LazyUsersDisabled._from_line,
+    451: LazyNotRegistered._from_line,
+    461: LazyNeedMoreParams._from_line,
+    462: LazyAlreadyRegistered._from_line,
+    463: LazyNoPermForHost._from_line,
+    464: LazyPasswordMismatch._from_line,
+    465: LazyYoureBannedCreep._from_line,
+    466: LazyYouWillBeBanned._from_line,
+    467: LazyKeySet._from_line,
+    471: LazyChannelIsFull._from_line,
+    472: LazyUnknownMode._from_line,
+    473: LazyInviteOnlyChan._from_line,
+    474: LazyBannedFromChan._from_line,
+    475: LazyBadChannelKey._from_line,
+    476: LazyBadChanMask._from_line,
+    477: LazyNoChanModes._from_line,
+    478: LazyBanListFull._from_line,
+    481: LazyNoPrivileges._from_line,
+    482: LazyChanOpPrivsNeeded._from_line,
+    483: LazyCantKillServer._from_line,
+    484: LazyRestricted._from_line,
+    485: LazyUniqOpPrivsNeeded._from_line,
+    491: LazyNoOperHost._from_line,
+    501: LazyUserModeUnknownFlag._from_line,
+    502: LazyUsersDontMatch._from_line,
 
 }
+intern_commands(from_lines_by_verb)
+
 class MessageFactory:
     message_source = None # type: str
     def message(self, msg: Message) -> None:
@@ -8446,42 +19144,42 @@ class MessageFactory:
 
     def channel_join(self, channels: typing.List[str], keys: typing.List[str] = None) -> None:
         """
-        ``JOIN <channels,> [keys,]``
+        ``JOIN <#channels,> [keys,]``
         """
 
         self.message(ChannelJoin(self.message_source, channels=channels, keys=keys))
 
     def channel_part(self, channels: typing.List[str], message: str = None) -> None:
         """
-        ``PART <channels,> [message]``
+        ``PART <#channels,> [message]``
         """
 
         self.message(ChannelPart(self.message_source, channels=channels, message=message))
 
     def topic(self, channel: str, topic: str = None) -> None:
         """
-        ``TOPIC <channel> [topic]``
+        ``TOPIC <#channel> [topic]``
         """
 
         self.message(Topic(self.message_source, channel=channel, topic=topic))
 
     def names(self, channels: typing.List[str] = None, target: str = None) -> None:
         """
-        ``NAMES [channels,] [target]``
+        ``NAMES [#channels,] [target]``
         """
 
         self.message(Names(self.message_source, channels=channels, target=target))
 
     def list(self, channels: typing.List[str] = None, target: str = None) -> None:
         """
-        ``LIST [channels,] [target]``
+        ``LIST [#channels,] [target]``
         """
 
         self.message(List(self.message_source, channels=channels, target=target))
 
     def invite(self, nickname: str, channel: str) -> None:
         """
-        ``INVITE <nickname> <channel>``
+        ``INVITE <nickname> <#channel>``
         """
 
         self.message(Invite(self.message_source, nickname=nickname, channel=channel))
@@ -9042,14 +19740,14 @@ class MessageFactory:
 
     def who_is_channels(self, target: str, nickname: str, channels: str) -> None:
         """
-        ``319 <target> <nickname> <channels>``
+        ``319 <target> <nickname> <#channels>``
         """
 
         self.message(WhoIsChannels(self.message_source, target=target, nickname=nickname, channels=channels))
 
     def list_reply(self, target: str, channel: str, visible: int, topic: str) -> None:
         """
-        ``322 <target> <channel> <int:visible> <topic>``
+        ``322 <target> <#channel> <int:visible> <topic>``
         """
 
         self.message(ListReply(self.message_source, target=target, channel=channel, visible=visible, topic=topic))
@@ -9063,35 +19761,35 @@ class MessageFactory:
 
     def channel_mode_is(self, target: str, channel: str, mode: str, params: str) -> None:
         """
-        ``324 <target> <channel> <mode> <params>``
+        ``324 <target> <#channel> <mode> <params>``
         """
 
         self.message(ChannelModeIs(self.message_source, target=target, channel=channel, mode=mode, params=params))
 
     def uniq_op_is(self, target: str, channel: str, nickname: str) -> None:
         """
-        ``325 <target> <channel> <nickname>``
+        ``325 <target> <#channel> <nickname>``
         """
 
         self.message(UniqOpIs(self.message_source, target=target, channel=channel, nickname=nickname))
 
     def no_topic_reply(self, target: str, channel: str) -> None:
         """
-        ``331 <target> <channel> :No topic is set``
+        ``331 <target> <#channel> :No topic is set``
         """
 
         self.message(NoTopicReply(self.message_source, target=target, channel=channel))
 
     def topic_reply(self, target: str, channel: str, topic: str) -> None:
         """
-        ``332 <target> <channel> <topic>``
+        ``332 <target> <#channel> <topic>``
         """
 
         self.message(TopicReply(self.message_source, target=target, channel=channel, topic=topic))
 
     def inviting(self, target: str, channel: str, nick: str) -> None:
         """
-        ``341 <target> <channel> <nick>``
+        ``341 <target> <#channel> <nick>``
         """
 
         self.message(Inviting(self.message_source, target=target, channel=channel, nick=nick))
@@ -9105,28 +19803,28 @@ class MessageFactory:
 
     def invite_list(self, target: str, channel: str, mask: str) -> None:
         """
-        ``346 <target> <channel> <mask>``
+        ``346 <target> <#channel> <mask>``
         """
 
         self.message(InviteList(self.message_source, target=target, channel=channel, mask=mask))
 
     def invite_list_end(self, target: str, channel: str) -> None:
         """
-        ``347 <target> <channel> :End of channel invite list``
+        ``347 <target> <#channel> :End of channel invite list``
         """
 
         self.message(InviteListEnd(self.message_source, target=target, channel=channel))
 
     def except_list(self, target: str, channel: str, mask: str) -> None:
         """
-        ``348 <target> <channel> <mask>``
+        ``348 <target> <#channel> <mask>``
         """
 
         self.message(ExceptList(self.message_source, target=target, channel=channel, mask=mask))
 
     def except_list_end(self, target: str, channel: str) -> None:
         """
-        ``349 <target> <channel> :End of channel exception list``
+        ``349 <target> <#channel> :End of channel exception list``
         """
 
         self.message(ExceptListEnd(self.message_source, target=target, channel=channel))
@@ -9140,14 +19838,14 @@ class MessageFactory:
 
     def who_reply(self, target: str, channel: str, user: str, host: str, server: str, nickname: str, props: str, realname: str) -> None:
         """
-        ``352 <target> <channel> <user> <host> <server> <nickname> <props> <realname>``
+        ``352 <target> <#channel> <user> <host> <server> <nickname> <props> <realname>``
         """
 
         self.message(WhoReply(self.message_source, target=target, channel=channel, user=user, host=host, server=server, nickname=nickname, props=props, realname=realname))
 
     def names_reply(self, target: str, mode: str, channel: str, nicknames: typing.List[str]) -> None:
         """
-        ``353 <target> <mode> <channel> <nicknames_>``
+        ``353 <target> <mode> <#channel> <nicknames_>``
         """
 
         self.message(NamesReply(self.message_source, target=target, mode=mode, channel=channel, nicknames=nicknames))
@@ -9168,21 +19866,21 @@ class MessageFactory:
 
     def names_end(self, target: str, channel: str) -> None:
         """
-        ``366 <target> <channel> :End of NAMES list``
+        ``366 <target> <#channel> :End of NAMES list``
         """
 
         self.message(NamesEnd(self.message_source, target=target, channel=channel))
 
     def ban_list(self, target: str, channel: str, mask: str) -> None:
         """
-        ``367 <target> <channel> <mask>``
+        ``367 <target> <#channel> <mask>``
         """
 
         self.message(BanList(self.message_source, target=target, channel=channel, mask=mask))
 
     def ban_list_end(self, target: str, channel: str) -> None:
         """
-        ``368 <target> <channel> :End of channel ban list``
+        ``368 <target> <#channel> :End of channel ban list``
         """
 
         self.message(BanListEnd(self.message_source, target=target, channel=channel))
@@ -9301,21 +19999,21 @@ class MessageFactory:
 
     def no_such_channel(self, target: str, channel: str) -> None:
         """
-        ``403 <target> <channel> :No such channel``
+        ``403 <target> <#channel> :No such channel``
         """
 
         self.message(NoSuchChannel(self.message_source, target=target, channel=channel))
 
     def cant_send_to_chan(self, target: str, channel: str) -> None:
         """
-        ``404 <target> <channel> :Cannot send to channel``
+        ``404 <target> <#channel> :Cannot send to channel``
         """
 
         self.message(CantSendToChan(self.message_source, target=target, channel=channel))
 
     def too_many_channels(self, target: str, channel: str) -> None:
         """
-        ``405 <target> <channel> :You have joined too many channels``
+        ``405 <target> <#channel> :You have joined too many channels``
         """
 
         self.message(TooManyChannels(self.message_source, target=target, channel=channel))
@@ -9448,21 +20146,21 @@ class MessageFactory:
 
     def user_not_in_channel(self, target: str, nickname: str, channel: str) -> None:
         """
-        ``441 <target> <nickname> <channel> :They aren't on that channel``
+        ``441 <target> <nickname> <#channel> :They aren't on that channel``
         """
 
         self.message(UserNotInChannel(self.message_source, target=target, nickname=nickname, channel=channel))
 
     def not_on_channel(self, target: str, channel: str) -> None:
         """
-        ``442 <target> <channel> :You're not on that channel``
+        ``442 <target> <#channel> :You're not on that channel``
         """
 
         self.message(NotOnChannel(self.message_source, target=target, channel=channel))
 
     def user_on_channel(self, target: str, user: str, channel: str) -> None:
         """
-        ``443 <target> <user> <channel> :is already on channel``
+        ``443 <target> <user> <#channel> :is already on channel``
         """
 
         self.message(UserOnChannel(self.message_source, target=target, user=user, channel=channel))
@@ -9539,14 +20237,14 @@ class MessageFactory:
 
     def key_set(self, target: str, channel: str) -> None:
         """
-        ``467 <target> <channel> :Channel key already set``
+        ``467 <target> <#channel> :Channel key already set``
         """
 
         self.message(KeySet(self.message_source, target=target, channel=channel))
 
     def channel_is_full(self, target: str, channel: str) -> None:
         """
-        ``471 <target> <channel> :Cannot join channel (+l)``
+        ``471 <target> <#channel> :Cannot join channel (+l)``
         """
 
         self.message(ChannelIsFull(self.message_source, target=target, channel=channel))
@@ -9560,42 +20258,42 @@ class MessageFactory:
 
     def invite_only_chan(self, target: str, channel: str) -> None:
         """
-        ``473 <target> <channel> :Cannot join channel (+i)``
+        ``473 <target> <#channel> :Cannot join channel (+i)``
         """
 
         self.message(InviteOnlyChan(self.message_source, target=target, channel=channel))
 
     def banned_from_chan(self, target: str, channel: str) -> None:
         """
-        ``474 <target> <channel> :Cannot join channel (+b)``
+        ``474 <target> <#channel> :Cannot join channel (+b)``
         """
 
         self.message(BannedFromChan(self.message_source, target=target, channel=channel))
 
     def bad_channel_key(self, target: str, channel: str) -> None:
         """
-        ``475 <target> <channel> :Cannot join channel (+k)``
+        ``475 <target> <#channel> :Cannot join channel (+k)``
         """
 
         self.message(BadChannelKey(self.message_source, target=target, channel=channel))
 
     def bad_chan_mask(self, target: str, channel: str) -> None:
         """
-        ``476 <target> <channel> :Bad Channel Mask``
+        ``476 <target> <#channel> :Bad Channel Mask``
         """
 
         self.message(BadChanMask(self.message_source, target=target, channel=channel))
 
     def no_chan_modes(self, target: str, channel: str) -> None:
         """
-        ``477 <target> <channel> :Channel doesn't support modes``
+        ``477 <target> <#channel> :Channel doesn't support modes``
         """
 
         self.message(NoChanModes(self.message_source, target=target, channel=channel))
 
     def ban_list_full(self, target: str, channel: str, char: str) -> None:
         """
-        ``478 <target> <channel> <char> :Channel list is full``
+        ``478 <target> <#channel> <char> :Channel list is full``
         """
 
         self.message(BanListFull(self.message_source, target=target, channel=channel, char=char))
@@ -9609,7 +20307,7 @@ class MessageFactory:
 
     def chan_op_privs_needed(self, target: str, channel: str) -> None:
         """
-        ``482 <target> <channel> :You're not channel operator``
+        ``482 <target> <#channel> :You're not channel operator``
         """
 
         self.message(ChanOpPrivsNeeded(self.message_source, target=target, channel=channel))
@@ -9657,7 +20355,395 @@ class MessageFactory:
         self.message(UsersDontMatch(self.message_source, target=target))
 
 
+handler_names_by_class = {
+    Passwd: 'on_passwd',
+    Nick: 'on_nick',
+    User: 'on_user',
+    Oper: 'on_oper',
+    Mode: 'on_mode',
+    Service: 'on_service',
+    Quit: 'on_quit',
+    SQuit: 'on_s_quit',
+    ChannelJoin: 'on_channel_join',
+    ChannelPart: 'on_channel_part',
+    Topic: 'on_topic',
+    Names: 'on_names',
+    List: 'on_list',
+    Invite: 'on_invite',
+    Kick: 'on_kick',
+    Privmsg: 'on_privmsg',
+    Notice: 'on_notice',
+    Motd: 'on_motd',
+    Lusers: 'on_lusers',
+    Version: 'on_version',
+    Stats: 'on_stats',
+    Links: 'on_links',
+    Time: 'on_time',
+    ServerConnect: 'on_server_connect',
+    Trace: 'on_trace',
+    Admin: 'on_admin',
+    Info: 'on_info',
+    ServList: 'on_serv_list',
+    SQuery: 'on_s_query',
+    Who: 'on_who',
+    WhoIs: 'on_who_is',
+    WhoWas: 'on_who_was',
+    Kill: 'on_kill',
+    Ping: 'on_ping',
+    Pong: 'on_pong',
+    Error: 'on_error',
+    Away: 'on_away',
+    Rehash: 'on_rehash',
+    Die: 'on_die',
+    Restart: 'on_restart',
+    Summon: 'on_summon',
+    Users: 'on_users',
+    WallOps: 'on_wall_ops',
+    UserHost: 'on_user_host',
+    IsOn: 'on_is_on',
+    Welcome: 'on_welcome',
+    YourHost: 'on_your_host',
+    Created: 'on_created',
+    MyInfo: 'on_my_info',
+    Bounce: 'on_bounce',
+    TraceLinkReply: 'on_trace_link_reply',
+    TraceConnecting: 'on_trace_connecting',
+    TraceHandshake: 'on_trace_handshake',
+    TraceUnknown: 'on_trace_unknown',
+    TraceOperator: 'on_trace_operator',
+    TraceUser: 'on_trace_user',
+    TraceServer: 'on_trace_server',
+    TraceService: 'on_trace_service',
+    TraceNewtype: 'on_trace_newtype',
+    TraceClass: 'on_trace_class',
+    StatsLinkInfo: 'on_stats_link_info',
+    StatsCommands: 'on_stats_commands',
+    StatsEnd: 'on_stats_end',
+    UserModeIs: 'on_user_mode_is',
+    ServListReply: 'on_serv_list_reply',
+    ServListEnd: 'on_serv_list_end',
+    StatsUptime: 'on_stats_uptime',
+    StatsOline: 'on_stats_oline',
+    LuserClient: 'on_luser_client',
+    LuserOp: 'on_luser_op',
+    LuserUnknown: 'on_luser_unknown',
+    LuserChannels: 'on_luser_channels',
+    LuserMe: 'on_luser_me',
+    AdminMe: 'on_admin_me',
+    AdminLoc1: 'on_admin_loc1',
+    AdminLoc2: 'on_admin_loc2',
+    AdminEmail: 'on_admin_email',
+    TraceLog: 'on_trace_log',
+    TraceEnd: 'on_trace_end',
+    TryAgain: 'on_try_again',
+    AwayReply: 'on_away_reply',
+    UserHostReply: 'on_user_host_reply',
+    IsOnReply: 'on_is_on_reply',
+    UnawayReply: 'on_unaway_reply',
+    NowAwayReply: 'on_now_away_reply',
+    WhoIsUser: 'on_who_is_user',
+    WhoIsServer: 'on_who_is_server',
+    WhoIsOperator: 'on_who_is_operator',
+    WhoWasUser: 'on_who_was_user',
+    WhoEnd: 'on_who_end',
+    WhoIsIdle: 'on_who_is_idle',
+    WhoIsEnd: 'on_who_is_end',
+    WhoIsChannels: 'on_who_is_channels',
+    ListReply: 'on_list_reply',
+    ListEnd: 'on_list_end',
+    ChannelModeIs: 'on_channel_mode_is',
+    UniqOpIs: 'on_uniq_op_is',
+    NoTopicReply: 'on_no_topic_reply',
+    TopicReply: 'on_topic_reply',
+    Inviting: 'on_inviting',
+    Summoning: 'on_summoning',
+    InviteList: 'on_invite_list',
+    InviteListEnd: 'on_invite_list_end',
+    ExceptList: 'on_except_list',
+    ExceptListEnd: 'on_except_list_end',
+    VersionReply: 'on_version_reply',
+    WhoReply: 'on_who_reply',
+    NamesReply: 'on_names_reply',
+    LinksReply: 'on_links_reply',
+    LinksEnd: 'on_links_end',
+    NamesEnd: 'on_names_end',
+    BanList: 'on_ban_list',
+    BanListEnd: 'on_ban_list_end',
+    WhoWasEnd: 'on_who_was_end',
+    InfoReply: 'on_info_reply',
+    MotdText: 'on_motd_text',
+    InfoEnd: 'on_info_end',
+    MotdStart: 'on_motd_start',
+    MotdEnd: 'on_motd_end',
+    YoureOper: 'on_youre_oper',
+    Rehashing: 'on_rehashing',
+    YoureService: 'on_youre_service',
+    TimeReply: 'on_time_reply',
+    UsersStart: 'on_users_start',
+    UsersReply: 'on_users_reply',
+    UsersEnd: 'on_users_end',
+    NoUsers: 'on_no_users',
+    NoSuchNick: 'on_no_such_nick',
+    NoSuchServer: 'on_no_such_server',
+    NoSuchChannel: 'on_no_such_channel',
+    CantSendToChan: 'on_cant_send_to_chan',
+    TooManyChannels: 'on_too_many_channels',
+    WasNoSuchNick: 'on_was_no_such_nick',
+    TooManyTargets: 'on_too_many_targets',
+    NoSuchService: 'on_no_such_service',
+    NoOrigin: 'on_no_origin',
+    NoRecipient: 'on_no_recipient',
+    NoTextToSend: 'on_no_text_to_send',
+    NoTopLevel: 'on_no_top_level',
+    WildTopLevel: 'on_wild_top_level',
+    BadMask: 'on_bad_mask',
+    UnknownCommand: 'on_unknown_command',
+    NoMotd: 'on_no_motd',
+    NoAdminInfo: 'on_no_admin_info',
+    FileError: 'on_file_error',
+    NoNicknameGiven: 'on_no_nickname_given',
+    ErroneusNickname: 'on_erroneus_nickname',
+    NicknameInUse: 'on_nickname_in_use',
+    NickCollision: 'on_nick_collision',
+    UnavailResource: 'on_unavail_resource',
+    UserNotInChannel: 'on_user_not_in_channel',
+    NotOnChannel: 'on_not_on_channel',
+    UserOnChannel: 'on_user_on_channel',
+    NoLogin: 'on_no_login',
+    SummonDisabled: 'on_summon_disabled',
+    UsersDisabled: 'on_users_disabled',
+    NotRegistered: 'on_not_registered',
+    NeedMoreParams: 'on_need_more_params',
+    AlreadyRegistered: 'on_already_registered',
+    NoPermForHost: 'on_no_perm_for_host',
+    PasswordMismatch: 'on_password_mismatch',
+    YoureBannedCreep: 'on_youre_banned_creep',
+    YouWillBeBanned: 'on_you_will_be_banned',
+    KeySet: 'on_key_set',
+    ChannelIsFull: 'on_channel_is_full',
+    UnknownMode: 'on_unknown_mode',
+    InviteOnlyChan: 'on_invite_only_chan',
+    BannedFromChan: 'on_banned_from_chan',
+    BadChannelKey: 'on_bad_channel_key',
+    BadChanMask: 'on_bad_chan_mask',
+    NoChanModes: 'on_no_chan_modes',
+    BanListFull: 'on_ban_list_full',
+    NoPrivileges: 'on_no_privileges',
+    ChanOpPrivsNeeded: 'on_chan_op_privs_needed',
+    CantKillServer: 'on_cant_kill_server',
+    Restricted: 'on_restricted',
+    UniqOpPrivsNeeded: 'on_uniq_op_privs_needed',
+    NoOperHost: 'on_no_oper_host',
+    UserModeUnknownFlag: 'on_user_mode_unknown_flag',
+    UsersDontMatch: 'on_users_dont_match',
+
+}
+handler_names_by_verb = {
+    b'PASS': 'on_passwd',
+    b'NICK': 'on_nick',
+    b'USER': 'on_user',
+    b'OPER': 'on_oper',
+    b'MODE': 'on_mode',
+    b'SERVICE': 'on_service',
+    b'QUIT': 'on_quit',
+    b'SQUIT': 'on_s_quit',
+    b'JOIN': 'on_channel_join',
+    b'PART': 'on_channel_part',
+    b'TOPIC': 'on_topic',
+    b'NAMES': 'on_names',
+    b'LIST': 'on_list',
+    b'INVITE': 'on_invite',
+    b'KICK': 'on_kick',
+    b'PRIVMSG': 'on_privmsg',
+    b'NOTICE': 'on_notice',
+    b'MOTD': 'on_motd',
+    b'LUSERS': 'on_lusers',
+    b'VERSION': 'on_version',
+    b'STATS': 'on_stats',
+    b'LINKS': 'on_links',
+    b'TIME': 'on_time',
+    b'CONNECT': 'on_server_connect',
+    b'TRACE': 'on_trace',
+    b'ADMIN': 'on_admin',
+    b'INFO': 'on_info',
+    b'SERVLIST': 'on_serv_list',
+    b'SQUERY': 'on_s_query',
+    b'WHO': 'on_who',
+    b'WHOIS': 'on_who_is',
+    b'WHOWAS': 'on_who_was',
+    b'KILL': 'on_kill',
+    b'PING': 'on_ping',
+    b'PONG': 'on_pong',
+    b'ERROR': 'on_error',
+    b'AWAY': 'on_away',
+    b'REHASH': 'on_rehash',
+    b'DIE': 'on_die',
+    b'RESTART': 'on_restart',
+    b'SUMMON': 'on_summon',
+    b'USERS': 'on_users',
+    b'WALLOPS': 'on_wall_ops',
+    b'USERHOST': 'on_user_host',
+    b'ISON': 'on_is_on',
+    1: 'on_welcome',
+    2: 'on_your_host',
+    3: 'on_created',
+    4: 'on_my_info',
+    5: 'on_bounce',
+    200: 'on_trace_link_reply',
+    201: 'on_trace_connecting',
+    202: 'on_trace_handshake',
+    203: 'on_trace_unknown',
+    204: 'on_trace_operator',
+    205: 'on_trace_user',
+    206: 'on_trace_server',
+    207: 'on_trace_service',
+    208: 'on_trace_newtype',
+    209: 'on_trace_class',
+    211: 'on_stats_link_info',
+    212: 'on_stats_commands',
+    219: 'on_stats_end',
+    221: 'on_user_mode_is',
+    234: 'on_serv_list_reply',
+    235: 'on_serv_list_end',
+    242: 'on_stats_uptime',
+    243: 'on_stats_oline',
+    251: 'on_luser_client',
+    252: 'on_luser_op',
+    253: 'on_luser_unknown',
+    254: 'on_luser_channels',
+    255: 'on_luser_me',
+    256: 'on_admin_me',
+    257: 'on_admin_loc1',
+    258: 'on_admin_loc2',
+    259: 'on_admin_email',
+    261: 'on_trace_log',
+    262: 'on_trace_end',
+    263: 'on_try_again',
+    301: 'on_away_reply',
+    302: 'on_user_host_reply',
+    303: 'on_is_on_reply',
+    305: 'on_unaway_reply',
+    306: 'on_now_away_reply',
+    311: 'on_who_is_user',
+    312: 'on_who_is_server',
+    313: 'on_who_is_operator',
+    314: 'on_who_was_user',
+    315: 'on_who_end',
+    317: 'on_who_is_idle',
+    318: 'on_who_is_end',
+    319: 'on_who_is_channels',
+    322: 'on_list_reply',
+    323: 'on_list_end',
+    324: 'on_channel_mode_is',
+    325: 'on_uniq_op_is',
+    331: 'on_no_topic_reply',
+    332: 'on_topic_reply',
+    341: 'on_inviting',
+    342: 'on_summoning',
+    346: 'on_invite_list',
+    347: 'on_invite_list_end',
+    348: 'on_except_list',
+    349: 'on_except_list_end',
+    351: 'on_version_reply',
+    352: 'on_who_reply',
+    353: 'on_names_reply',
+    364: 'on_links_reply',
+    365: 'on_links_end',
+    366: 'on_names_end',
+    367: 'on_ban_list',
+    368: 'on_ban_list_end',
+    369: 'on_who_was_end',
+    371: 'on_info_reply',
+    372: 'on_motd_text',
+    374: 'on_info_end',
+    375: 'on_motd_start',
+    376: 'on_motd_end',
+    381: 'on_youre_oper',
+    382: 'on_rehashing',
+    383: 'on_youre_service',
+    391: 'on_time_reply',
+    392: 'on_users_start',
+    393: 'on_users_reply',
+    394: 'on_users_end',
+    395: 'on_no_users',
+    401: 'on_no_such_nick',
+    402: 'on_no_such_server',
+    403: 'on_no_such_channel',
+    404: 'on_cant_send_to_chan',
+    405: 'on_too_many_channels',
+    406: 'on_was_no_such_nick',
+    407: 'on_too_many_targets',
+    408: 'on_no_such_service',
+    409: 'on_no_origin',
+    411: 'on_no_recipient',
+    412: 'on_no_text_to_send',
+    413: 'on_no_top_level',
+    414: 'on_wild_top_level',
+    415: 'on_bad_mask',
+    421: 'on_unknown_command',
+    422: 'on_no_motd',
+    423: 'on_no_admin_info',
+    424: 'on_file_error',
+    431: 'on_no_nickname_given',
+    432: 'on_erroneus_nickname',
+    433: 'on_nickname_in_use',
+    436: 'on_nick_collision',
+    437: 'on_unavail_resource',
+    441: 'on_user_not_in_channel',
+    442: 'on_not_on_channel',
+    443: 'on_user_on_channel',
+    444: 'on_no_login',
+    445: 'on_summon_disabled',
+    446: 'on_users_disabled',
+    451: 'on_not_registered',
+    461: 'on_need_more_params',
+    462: 'on_already_registered',
+    463: 'on_no_perm_for_host',
+    464: 'on_password_mismatch',
+    465: 'on_youre_banned_creep',
+    466: 'on_you_will_be_banned',
+    467: 'on_key_set',
+    471: 'on_channel_is_full',
+    472: 'on_unknown_mode',
+    473: 'on_invite_only_chan',
+    474: 'on_banned_from_chan',
+    475: 'on_bad_channel_key',
+    476: 'on_bad_chan_mask',
+    477: 'on_no_chan_modes',
+    478: 'on_ban_list_full',
+    481: 'on_no_privileges',
+    482: 'on_chan_op_privs_needed',
+    483: 'on_cant_kill_server',
+    484: 'on_restricted',
+    485: 'on_uniq_op_privs_needed',
+    491: 'on_no_oper_host',
+    501: 'on_user_mode_unknown_flag',
+    502: 'on_users_dont_match',
+
+}
+handler_method_names = frozenset(handler_names_by_verb.values())
+
 class MessageHandler:
+    # message class -> name of its handler method, filled in on first use
+    _handler_names = {} # type: typing.Dict[type, typing.Optional[str]]
+    # verbs with an overridden on_* method, or None if on_message itself
+    # is overridden and so wants every line. Only class attributes can be
+    # seen here, so setting on_message or an on_* handler on an instance
+    # switches that instance to None as well
+    _handled_verbs = frozenset() # type: typing.Optional[typing.FrozenSet[typing.Union[bytes, int]]]
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.on_message is not MessageHandler.on_message:
+            cls._handled_verbs = None
+        else:
+            cls._handled_verbs = frozenset(verb for verb, name in handler_names_by_verb.items() if getattr(cls, name) is not getattr(MessageHandler, name))
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        if name == 'on_message' or name in handler_method_names:
+            super().__setattr__('_handled_verbs', None)
+        super().__setattr__(name, value)
+
     def on_passwd(self, passwd: Passwd) -> None: pass
     def on_nick(self, nick: Nick) -> None: pass
     def on_user(self, user: User) -> None: pass
@@ -9838,366 +20924,30 @@ class MessageHandler:
     def on_no_oper_host(self, no_oper_host: NoOperHost) -> None: pass
     def on_user_mode_unknown_flag(self, user_mode_unknown_flag: UserModeUnknownFlag) -> None: pass
     def on_users_dont_match(self, users_dont_match: UsersDontMatch) -> None: pass
+
+    @staticmethod
+    def _resolve_handler(msgcls: type) -> typing.Optional[str]:
+        handler = None
+        for base, name in handler_names_by_class.items():
+            if issubclass(msgcls, base):
+                handler = name
+                break
+        MessageHandler._handler_names[msgcls] = handler
+        return handler
+
     def on_message(self, msg: Message) -> None:
-        if isinstance(msg, Passwd):
-            self.on_passwd(msg)
-        elif isinstance(msg, Nick):
-            self.on_nick(msg)
-        elif isinstance(msg, User):
-            self.on_user(msg)
-        elif isinstance(msg, Oper):
-            self.on_oper(msg)
-        elif isinstance(msg, Mode):
-            self.on_mode(msg)
-        elif isinstance(msg, Service):
-            self.on_service(msg)
-        elif isinstance(msg, Quit):
-            self.on_quit(msg)
-        elif isinstance(msg, SQuit):
-            self.on_s_quit(msg)
-        elif isinstance(msg, ChannelJoin):
-            self.on_channel_join(msg)
-        elif isinstance(msg, ChannelPart):
-            self.on_channel_part(msg)
-        elif isinstance(msg, Topic):
-            self.on_topic(msg)
-        elif isinstance(msg, Names):
-            self.on_names(msg)
-        elif isinstance(msg, List):
-            self.on_list(msg)
-        elif isinstance(msg, Invite):
-            self.on_invite(msg)
-        elif isinstance(msg, Kick):
-            self.on_kick(msg)
-        elif isinstance(msg, Privmsg):
-            self.on_privmsg(msg)
-        elif isinstance(msg, Notice):
-            self.on_notice(msg)
-        elif isinstance(msg, Motd):
-            self.on_motd(msg)
-        elif isinstance(msg, Lusers):
-            self.on_lusers(msg)
-        elif isinstance(msg, Version):
-            self.on_version(msg)
-        elif isinstance(msg, Stats):
-            self.on_stats(msg)
-        elif isinstance(msg, Links):
-            self.on_links(msg)
-        elif isinstance(msg, Time):
-            self.on_time(msg)
-        elif isinstance(msg, ServerConnect):
-            self.on_server_connect(msg)
-        elif isinstance(msg, Trace):
-            self.on_trace(msg)
-        elif isinstance(msg, Admin):
-            self.on_admin(msg)
-        elif isinstance(msg, Info):
-            self.on_info(msg)
-        elif isinstance(msg, ServList):
-            self.on_serv_list(msg)
-        elif isinstance(msg, SQuery):
-            self.on_s_query(msg)
-        elif isinstance(msg, Who):
-            self.on_who(msg)
-        elif isinstance(msg, WhoIs):
-            self.on_who_is(msg)
-        elif isinstance(msg, WhoWas):
-            self.on_who_was(msg)
-        elif isinstance(msg, Kill):
-            self.on_kill(msg)
-        elif isinstance(msg, Ping):
-            self.on_ping(msg)
-        elif isinstance(msg, Pong):
-            self.on_pong(msg)
-        elif isinstance(msg, Error):
-            self.on_error(msg)
-        elif isinstance(msg, Away):
-            self.on_away(msg)
-        elif isinstance(msg, Rehash):
-            self.on_rehash(msg)
-        elif isinstance(msg, Die):
-            self.on_die(msg)
-        elif isinstance(msg, Restart):
-            self.on_restart(msg)
-        elif isinstance(msg, Summon):
-            self.on_summon(msg)
-        elif isinstance(msg, Users):
-            self.on_users(msg)
-        elif isinstance(msg, WallOps):
-            self.on_wall_ops(msg)
-        elif isinstance(msg, UserHost):
-            self.on_user_host(msg)
-        elif isinstance(msg, IsOn):
-            self.on_is_on(msg)
-        elif isinstance(msg, Welcome):
-            self.on_welcome(msg)
-        elif isinstance(msg, YourHost):
-            self.on_your_host(msg)
-        elif isinstance(msg, Created):
-            self.on_created(msg)
-        elif isinstance(msg, MyInfo):
-            self.on_my_info(msg)
-        elif isinstance(msg, Bounce):
-            self.on_bounce(msg)
-        elif isinstance(msg, TraceLinkReply):
-            self.on_trace_link_reply(msg)
-        elif isinstance(msg, TraceConnecting):
-            self.on_trace_connecting(msg)
-        elif isinstance(msg, TraceHandshake):
-            self.on_trace_handshake(msg)
-        elif isinstance(msg, TraceUnknown):
-            self.on_trace_unknown(msg)
-        elif isinstance(msg, TraceOperator):
-            self.on_trace_operator(msg)
-        elif isinstance(msg, TraceUser):
-            self.on_trace_user(msg)
-        elif isinstance(msg, TraceServer):
-            self.on_trace_server(msg)
-        elif isinstance(msg, TraceService):
-            self.on_trace_service(msg)
-        elif isinstance(msg, TraceNewtype):
-            self.on_trace_newtype(msg)
-        elif isinstance(msg, TraceClass):
-            self.on_trace_class(msg)
-        elif isinstance(msg, StatsLinkInfo):
-            self.on_stats_link_info(msg)
-        elif isinstance(msg, StatsCommands):
-            self.on_stats_commands(msg)
-        elif isinstance(msg, StatsEnd):
-            self.on_stats_end(msg)
-        elif isinstance(msg, UserModeIs):
-            self.on_user_mode_is(msg)
-        elif isinstance(msg, ServListReply):
-            self.on_serv_list_reply(msg)
-        elif isinstance(msg, ServListEnd):
-            self.on_serv_list_end(msg)
-        elif isinstance(msg, StatsUptime):
-            self.on_stats_uptime(msg)
-        elif isinstance(msg, StatsOline):
-            self.on_stats_oline(msg)
-        elif isinstance(msg, LuserClient):
-            self.on_luser_client(msg)
-        elif isinstance(msg, LuserOp):
-            self.on_luser_op(msg)
-        elif isinstance(msg, LuserUnknown):
-            self.on_luser_unknown(msg)
-        elif isinstance(msg, LuserChannels):
-            self.on_luser_channels(msg)
-        elif isinstance(msg, LuserMe):
-            self.on_luser_me(msg)
-        elif isinstance(msg, AdminMe):
-            self.on_admin_me(msg)
-        elif isinstance(msg, AdminLoc1):
-            self.on_admin_loc1(msg)
-        elif isinstance(msg, AdminLoc2):
-            self.on_admin_loc2(msg)
-        elif isinstance(msg, AdminEmail):
-            self.on_admin_email(msg)
-        elif isinstance(msg, TraceLog):
-            self.on_trace_log(msg)
-        elif isinstance(msg, TraceEnd):
-            self.on_trace_end(msg)
-        elif isinstance(msg, TryAgain):
-            self.on_try_again(msg)
-        elif isinstance(msg, AwayReply):
-            self.on_away_reply(msg)
-        elif isinstance(msg, UserHostReply):
-            self.on_user_host_reply(msg)
-        elif isinstance(msg, IsOnReply):
-            self.on_is_on_reply(msg)
-        elif isinstance(msg, UnawayReply):
-            self.on_unaway_reply(msg)
-        elif isinstance(msg, NowAwayReply):
-            self.on_now_away_reply(msg)
-        elif isinstance(msg, WhoIsUser):
-            self.on_who_is_user(msg)
-        elif isinstance(msg, WhoIsServer):
-            self.on_who_is_server(msg)
-        elif isinstance(msg, WhoIsOperator):
-            self.on_who_is_operator(msg)
-        elif isinstance(msg, WhoWasUser):
-            self.on_who_was_user(msg)
-        elif isinstance(msg, WhoEnd):
-            self.on_who_end(msg)
-        elif isinstance(msg, WhoIsIdle):
-            self.on_who_is_idle(msg)
-        elif isinstance(msg, WhoIsEnd):
-            self.on_who_is_end(msg)
-        elif isinstance(msg, WhoIsChannels):
-            self.on_who_is_channels(msg)
-        elif isinstance(msg, ListReply):
-            self.on_list_reply(msg)
-        elif isinstance(msg, ListEnd):
-            self.on_list_end(msg)
-        elif isinstance(msg, ChannelModeIs):
-            self.on_channel_mode_is(msg)
-        elif isinstance(msg, UniqOpIs):
-            self.on_uniq_op_is(msg)
-        elif isinstance(msg, NoTopicReply):
-            self.on_no_topic_reply(msg)
-        elif isinstance(msg, TopicReply):
-            self.on_topic_reply(msg)
-        elif isinstance(msg, Inviting):
-            self.on_inviting(msg)
-        elif isinstance(msg, Summoning):
-            self.on_summoning(msg)
-        elif isinstance(msg, InviteList):
-            self.on_invite_list(msg)
-        elif isinstance(msg, InviteListEnd):
-            self.on_invite_list_end(msg)
-        elif isinstance(msg, ExceptList):
-            self.on_except_list(msg)
-        elif isinstance(msg, ExceptListEnd):
-            self.on_except_list_end(msg)
-        elif isinstance(msg, VersionReply):
-            self.on_version_reply(msg)
-        elif isinstance(msg, WhoReply):
-            self.on_who_reply(msg)
-        elif isinstance(msg, NamesReply):
-            self.on_names_reply(msg)
-        elif isinstance(msg, LinksReply):
-            self.on_links_reply(msg)
-        elif isinstance(msg, LinksEnd):
-            self.on_links_end(msg)
-        elif isinstance(msg, NamesEnd):
-            self.on_names_end(msg)
-        elif isinstance(msg, BanList):
-            self.on_ban_list(msg)
-        elif isinstance(msg, BanListEnd):
-            self.on_ban_list_end(msg)
-        elif isinstance(msg, WhoWasEnd):
-            self.on_who_was_end(msg)
-        elif isinstance(msg, InfoReply):
-            self.on_info_reply(msg)
-        elif isinstance(msg, MotdText):
-            self.on_motd_text(msg)
-        elif isinstance(msg, InfoEnd):
-            self.on_info_end(msg)
-        elif isinstance(msg, MotdStart):
-            self.on_motd_start(msg)
-        elif isinstance(msg, MotdEnd):
-            self.on_motd_end(msg)
-        elif isinstance(msg, YoureOper):
-            self.on_youre_oper(msg)
-        elif isinstance(msg, Rehashing):
-            self.on_rehashing(msg)
-        elif isinstance(msg, YoureService):
-            self.on_youre_service(msg)
-        elif isinstance(msg, TimeReply):
-            self.on_time_reply(msg)
-        elif isinstance(msg, UsersStart):
-            self.on_users_start(msg)
-        elif isinstance(msg, UsersReply):
-            self.on_users_reply(msg)
-        elif isinstance(msg, UsersEnd):
-            self.on_users_end(msg)
-        elif isinstance(msg, NoUsers):
-            self.on_no_users(msg)
-        elif isinstance(msg, NoSuchNick):
-            self.on_no_such_nick(msg)
-        elif isinstance(msg, NoSuchServer):
-            self.on_no_such_server(msg)
-        elif isinstance(msg, NoSuchChannel):
-            self.on_no_such_channel(msg)
-        elif isinstance(msg, CantSendToChan):
-            self.on_cant_send_to_chan(msg)
-        elif isinstance(msg, TooManyChannels):
-            self.on_too_many_channels(msg)
-        elif isinstance(msg, WasNoSuchNick):
-            self.on_was_no_such_nick(msg)
-        elif isinstance(msg, TooManyTargets):
-            self.on_too_many_targets(msg)
-        elif isinstance(msg, NoSuchService):
-            self.on_no_such_service(msg)
-        elif isinstance(msg, NoOrigin):
-            self.on_no_origin(msg)
-        elif isinstance(msg, NoRecipient):
-            self.on_no_recipient(msg)
-        elif isinstance(msg, NoTextToSend):
-            self.on_no_text_to_send(msg)
-        elif isinstance(msg, NoTopLevel):
-            self.on_no_top_level(msg)
-        elif isinstance(msg, WildTopLevel):
-            self.on_wild_top_level(msg)
-        elif isinstance(msg, BadMask):
-            self.on_bad_mask(msg)
-        elif isinstance(msg, UnknownCommand):
-            self.on_unknown_command(msg)
-        elif isinstance(msg, NoMotd):
-            self.on_no_motd(msg)
-        elif isinstance(msg, NoAdminInfo):
-            self.on_no_admin_info(msg)
-        elif isinstance(msg, FileError):
-            self.on_file_error(msg)
-        elif isinstance(msg, NoNicknameGiven):
-            self.on_no_nickname_given(msg)
-        elif isinstance(msg, ErroneusNickname):
-            self.on_erroneus_nickname(msg)
-        elif isinstance(msg, NicknameInUse):
-            self.on_nickname_in_use(msg)
-        elif isinstance(msg, NickCollision):
-            self.on_nick_collision(msg)
-        elif isinstance(msg, UnavailResource):
-            self.on_unavail_resource(msg)
-        elif isinstance(msg, UserNotInChannel):
-            self.on_user_not_in_channel(msg)
-        elif isinstance(msg, NotOnChannel):
-            self.on_not_on_channel(msg)
-        elif isinstance(msg, UserOnChannel):
-            self.on_user_on_channel(msg)
-        elif isinstance(msg, NoLogin):
-            self.on_no_login(msg)
-        elif isinstance(msg, SummonDisabled):
-            self.on_summon_disabled(msg)
-        elif isinstance(msg, UsersDisabled):
-            self.on_users_disabled(msg)
-        elif isinstance(msg, NotRegistered):
-            self.on_not_registered(msg)
-        elif isinstance(msg, NeedMoreParams):
-            self.on_need_more_params(msg)
-        elif isinstance(msg, AlreadyRegistered):
-            self.on_already_registered(msg)
-        elif isinstance(msg, NoPermForHost):
-            self.on_no_perm_for_host(msg)
-        elif isinstance(msg, PasswordMismatch):
-            self.on_password_mismatch(msg)
-        elif isinstance(msg, YoureBannedCreep):
-            self.on_youre_banned_creep(msg)
-        elif isinstance(msg, YouWillBeBanned):
-            self.on_you_will_be_banned(msg)
-        elif isinstance(msg, KeySet):
-            self.on_key_set(msg)
-        elif isinstance(msg, ChannelIsFull):
-            self.on_channel_is_full(msg)
-        elif isinstance(msg, UnknownMode):
-            self.on_unknown_mode(msg)
-        elif isinstance(msg, InviteOnlyChan):
-            self.on_invite_only_chan(msg)
-        elif isinstance(msg, BannedFromChan):
-            self.on_banned_from_chan(msg)
-        elif isinstance(msg, BadChannelKey):
-            self.on_bad_channel_key(msg)
-        elif isinstance(msg, BadChanMask):
-            self.on_bad_chan_mask(msg)
-        elif isinstance(msg, NoChanModes):
-            self.on_no_chan_modes(msg)
-        elif isinstance(msg, BanListFull):
-            self.on_ban_list_full(msg)
-        elif isinstance(msg, NoPrivileges):
-            self.on_no_privileges(msg)
-        elif isinstance(msg, ChanOpPrivsNeeded):
-            self.on_chan_op_privs_needed(msg)
-        elif isinstance(msg, CantKillServer):
-            self.on_cant_kill_server(msg)
-        elif isinstance(msg, Restricted):
-            self.on_restricted(msg)
-        elif isinstance(msg, UniqOpPrivsNeeded):
-            self.on_uniq_op_privs_needed(msg)
-        elif isinstance(msg, NoOperHost):
-            self.on_no_oper_host(msg)
-        elif isinstance(msg, UserModeUnknownFlag):
-            self.on_user_mode_unknown_flag(msg)
-        elif isinstance(msg, UsersDontMatch):
-            self.on_users_dont_match(msg)
+        try:
+            name = self._handler_names[msg.__class__]
+        except KeyError:
+            name = self._resolve_handler(msg.__class__)
+        if name is not None:
+            getattr(self, name)(msg)
+
+    # like on_message(Message.from_line(line)), but lines for verbs this
+    # handler ignores are dropped without being decoded
+    def handle_line(self, line: Line, decode: typing.Callable[[bytes], str] = decode_utf8) -> None:
+        verbs = self._handled_verbs
+        if verbs is None or line.command in verbs:
+            self.on_message(Message.from_line(line, decode))
 
 
@@ -1,3 +1,5 @@
+import inspect
+import typing
 import unittest
 from ..irc import line
 from .. import irc
@@ -11,6 +13,25 @@ def tiso(key, a, b):
         self.assertEqual(a, x)
     return tester
 
+# check that decode agrees with reference.backward on each raw line (by
+# default, the whole corpus), raising ValueError for exactly the same lines;
+# returns the lines that decoded
+def check_decode(test, decode, reference=line.full_stack, raws=None):
+    decoded = []
+    for raw in corpus if raws is None else raws:
+        with test.subTest(raw=raw):
+            try:
+                expected = reference.backward(raw)
+            except ValueError:
+                with test.assertRaises(ValueError):
+                    decode(raw)
+            else:
+                got = decode(raw)
+                test.assertEqual(got, expected)
+                test.assertEqual(expected, got)
+                decoded.append(expected)
+    return decoded
+
 class TestIRCLine(unittest.TestCase):
     def setUp(self):
         self.li = line.Liner()
@@ -32,12 +53,18 @@ class TestIRCLine(unittest.TestCase):
     test_ll_many  = tiso('ll', b'a\020b\n\r', b'a\020\020b\020n\020r')
     def test_ll_unknown(self):
         self.assertEqual(self.ll.backward(b'\020a'), b'a')
+    def test_ll_untouched(self):
+        plain = b'plain \t\010'
+        self.assertIs(self.ll.forward(plain), plain)
+        self.assertIs(self.ll.backward(plain), plain)
 
 
     test_tag_plain = tiso('tag', [b'plain'], b'plain')
     test_tag_compound = tiso('tag', [b'one', b'two', b'three'], b'one\001two\001\001three\001')
     def test_tag_mixed(self):
         self.assertEqual(self.tag.backward(b'on\001two\001e'), [b'one', b'two'])
+    def test_tag_unpaired(self):
+        self.assertEqual(self.tag.backward(b'a\001b\001c\001d'), [b'ac\001d', b'b'])
     def test_tag_invalid(self):
         with self.assertRaises(ValueError):
             self.tag.forward([b'one', b'tw\001o'])
@@ -45,6 +72,14 @@ class TestIRCLine(unittest.TestCase):
     test_ctcp_plain = tiso('ctcp', b'plain', b'plain')
     test_ctcp_quote = tiso('ctcp', b'plain\\', b'plain\\\\')
     test_ctcp_mani  = tiso('ctcp', b'a\001b\\', b'a\\ab\\\\')
+    def test_quoter_custom(self):
+        q = line.Quoter(b'%', {b's': b' ', b't': b'\t', b'p': b'+'})
+        self.assertEqual(q.forward(b'a b\t%+'), b'a%sb%t%%%p')
+        self.assertEqual(q.backward(b'a%sb%t%%%p%x%'), b'a b\t%+x%')
+    def test_ctcp_lift_untouched(self):
+        tags = [b'plain', b'tags']
+        self.assertIs(line._map_list(self.ctcp.backward, tags), tags)
+        self.assertEqual(line._map_list(self.ctcp.backward, [b'a', b'\\a']), [b'a', b'\001'])
 
     test_prot_noarg_nosrc = tiso('prot', irc.Line(None, b'PING', [], []), [b'PING'])
     test_prot_arg_nosrc = tiso('prot', irc.Line(None, b'PING', [b'arg1', b'arg2'], []), [b'PING arg1 arg2'])
@@ -74,3 +109,583 @@ class TestIRCLine(unittest.TestCase):
     test_all_2 = tiso('all', irc.Line(b'actor', b'PRIVMSG', [b'victim', b''], [b'SED \n\t\big\020\001\000\\:']), b':actor PRIVMSG victim :\001SED \020n\t\big\020\020\\a\0200\\\\:\001\r\n')
     test_all_3a = tiso('all', irc.Line(b'actor', b'PRIVMSG', [b'victim', b'Say hi to Ron\n\t/actor'], [b'USERINFO']), b':actor PRIVMSG victim :Say hi to Ron\020n\t/actor\001USERINFO\001\r\n')
     test_all_3b = tiso('all', irc.Line(b'victim', b'NOTICE', [b'actor', b''], [b'USERINFO :CS student\n\001test\001']), b':victim NOTICE actor :\001USERINFO :CS student\020n\\atest\\a\001\r\n')
+
+corpus = [
+    b'PING\r\n',
+    b'ping :server\r\n',
+    b':nick!user@host PRIVMSG #chan :hello world\r\n',
+    b'  :src\tPING\t  \t:arg  \r\n',
+    b':src  PING  a\tb :c :d\r\n',
+    b'PRIVMSG a\t:b :c\r\n',
+    b'001 me :Welcome\r\n',
+    b'+5 x\r\n',
+    b':\r\n',
+    b':src\r\n',
+    b': \r\n',
+    b'   \r\n',
+    b'\r\n',
+    b'PING x \r\n',
+    b'PING :\r\n',
+    b'PING\n',
+    b'PING',
+    b'a\020b\020\020c\0200\020n\020r\020\r\n',
+    b'PRIVMSG x :\001ACTION waves\001\r\n',
+    b'PRIVMSG x :on\001two\001e\001three\r\n',
+    b'PRIVMSG x :\001\001\001\r\n',
+    b'PRIVMSG x :a\\\\b\\a\\\001c\\\\a\\\001\\\r\n',
+    b'PRIVMSG x \\ :\020\001\r\n',
+    b'\020nPING\020n:arg\r\n',
+    b'\xff\xfe :\xfd\r\n',
+]
+
+class TestFused(unittest.TestCase):
+    def test_matches_full_stack(self):
+        check_decode(self, line.fused_stack.backward)
+
+    def test_from_raw(self):
+        self.assertEqual(irc.Line.from_raw(b':actor PRIVMSG victim :\001SED \020n\t\big\020\020\\a\0200\\\\:\001\r\n'), irc.Line(b'actor', b'PRIVMSG', [b'victim', b''], [b'SED \n\t\big\020\001\000\\:']))
+
+    def test_forward_matches_full_stack(self):
+        lines = []
+        for raw in corpus:
+            try:
+                lines.append(line.full_stack.backward(raw))
+            except ValueError:
+                pass
+        lines += [
+            irc.Line(None, 56, [b'a', b'b c'], []),
+            irc.Line(b'', b'ping', [b'a\tb'], [b'x']),
+            irc.Line(b's\020rc', b'PRIVMSG', [b'\\\001', b''], [b'\001', b'\\', b'']),
+            irc.Line(None, b'PRIVMSG', [b'x', b'\r\n\0'], []),
+            irc.Line(None, b'PING', [], [b'a\nb']),
+            irc.Line(None, b'PING', [b'a b', b'c'], []),
+            irc.Line(None, b'PING', [b'', b'c'], []),
+        ]
+        for l in lines:
+            with self.subTest(line=l):
+                try:
+                    expected = line.full_stack.forward(l)
+                except ValueError:
+                    with self.assertRaises(ValueError):
+                        line.fused_stack.forward(l)
+                else:
+                    self.assertEqual(line.fused_stack.forward(l), expected)
+
+class TestLineReader(unittest.TestCase):
+    def test_chunks(self):
+        reader = line.LineReader()
+        data = b':a PRIVMSG b :hi\r\nPING :x\r\n\r\nPONG y\n'
+        got = []
+        for i in range(0, len(data), 3):
+            got += reader.feed(data[i:i + 3])
+        self.assertEqual(got, [irc.Line(b'a', b'PRIVMSG', [b'b', b'hi'], []), irc.Line(None, b'PING', [b'x'], []), irc.Line(None, b'PONG', [b'y'], [])])
+
+    def test_recv_into(self):
+        reader = line.LineReader(max_length=16, bufsize=16)
+        got = []
+        for chunk in [b'PING 1\r\nPI', b'NG 2\r\nPING 3', b'\r\n']:
+            buf = reader.get_buffer()
+            buf[:len(chunk)] = chunk
+            reader.buffer_updated(len(chunk))
+            got += [l.arguments[0] for l in reader]
+        self.assertEqual(got, [b'1', b'2', b'3'])
+
+    def test_too_long(self):
+        reader = line.LineReader(max_length=8, bufsize=8)
+        self.assertEqual(list(reader.feed(b'PING 123456789')), [])
+        self.assertEqual(list(reader.feed(b'0\r\nPING 1\r\n')), [irc.Line(None, b'PING', [b'1'], [])])
+        self.assertEqual(list(reader.feed(b'PING 1234\r\n')), [])
+        self.assertEqual(reader.errors, {line.LINE_TOO_LONG: 2})
+
+    def test_iter_raises(self):
+        reader = line.LineReader(max_length=8, bufsize=8)
+        buf = reader.get_buffer()
+        buf[:8] = b':bad\r\nPI'
+        reader.buffer_updated(8)
+        with self.assertRaises(ValueError):
+            next(reader)
+        self.assertEqual(list(reader), [])
+
+    def test_strict(self):
+        reader = line.LineReader(require_crlf=True)
+        self.assertEqual(list(reader.feed(b'PING\nPING\r\n')), [irc.Line(None, b'PING', [], [])])
+        self.assertEqual(reader.errors, {line.MISSING_CRLF: 1})
+
+    def test_profile(self):
+        reader = line.LineReader('raw')
+        self.assertEqual(list(reader.feed(b'PRIVMSG a :\020n\r\n')), [irc.Line(None, b'PRIVMSG', [b'a', b'\020n'], [])])
+
+    def test_bad_lines_in_large_chunk(self):
+        reader = line.LineReader(max_length=16, bufsize=16)
+        got = reader.feed(b':bad\r\nPING 1\r\nPING 123456789abc\r\nPING 2\r\nPING 3\r\nPING 4\r\n')
+        self.assertEqual([l.arguments[0] for l in got], [b'1', b'2', b'3', b'4'])
+        self.assertEqual(reader.errors, {line.EMPTY_COMMAND: 1, line.LINE_TOO_LONG: 1})
+        self.assertEqual([l.arguments[0] for l in reader.feed(b'PING 5\r\n')], [b'5'])
+
+    def test_feed_is_eager(self):
+        reader = line.LineReader()
+        reader.feed(b'PING a\r\nPI')
+        self.assertEqual(reader.feed(b'NG b\r\n'), [irc.Line(None, b'PING', [b'b'], [])])
+
+class TestFromRawMany(unittest.TestCase):
+    def test_many(self):
+        lines, offset = irc.Line.from_raw_many(b'PING a\r\n:s PONG :b c\r\nPIN')
+        self.assertEqual(lines, [irc.Line(None, b'PING', [b'a'], []), irc.Line(b's', b'PONG', [b'b c'], [])])
+        self.assertEqual(offset, 22)
+
+    def test_complete(self):
+        data = b''.join(corpus[:8] + corpus[17:])
+        lines, offset = irc.Line.from_raw_many(data)
+        self.assertEqual(offset, len(data))
+        self.assertEqual(lines, [line.full_stack.backward(raw + b'\r\n') for raw in data.split(b'\r\n')[:-1]])
+
+    def test_invalid(self):
+        with self.assertRaisesRegex(ValueError, 'offset 6'):
+            irc.Line.from_raw_many(b'PING\r\n\r\n')
+
+    def test_errors(self):
+        errors = []
+        lines, offset = irc.Line.from_raw_many(b'PING a\r\n:src\r\nPING b\r\n  \r\nPI', errors=errors)
+        self.assertEqual([l.arguments[0] for l in lines], [b'a', b'b'])
+        self.assertEqual(errors, [8, 22])
+        self.assertEqual(offset, 26)
+
+@unittest.skipUnless(line._numpy() is not None, 'numpy not installed')
+class TestFromRawManyNumpy(unittest.TestCase):
+    def test_matches_split(self):
+        data = b''.join(corpus[:8] + corpus[17:]) * 300 + b':s PRIV'
+        self.assertGreaterEqual(len(data), line.Fused.numpy_threshold)
+        for name, stack in line.profiles.items():
+            with self.subTest(profile=name):
+                stack.numpy_threshold = len(data) + 1
+                try:
+                    expected = stack.backward_many(data)
+                finally:
+                    del stack.numpy_threshold
+                self.assertEqual(stack.backward_many(data), expected)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            line.fused_stack.backward_many_numpy(b'PING a\r\n\r\n')
+        errors = []
+        lines, offset = line.fused_stack.backward_many_numpy(b'PING a\r\n:src\r\nPING \001b\001\r\n\r\nPI', errors)
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(errors, [8, 24])
+        self.assertEqual(offset, 26)
+
+class TestLineView(unittest.TestCase):
+    def test_matches_full_stack(self):
+        check_decode(self, irc.Line.from_buffer)
+
+    def test_lazy(self):
+        buf = bytearray(b'xx:nick!u@h PRIVMSG #chan :hi there\r\nyy')
+        l = irc.Line.from_buffer(buf, 2, len(buf) - 2)
+        self.assertIsInstance(l, line.LineView)
+        self.assertEqual(l.source, b'nick!u@h')
+        self.assertEqual(l.command, b'PRIVMSG')
+        self.assertEqual(l.arguments, [b'#chan', b'hi there'])
+        self.assertEqual(irc.Message.from_line(l).message, 'hi there')
+
+    def test_escaped(self):
+        l = irc.Line.from_buffer(b'PRIVMSG x :\001VERSION\001\r\n')
+        self.assertNotIsInstance(l, line.LineView)
+        self.assertEqual(l.ctcp, [b'VERSION'])
+
+class TestLazyLine(unittest.TestCase):
+    def test_matches_full_stack(self):
+        def decode(raw):
+            l = irc.Line.from_raw(raw, lazy=True)
+            self.assertIsInstance(l, line.LazyLine)
+            return l
+        check_decode(self, decode)
+
+    def test_deferred(self):
+        l = irc.Line.from_raw(b':a!b@c JOIN #chan\r\n', lazy=True)
+        self.assertEqual((l.source, l.command), (b'a!b@c', b'JOIN'))
+        self.assertIsNone(l._arguments)
+        self.assertEqual(l.arguments, [b'#chan'])
+
+class TestCompiled(unittest.TestCase):
+    def test_flatten(self):
+        self.assertEqual([type(s) for s in line.full_stack.flatten()], [line.Protocol, line.Lift, line.Tagger, line.Quoter, line.Liner])
+        compiled = line.full_stack.compile()
+        self.assertEqual(len(compiled.compose(line.Liner()).compile().flatten()), 6)
+
+    def test_matches_full_stack(self):
+        compiled = line.full_stack.compile()
+        for l in check_decode(self, compiled.backward):
+            self.assertEqual(compiled.forward(l), line.full_stack.forward(l))
+
+class TestProfiles(unittest.TestCase):
+    def test_matches_reference(self):
+        for name, reference in [('rfc1459-ctcp', line.full_stack), ('modern', line.modern_stack), ('raw', line.raw_stack)]:
+            with self.subTest(profile=name):
+                check_decode(self, lambda raw: irc.Line.from_raw(raw, lazy=True, profile=name), reference)
+                check_decode(self, lambda raw: irc.Line.from_buffer(raw, profile=name), reference)
+                for expected in check_decode(self, lambda raw: irc.Line.from_raw(raw, profile=name), reference):
+                    try:
+                        encoded = reference.forward(expected)
+                    except ValueError:
+                        with self.assertRaises(ValueError):
+                            expected.to_raw(profile=name)
+                    else:
+                        self.assertEqual(expected.to_raw(profile=name), encoded)
+
+    def test_tagger_without_ctcp(self):
+        stack = line.Fused(line.low_level, line.Tagger(), None)
+        reference = line.Protocol().compose(line.Tagger()).compose(line.low_level).compose(line.Liner())
+        for l in [irc.Line(None, b'PRIVMSG', [b'x', b'a\001b\001c'], []), irc.Line(None, b'PRIVMSG', [b'x', b'a\001b'], [b'c'])]:
+            with self.subTest(line=l):
+                with self.assertRaises(ValueError):
+                    reference.forward(l)
+                with self.assertRaises(ValueError):
+                    stack.forward(l)
+        l = irc.Line(None, b'PRIVMSG', [b'x', b'a\nb'], [b'c'])
+        self.assertEqual(stack.forward(l), reference.forward(l))
+        with self.assertRaises(ValueError):
+            stack.quote(b'a\001b')
+
+    def test_modern(self):
+        l = irc.Line(None, b'PRIVMSG', [b'x', b'a \020b'], [b'ACTION'])
+        self.assertEqual(l.to_raw('modern'), b'PRIVMSG x :a \020b\001ACTION\001\r\n')
+        self.assertEqual(irc.Line.from_raw(b'PRIVMSG x :a\020n\r\n', profile='modern').arguments, [b'x', b'a\020n'])
+
+    def test_raw(self):
+        self.assertEqual(irc.Line.from_raw(b'PRIVMSG x :\001ACTION\\a\001\r\n', profile='raw').arguments, [b'x', b'\001ACTION\\a\001'])
+        with self.assertRaises(ValueError):
+            irc.Line(None, b'PRIVMSG', [b'x', b''], [b'ACTION']).to_raw('raw')
+
+class TestParseCache(unittest.TestCase):
+    def test_cache(self):
+        cache = line.ParseCache(maxsize=2)
+        raw = b':a!b@c QUIT :*.net *.split\r\n'
+        first = cache.from_raw(raw)
+        self.assertIs(cache.from_raw(raw), first)
+        self.assertEqual(first, irc.Line(b'a!b@c', b'QUIT', [b'*.net *.split'], []))
+        cache.from_raw(b'PING 1\r\n')
+        cache.from_raw(b'PING 2\r\n')
+        self.assertIsNot(cache.from_raw(raw), first)
+        info = cache.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 4, 2))
+
+    def test_frozen(self):
+        l = irc.Line.from_raw(b'PRIVMSG x :\001ACTION hi\001\r\n').freeze()
+        self.assertEqual(l.arguments, (b'x', b''))
+        with self.assertRaises(AttributeError):
+            l.command = b'NOTICE'
+        self.assertEqual(l, irc.Line(None, b'PRIVMSG', [b'x', b''], [b'ACTION hi']))
+        self.assertEqual(irc.Line(None, b'PRIVMSG', [b'x', b''], [b'ACTION hi']), l)
+        self.assertEqual(line.full_stack.forward(l), l.to_raw())
+
+    def test_frozen_hash(self):
+        a = irc.Line(b'src', b'PRIVMSG', [b'#c', b'hi there']).freeze()
+        b = irc.Line.from_raw(b':src PRIVMSG #c :hi there\r\n').freeze()
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(len({a: 1, b: 2}), 1)
+        raw = a.to_raw()
+        self.assertEqual(raw, b':src PRIVMSG #c :hi there\r\n')
+        self.assertIs(a.to_raw(), raw)
+        self.assertEqual(a.to_raw('raw'), raw)
+
+class TestTemplate(unittest.TestCase):
+    def test_line_template(self):
+        t = line.LineTemplate(irc.Line(b'me', b'NOTICE', [b'x', b'hello there'], [b'PING 1']), 0)
+        self.assertEqual(t.render(b'nick'), b':me NOTICE nick :hello there\001PING 1\001\r\n')
+        self.assertEqual(t.render(b'a\nb'), b':me NOTICE a\020nb :hello there\001PING 1\001\r\n')
+        with self.assertRaises(ValueError):
+            t.render(b'two words')
+        t = line.LineTemplate(irc.Line(None, b'PRIVMSG', [b'#c', b'placeholder']), -1)
+        for body in [b'', b'one', b'two words', b'\\']:
+            self.assertEqual(t.render(body), irc.Line(None, b'PRIVMSG', [b'#c', body]).to_raw())
+
+    def test_message_template(self):
+        msg = irc.msg.Privmsg(None, 'placeholder', 'announcement: café \\ open')
+        t = msg.template('target')
+        for target in ['alice', '#chan', 'böb']:
+            msg.target = target
+            self.assertEqual(t.render(target), msg.to_raw())
+        with self.assertRaises(ValueError):
+            irc.msg.ChannelJoin(None, ['#a']).template('channels')
+
+class TestLineTable(unittest.TestCase):
+    def test_table(self):
+        table = line.LineTable()
+        lines = [irc.Line(b'a!b@c', b'PRIVMSG', [b'#c', b'hi there'], []), irc.Line(None, 1, [b'me', b'Welcome'], []), irc.Line(None, b'PRIVMSG', [b'x', b''], [b'ACTION \001'])]
+        for l in lines:
+            table.append(l)
+        table.append_raw(b'PING :x\r\n')
+        lines.append(irc.Line(None, b'PING', [b'x'], []))
+        self.assertEqual(len(table), 4)
+        self.assertEqual(list(table), lines)
+        self.assertEqual(table[-1], lines[-1])
+        self.assertEqual(table[1], lines[1])
+        self.assertEqual(table.raw(0), b':a!b@c PRIVMSG #c :hi there')
+        with self.assertRaises(IndexError):
+            table[4]
+        with self.assertRaises(ValueError):
+            table.append_raw(b'PING')
+
+class TestCommands(unittest.TestCase):
+    def test_interned(self):
+        verb = next(v for v in irc.msg.from_lines_by_verb if v == b'PRIVMSG')
+        for raw in [b'PRIVMSG x y\r\n', b'privmsg x y\r\n', b'PrivMsg x y\r\n']:
+            self.assertIs(irc.Line.from_raw(raw).command, verb)
+            self.assertIs(line.full_stack.backward(raw).command, verb)
+
+    def test_numerics(self):
+        self.assertEqual(irc.Line.from_raw(b'001 x\r\n').command, 1)
+        self.assertEqual(irc.Line.from_raw(b'+5 x\r\n').command, 5)
+        self.assertEqual(irc.Line.from_raw(b'1234 x\r\n').command, 1234)
+        self.assertEqual(irc.Line.from_raw(b'x1 x\r\n').command, b'X1')
+
+class TestPrefix(unittest.TestCase):
+    def test_split(self):
+        p = line.Prefix(b'nick!user@host.example')
+        self.assertEqual((p.nick, p.user, p.host), (b'nick', b'user', b'host.example'))
+        p = line.Prefix(b'irc.example.net')
+        self.assertEqual((p.nick, p.user, p.host), (b'irc.example.net', None, None))
+        p = line.Prefix(b'nick@host')
+        self.assertEqual((p.nick, p.user, p.host), (b'nick', None, b'host'))
+
+    def test_interned(self):
+        a = irc.Line.from_raw(b':n!u@h PRIVMSG #a :x\r\n').source
+        b = irc.Line.from_raw(b':n!u@h JOIN #b\r\n', lazy=True).source
+        c = irc.Line.from_buffer(b':n!u@h PART #b\r\n').source
+        self.assertIsInstance(a, line.Prefix)
+        self.assertIs(a, b)
+        self.assertIs(a, c)
+        self.assertEqual(a, b'n!u@h')
+        self.assertEqual(a.nick, b'n')
+        self.assertEqual(irc.Message.from_line(irc.Line.from_raw(b':n!u@h JOIN #b\r\n')).source, 'n!u@h')
+
+class TestSafeArg(unittest.TestCase):
+    def test_safe(self):
+        chan = line.SafeArg(b'#chan')
+        self.assertEqual(chan, b'#chan')
+        l = irc.Line(None, b'PRIVMSG', [chan, line.SafeArg(b'hi')], [])
+        self.assertEqual(l.to_raw(), b'PRIVMSG #chan hi\r\n')
+        self.assertEqual(line.full_stack.forward(l), l.to_raw())
+        self.assertEqual(line.LineTemplate(l, 0).render(line.SafeArg(b'#other')), b'PRIVMSG #other hi\r\n')
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            line.SafeArg(b'#a b')
+        with self.assertRaises(ValueError):
+            line.SafeArg(b'')
+
+class TestStrict(unittest.TestCase):
+    def test_matches_full_stack(self):
+        strict = line.profiles['rfc1459-ctcp-strict']
+        self.assertTrue(strict.strict)
+        extra = [b': PING x\r\n', b':src :PING\r\n', b':src PING :\r\n', b'PING a b :c d\r\n', b'PING a\x1cb\r\n', b'PING a\x0bb\r\n', b'PING a\x0cb :c\r\n', b'PING a \r\n', b' PING  a\r\n', b'PING\ta\r\n', b'PING a\020rb\r\n']
+        check_decode(self, strict.backward, raws=corpus + extra)
+        check_decode(self, lambda raw: irc.Line.from_raw(raw, profile='modern-strict'), line.modern_stack, corpus + extra)
+        reader = line.LineReader('raw-strict')
+        self.assertEqual(reader.feed(b'PING a b\r\n'), [irc.Line(None, b'PING', [b'a', b'b'], [])])
+
+class TestLineParser(unittest.TestCase):
+    def test_try_parse(self):
+        parser = line.LineParser()
+        self.assertEqual(parser.try_parse(b'PING x\r\n'), irc.Line(None, b'PING', [b'x'], []))
+        self.assertEqual(parser.try_parse(b'PING x'), line.MISSING_CRLF)
+        self.assertEqual(parser.try_parse(b'  \r\n'), line.EMPTY_COMMAND)
+        self.assertEqual(parser.try_parse(b':src \r\n'), line.EMPTY_COMMAND)
+        self.assertEqual(parser.errors, {line.MISSING_CRLF: 1, line.EMPTY_COMMAND: 2})
+
+    def test_messages(self):
+        parser = irc.msg.MessageParser()
+        self.assertEqual(parser.try_parse(b':a PRIVMSG #c :hi\r\n').message, 'hi')
+        self.assertIsInstance(parser.try_parse(b'FOO\r\n'), irc.msg.Unknown)
+        self.assertEqual(parser.try_parse(b'PRIVMSG #c\r\n'), irc.msg.BAD_ARGUMENT_COUNT)
+        self.assertEqual(parser.try_parse(b'PRIVMSG #c :\xff\r\n'), irc.msg.DECODE_FAILED)
+        self.assertEqual(parser.try_parse(b'USER a b * :c\r\n'), irc.msg.DECODE_FAILED)
+        self.assertEqual(parser.try_parse(b'PING'), line.MISSING_CRLF)
+        self.assertEqual(parser.errors, {irc.msg.BAD_ARGUMENT_COUNT: 1, irc.msg.DECODE_FAILED: 2, line.MISSING_CRLF: 1})
+
+    def test_agrees_with_full_stack(self):
+        parser = line.LineParser()
+        def decode(raw):
+            result = parser.try_parse(raw)
+            if isinstance(result, str):
+                raise ValueError(result)
+            return result
+        check_decode(self, decode)
+
+class TestMessageHandler(unittest.TestCase):
+    def test_dispatch(self):
+        class Handler(irc.msg.MessageHandler):
+            def __init__(self):
+                self.seen = []
+            def on_privmsg(self, privmsg):
+                self.seen.append(privmsg)
+        class Shout(irc.msg.Privmsg):
+            pass
+        h = Handler()
+        msgs = [irc.msg.Privmsg(None, '#c', 'hi'), Shout(None, '#c', 'HI'), irc.msg.Notice(None, '#c', 'x'), irc.msg.Unknown(None, b'FOO', [])]
+        for m in msgs * 2:
+            h.on_message(m)
+        self.assertEqual(h.seen, [msgs[0], msgs[1]] * 2)
+        self.assertIsNone(irc.msg.MessageHandler._handler_names[irc.msg.Unknown])
+
+    def test_dispatch_overrides(self):
+        seen = []
+        class Handler(irc.msg.MessageHandler):
+            @staticmethod
+            def on_privmsg(privmsg):
+                seen.append(privmsg)
+        h = Handler()
+        m = irc.msg.Privmsg(None, '#c', 'hi')
+        h.on_message(m)
+        h.on_notice = seen.append
+        h.on_message(irc.msg.Notice(None, '#c', 'x'))
+        self.assertEqual(seen[0], m)
+        self.assertIsInstance(seen[1], irc.msg.Notice)
+
+    def test_handle_line(self):
+        class Handler(irc.msg.MessageHandler):
+            def __init__(self):
+                self.seen = []
+            def on_privmsg(self, privmsg):
+                self.seen.append(privmsg.message)
+        self.assertEqual(Handler._handled_verbs, {b'PRIVMSG'})
+        h = Handler()
+        h.handle_line(irc.Line.from_raw(b':a PRIVMSG #c :hi\r\n'))
+        # ignored verbs are never decoded, so bad utf-8 is not an error
+        h.handle_line(irc.Line.from_raw(b':\xff NOTICE #c :\xff\r\n'))
+        self.assertEqual(h.seen, ['hi'])
+
+        class Everything(irc.msg.MessageHandler):
+            def on_message(self, msg):
+                self.seen = msg
+        self.assertIsNone(Everything._handled_verbs)
+        h = Everything()
+        h.handle_line(irc.Line.from_raw(b'FOO bar\r\n'))
+        self.assertIsInstance(h.seen, irc.msg.Unknown)
+
+        h = Handler()
+        h.on_connect_count = 0
+        self.assertEqual(h._handled_verbs, {b'PRIVMSG'})
+        h.on_notice = h.seen.append
+        h.handle_line(irc.Line.from_raw(b':a NOTICE #c :hi\r\n'))
+        self.assertIsInstance(h.seen[0], irc.msg.Notice)
+        self.assertEqual(Handler._handled_verbs, {b'PRIVMSG'})
+
+class TestMessageFromLine(unittest.TestCase):
+    def test_mismatch(self):
+        short = irc.Line.from_raw(b':a PRIVMSG #c\r\n')
+        self.assertIsNone(irc.msg.Privmsg._from_line(short))
+        self.assertIsNone(irc.msg.Notice._from_line(irc.Line.from_raw(b':a PRIVMSG #c hi\r\n')))
+        with self.assertRaises(ValueError):
+            irc.msg.Privmsg.from_line(short)
+        self.assertIsInstance(irc.Message.from_line(short), irc.msg.Unknown)
+
+    def test_decode_failure(self):
+        bad = irc.Line.from_raw(b':a PRIVMSG #c :\xff\r\n')
+        with self.assertRaises(UnicodeDecodeError):
+            irc.msg.Privmsg.from_line(bad)
+        self.assertIsInstance(irc.Message.from_line(bad), irc.msg.Unknown)
+        self.assertEqual(irc.Message.from_line(bad, lambda b: b.decode('latin-1')).message, 'ÿ')
+
+class TestLazyMessage(unittest.TestCase):
+    raws = [
+        b':n!u@h PRIVMSG #c :hi there\r\n',
+        b':srv 353 me = #c :a b @c +d\r\n',
+        b':n!u@h JOIN #a,#b\r\n',
+        b':n!u@h QUIT\r\n',
+        b':srv 001 me :Welcome\r\n',
+        b'PING x\r\n',
+    ]
+
+    def test_matches_eager(self):
+        for raw in self.raws:
+            with self.subTest(raw=raw):
+                eager = irc.Message.from_raw(raw)
+                lazy = irc.Message.from_raw(raw, lazy=True)
+                self.assertIsInstance(lazy, type(eager))
+                self.assertEqual(type(lazy).__name__, 'Lazy' + type(eager).__name__)
+                self.assertEqual(repr(lazy), repr(eager))
+                self.assertEqual(lazy.to_raw(), eager.to_raw())
+
+    def test_bad_int(self):
+        raw = b'USER guest notanint * :Real Name\r\n'
+        self.assertIsInstance(irc.Message.from_raw(raw), irc.msg.Unknown)
+        self.assertIsInstance(irc.Message.from_raw(raw, lazy=True), irc.msg.Unknown)
+        self.assertEqual(irc.Message.from_raw(b'USER guest 8 * :Real Name\r\n', lazy=True).mode, 8)
+
+    def test_repr_undecodable(self):
+        msg = irc.Message.from_raw(b':\xff PRIVMSG #c :\xfe\r\n', lazy=True)
+        self.assertEqual(repr(msg), "Privmsg(source=b'\\xff', target='#c', message=b'\\xfe')")
+
+    def test_decode_on_read(self):
+        names = irc.Message.from_raw(b':srv 353 me = #c :a b \xff\r\n', lazy=True)
+        self.assertEqual(names.channel, '#c')
+        with self.assertRaises(UnicodeDecodeError):
+            names.nicknames
+        names.nicknames = ['x']
+        self.assertEqual(names.nicknames, ['x'])
+        self.assertEqual(names.to_raw(), b':srv 353 me = #c x\r\n')
+
+class TestMessageToRaw(unittest.TestCase):
+    samples = {str: ['a', 'two words', '', 'q\n\x01'], int: [7], bool: [True, False], typing.List[str]: [['a', 'b'], []]}
+
+    def check(self, msg, encode=lambda s: s.encode('utf-8')):
+        try:
+            expected = msg.to_line(encode).to_raw()
+        except ValueError:
+            with self.assertRaises(ValueError):
+                msg.to_raw(encode)
+        else:
+            self.assertEqual(msg.to_raw(encode), expected)
+
+    def test_matches_to_line(self):
+        for cls in irc.msg.handler_names_by_class:
+            hints = typing.get_type_hints(cls.__init__)
+            params = list(inspect.signature(cls.__init__).parameters.values())[2:]
+            for n in range(4):
+                kwargs = {}
+                for p in params:
+                    choices = self.samples[hints[p.name]]
+                    if p.default is None and n == 3:
+                        kwargs[p.name] = None
+                    else:
+                        kwargs[p.name] = choices[n % len(choices)]
+                for source in [None, 'nick!user@host', '']:
+                    msg = cls(source, **kwargs)
+                    with self.subTest(msg=msg):
+                        self.check(msg)
+
+    def test_encode(self):
+        msg = irc.msg.Privmsg('me', '#c', 'café')
+        self.check(msg, lambda s: s.encode('latin-1'))
+        self.assertEqual(msg.to_raw(lambda s: s.encode('latin-1')), b':me PRIVMSG #c caf\xe9\r\n')
+        self.assertEqual(irc.msg.Unknown(None, b'FOO', [b'x']).to_raw(), b'FOO x\r\n')
+
+class TestSource(unittest.TestCase):
+    def test_split(self):
+        for lazy in [False, True]:
+            with self.subTest(lazy=lazy):
+                a = irc.Message.from_raw(b':nick!user@host PRIVMSG #c :hi\r\n', lazy=lazy)
+                b = irc.Message.from_raw(b':nick!user@host NOTICE #c :hi\r\n', lazy=lazy)
+                self.assertIsInstance(a.source, irc.msg.Source)
+                self.assertEqual(a.source, 'nick!user@host')
+                self.assertEqual((a.source.nick, a.source.user, a.source.host), ('nick', 'user', 'host'))
+                self.assertEqual(repr(a.source), "'nick!user@host'")
+        source = irc.msg.Source('srv.example')
+        self.assertEqual((source.nick, source.user, source.host), ('srv.example', None, None))
+
+    def test_interned(self):
+        decode = lambda b: b.decode('utf-8')
+        a = irc.Message.from_raw(b':n!u@h PRIVMSG #c :hi\r\n', decode)
+        b = irc.Message.from_raw(b':n!u@h PRIVMSG #c :ho\r\n', decode)
+        self.assertIs(a.source, b.source)
+        self.assertIsInstance(irc.Message.from_raw(b':n!u@h FOO\r\n').source, irc.msg.Source)
+        self.assertIs(irc.Message.from_raw(b':n!u@h PRIVMSG #c :hi\r\n').source, irc.msg.MessageParser().try_parse(b':n!u@h NOTICE #c :hi\r\n').source)
+
+    def test_unhashable_decode(self):
+        class Decode:
+            __hash__ = None
+            def __call__(self, b):
+                return b.decode('latin-1')
+        msg = irc.Message.from_raw(b':n\xe9!u@h PRIVMSG #c :hi\r\n', Decode())
+        self.assertIsInstance(msg, irc.msg.Privmsg)
+        self.assertEqual(msg.source.nick, 'n\xe9')